@@ -46,14 +46,13 @@ from ._compat import (
     JSONDecodeError,
     Socket,
     logger,
-    OrderedDict,
 )
 
 from .breakpoint import (
-    Breakpoint,
+    Breakpoints,
     LineBreakpoint,
-    ConditionalBreakpoint,
-    FunctionBreakpoint,
+    from_server,
+    make_breakpoint,
 )
 
 from collections import defaultdict
@@ -64,13 +63,22 @@ from .utils import (
     executable_line,
     get_args,
     get_source_from_byte_code,
-    cut_if_too_long,
-    IterableEllipsis,
+    peek_attribute,
+    is_simple,
+    LAZY,
 )
 from .state import Running, Step, Next, Until, Return
+from .monitoring import get_monitor
+from .allocations import Snapshots
+from .circuit import backoff, get_circuit
+from .handles import Handles
+from .render import Renderer
+from .summaries import get_renderer, summarize
+from .timebox import EvaluationTimeout, Retry, time_box
+from .sources import compile_cache
+from .multiplex import find_multiplexer, get_multiplexer
 from contextlib import contextmanager
 from uuid import uuid4
-from threading import Thread
 import dis
 import os
 import logging
@@ -81,11 +89,6 @@ import webbrowser
 import atexit
 import time
 
-try:
-    import importmagic
-except ImportError:
-    importmagic = None
-
 # Get wdb server host
 SOCKET_SERVER = os.getenv('WDB_SOCKET_SERVER', 'localhost')
 # and port
@@ -97,6 +100,12 @@ WEB_SERVER = os.getenv('WDB_WEB_SERVER')
 WEB_PORT = int(os.getenv('WDB_WEB_PORT', 0))
 
 WDB_NO_BROWSER_AUTO_OPEN = bool(os.getenv('WDB_NO_BROWSER_AUTO_OPEN', False))
+# Maximum number of code objects remembered by the call event cache
+TRACE_CACHE_SIZE = 10000
+# Use sys.monitoring (python 3.12+) instead of sys.settrace
+WDB_MONITORING = bool(os.getenv('WDB_MONITORING', False))
+# Share one server connection between all the threads of a process
+WDB_MULTIPLEX = bool(os.getenv('WDB_MULTIPLEX', False))
 log = logger('wdb')
 trace_log = logging.getLogger('wdb.trace')
 
@@ -118,7 +127,7 @@ class Wdb(object):
     _instances = {}
     _sockets = []
     enabled = True
-    breakpoints = set()
+    breakpoints = Breakpoints()
     watchers = defaultdict(set)
 
     @staticmethod
@@ -141,8 +150,6 @@ class Wdb(object):
                 and wdb.port != port
             ):
                 log.warning('Different server/port set, ignoring')
-            else:
-                wdb.reconnect_if_needed()
         return wdb
 
     @staticmethod
@@ -157,8 +164,11 @@ class Wdb(object):
 
     def __init__(self, server=None, port=None, force_uuid=None):
         log.debug('New wdb instance %r' % self)
-        self.obj_cache = {}
-        self.compile_cache = {}
+        self.handles = Handles()
+        self.snapshots = Snapshots()
+        self.trace_cache = {}
+        self.trace_cache_version = None
+        self.frame_depths = {}
         self.tracing = False
         self.begun = False
         self.connected = False
@@ -172,15 +182,17 @@ class Wdb(object):
         self.full = False
         self.below = 0
         self.under = None
+        self.under_code = None
         self.server = server or SOCKET_SERVER
         self.port = port or SOCKET_PORT
+        self.monitor = get_monitor() if WDB_MONITORING else None
         self.interaction_stack = []
-        self._importmagic_index = None
-        self._importmagic_index_lock = threading.RLock()
-        self.index_imports()
+        # Connection is made on first interaction
         self._socket = None
-        self.connect()
-        self.get_breakpoints()
+        # Message received while applying pushed changes
+        self._received = None
+        # A pushed change was missed on the dedicated connection
+        self.breaks_missed = False
 
     def run_file(self, filename):
         """Run the file `filename` with trace"""
@@ -208,9 +220,10 @@ class Wdb(object):
             locals = globals
         self.reset()
         if isinstance(cmd, str):
-            str_cmd = cmd
-            cmd = compile(str_cmd, fn or "<wdb>", "exec")
-            self.compile_cache[id(cmd)] = str_cmd
+            if fn:
+                cmd = compile(cmd, fn, "exec")
+            else:
+                cmd = compile_cache.compile(cmd, "<wdb>")
         if fn:
             from linecache import getline
 
@@ -238,7 +251,10 @@ class Wdb(object):
 
         linecache.checkcache()
 
-    def reconnect_if_needed(self):
+    def reconnect_if_needed(self, block=True):
+        if not self._socket:
+            self.connect(block)
+            return
         try:
             # Sending PING twice
             self.send('PING')
@@ -251,69 +267,200 @@ class Wdb(object):
             self.begun = False
             self.connect()
 
-    def connect(self):
-        """Connect to wdb server"""
+    def connect(self, block=True):
+        """Connect to wdb server, retrying if `block` unless the server
+        is known to be down"""
+        circuit = get_circuit(self.server, self.port)
+        if not circuit.allows():
+            log.debug(
+                'Server %s:%d is down, not connecting'
+                % (self.server, self.port)
+            )
+            return
+
         log.info('Connecting socket on %s:%d' % (self.server, self.port))
         tries = 0
-        while not self._socket and tries < 10:
+        max_tries = 10 if block else 1
+        while not self._socket and tries < max_tries:
             try:
-                time.sleep(0.2 * tries)
-                self._socket = Socket((self.server, self.port))
+                if tries:
+                    time.sleep(backoff(tries, 2))
+                if WDB_MULTIPLEX:
+                    self._socket = get_multiplexer(
+                        self.server, self.port, Wdb.on_push
+                    ).open()
+                else:
+                    self._socket = Socket((self.server, self.port))
             except socket.error:
                 tries += 1
                 log.warning(
                     'You must start/install wdb.server '
-                    '(Retrying on %s:%d) [Try #%d/10]'
-                    % (self.server, self.port, tries)
+                    '(Retrying on %s:%d) [Try #%d/%d]'
+                    % (self.server, self.port, tries, max_tries)
                 )
                 self._socket = None
 
         if not self._socket:
             log.warning('Could not connect to server')
+            circuit.failure()
             return
 
+        circuit.success()
+
         Wdb._sockets.append(self._socket)
         self._socket.send_bytes(self.uuid.encode('utf-8'))
+        self.fetch_breakpoints()
+
+    def fetch_breakpoints(self):
+        """Sync breakpoints with the server"""
+        multiplexer = getattr(self._socket, 'multiplexer', None)
+        if multiplexer is None:
+            if self.breaks_missed:
+                # Only versioning servers push changes
+                self.breaks_missed = not self.get_breakpoints(versioned=True)
+            else:
+                self.get_breakpoints()
+        elif not multiplexer.synced:
+            # Server changes are now pushed on the process channel,
+            # the ones missed from here on will unset it
+            multiplexer.synced = True
+            # Multiplexing servers version breakpoints
+            if not self.get_breakpoints(versioned=True):
+                multiplexer.synced = False
+
+    def sync_breakpoints(self):
+        """Sync breakpoints when tracing starts. Multiplexed processes
+        get the server changes on their process channel, dedicated
+        connections apply the ones waiting on their socket"""
+        if WDB_MULTIPLEX:
+            multiplexer = find_multiplexer(self.server, self.port)
+            if multiplexer is not None and multiplexer.synced:
+                return
+        if not self._socket:
+            # Connecting fetches the breakpoints
+            self.connect(block=False)
+            return
+        try:
+            self.receive_pushes()
+            if self._received is not None:
+                # A snapshot would be read in place of this message
+                return
+            if self.breaks_missed or hasattr(self._socket, 'multiplexer'):
+                self.fetch_breakpoints()
+        except (EOFError, socket.error):
+            log.warning('Unable to sync breakpoints, connection lost')
+            self._socket = None
+            self.connected = False
+            self.begun = False
+
+    @staticmethod
+    def on_push(multiplexer, message):
+        """Handle a message pushed to the process by the server"""
+        if not Wdb.apply_push(message):
+            # Get a full snapshot on next connection
+            multiplexer.synced = False
+
+    @staticmethod
+    def apply_push(message):
+        """Apply a pushed breakpoint change, return False if one was
+        missed"""
+        cmd, data = message.split('|', 1)
+        if cmd != 'BreaksDelta':
+            log.warning('Unknown pushed message %s' % cmd)
+            return True
+        delta = loads(data)
+        add, remove = delta.get('add'), delta.get('remove')
+        synced = Wdb.breakpoints.apply(
+            delta['version'],
+            add and from_server(add),
+            remove and from_server(remove),
+            delta.get('epoch'),
+        )
+        monitor = get_monitor()
+        if WDB_MONITORING and monitor:
+            monitor.update()
+        else:
+            Wdb.refresh_trace_lines()
+        return synced
+
+    def receive_push(self, message):
+        """Handle a message pushed on the dedicated connection"""
+        if not Wdb.apply_push(message):
+            # Get a versioned snapshot when tracing starts again
+            self.breaks_missed = True
+
+    def receive_pushes(self):
+        """Apply the changes pushed while running, the first other
+        message is kept for receive"""
+        while self._received is None and self.pending():
+            data = self._socket.recv_bytes().decode('utf-8')
+            if data.startswith('BreaksDelta|'):
+                self.receive_push(data)
+            else:
+                self._received = data
 
-    def get_breakpoints(self):
+    @staticmethod
+    def refresh_trace_lines():
+        """Update the line events of the frames running in the threads of
+        this process after breakpoints changed from another thread"""
+        pid = os.getpid()
+        frames = sys._current_frames()
+        for (instance_pid, thread), wdb in list(Wdb._instances.items()):
+            frame = frames.get(thread.ident)
+            if instance_pid == pid and frame is not None and not wdb.monitor:
+                wdb.update_trace_lines(frame)
+
+    def get_breakpoints(self, versioned=False):
+        """Get the server breakpoints, return False if versioned ones are
+        not up to date"""
         log.info('Getting server breakpoints')
-        self.send('ServerBreaks')
+        if versioned:
+            self.send(
+                'ServerBreaks|%s'
+                % dump(
+                    {
+                        'epoch': self.breakpoints.server_epoch,
+                        'version': self.breakpoints.server_version,
+                    }
+                )
+            )
+        else:
+            self.send('ServerBreaks')
         breaks = self.receive()
         try:
             breaks = loads(breaks)
         except JSONDecodeError:
             breaks = []
-        self._init_breakpoints = breaks
 
+        if isinstance(breaks, dict):
+            # Versioned snapshot, without breakpoints if we are up to date
+            synced = True
+            if 'breakpoints' in breaks:
+                synced = self.breakpoints.sync(
+                    [from_server(brk) for brk in breaks['breakpoints']],
+                    breaks['version'],
+                    breaks.get('epoch'),
+                )
+                self.update_breakpoints()
+            log.info('Server breakpoints synced')
+            return synced
+
+        # Server without versions
+        self._init_breakpoints = breaks
         for brk in breaks:
             self.set_break(
-                brk['fn'], brk['lno'], False, brk['cond'], brk['fun']
+                brk['fn'],
+                brk['lno'],
+                False,
+                brk['cond'],
+                brk['fun'],
+                brk.get('ignore'),
+                brk.get('hit'),
+                brk.get('sample'),
             )
 
         log.info('Server breakpoints added')
 
-    def index_imports(self):
-        if not importmagic or self._importmagic_index:
-            return
-
-        self._importmagic_index_lock.acquire()
-
-        def index(self):
-            log.info('Indexing imports')
-            index = importmagic.SymbolIndex()
-            index.build_index(sys.path)
-            self._importmagic_index = index
-            log.info('Indexing imports done')
-
-        index_thread = Thread(
-            target=index, args=(self,), name='wdb_importmagic_build_index'
-        )
-        # Don't wait for completion, let it die alone:
-        index_thread.daemon = True
-        index_thread.start()
-
-        self._importmagic_index_lock.release()
-
     def breakpoints_to_json(self):
         return [brk.to_dict() for brk in self.breakpoints]
 
@@ -325,11 +472,40 @@ class Wdb(object):
 
         return code
 
-    def _walk_frame_ancestry(self, frame):
-        iframe = frame
-        while iframe is not None:
-            yield iframe
-            iframe = iframe.f_back
+    def frame_depth(self, frame):
+        """Return the (depth, under anchor frame) of frame.
+        Computed from the closest cached ancestor, the outermost frame
+        running the `under` code is the anchor."""
+        try:
+            return self.frame_depths[frame]
+        except KeyError:
+            pass
+
+        unknown = []
+        depth, anchor = -1, None
+        while frame is not None:
+            if frame in self.frame_depths:
+                depth, anchor = self.frame_depths[frame]
+                break
+            unknown.append(frame)
+            frame = frame.f_back
+
+        for frame in reversed(unknown):
+            depth += 1
+            if anchor is None and self.under_code is not None:
+                if frame.f_code == self.under_code:
+                    anchor = frame
+        return depth, anchor
+
+    def cache_frame_depth(self, frame):
+        """Cache the depth of a frame keeping a local tracer until its
+        return event. Untraced frames never get one and are not cached
+        as the cache would keep them and their locals alive"""
+        if frame in self.frame_depths:
+            return
+        if len(self.frame_depths) > TRACE_CACHE_SIZE:
+            self.frame_depths.clear()
+        self.frame_depths[frame] = self.frame_depth(frame)
 
     def check_below(self, frame):
         stop_frame = self.state.frame
@@ -337,30 +513,62 @@ class Wdb(object):
         if not any((self.below, self.under)):
             return frame == stop_frame, False
 
-        under_code = self._get_under_code_ref()
-        if under_code:
-            stop_frame = None
-            for iframe in self._walk_frame_ancestry(frame):
-                if iframe.f_code == under_code:
-                    stop_frame = iframe
+        depth, anchor = self.frame_depth(frame)
+        if self.under_code:
+            stop_frame = anchor
 
         if not stop_frame:
             return False, False
 
-        below = 0
-        for iframe in self._walk_frame_ancestry(frame):
-            if stop_frame == iframe:
-                break
-            below += 1
+        below = depth - self.frame_depth(stop_frame)[0]
+        if below != self.below:
+            return False, False
+
+        if stop_frame is not anchor:
+            # Depths match, check that the state frame is an ancestor
+            iframe = frame
+            for i in range(below):
+                iframe = iframe.f_back
+            if iframe is not stop_frame:
+                return False, False
+
+        return True, True
 
-        return below == self.below, below == self.below
+    def needs_trace(self, code):
+        """Return True if there are breakpoints in code file.
+        Cached per code object until breakpoints change"""
+        version = self.breakpoints.version
+        if (
+            self.trace_cache_version != version
+            or len(self.trace_cache) > TRACE_CACHE_SIZE
+        ):
+            self.trace_cache.clear()
+            self.trace_cache_version = version
+        try:
+            return self.trace_cache[code]
+        except KeyError:
+            rv = self.trace_cache[code] = bool(
+                self.get_file_breaks(code.co_filename)
+            )
+            return rv
 
     def trace_dispatch(self, frame, event, arg):
         """This function is called every line,
         function call, function return and exception during trace"""
+        if (
+            event == 'call'
+            and isinstance(self.state, Running)
+            and not (self.stepping or self.full or self.below or self.under)
+            and not self.needs_trace(frame.f_code)
+        ):
+            # Nothing to do here, don't trace this frame
+            return
         fun = getattr(self, 'handle_' + event, None)
         if not fun:
             return self.trace_dispatch
+        if event == 'call' and self.frame_depths:
+            # Resumed generators can have moved in the stack
+            self.frame_depths.pop(frame, None)
         below, continue_below = self.check_below(frame)
         if (
             self.state.stops(frame, event)
@@ -369,12 +577,19 @@ class Wdb(object):
         ):
             fun(frame, arg)
 
+        if event == 'return':
+            self.frame_depths.pop(frame, None)
+
         if event == 'return' and frame == self.state.frame:
             # Upping state
             if self.state.up():
                 # No more frames
                 self.stop_trace()
                 return
+            if not self.monitor:
+                # The caller may have been run untraced
+                self.state.frame.f_trace = self.trace_function()
+            self.update_monitor()
             # Threading / Multiprocessing support
             co = self.state.frame.f_code
             if (
@@ -393,13 +608,16 @@ class Wdb(object):
 
         if (
             event == 'call'
-            and not self.stepping
+            and not (self.stepping and isinstance(self.state, Step))
+            and frame is not self.state.frame
             and not self.full
             and not continue_below
-            and not self.get_file_breaks(frame.f_code.co_filename)
+            and not self.needs_trace(frame.f_code)
         ):
             # Don't trace anymore here
             return
+        if event != 'return' and (self.below or self.under):
+            self.cache_frame_depth(frame)
         return self.trace_dispatch
 
     def trace_debug_dispatch(self, frame, event, arg):
@@ -435,11 +653,14 @@ class Wdb(object):
         self.reset()
         log.info('Starting trace')
         frame = frame or sys._getframe().f_back
+        self.sync_breakpoints()
         # Setting trace without pausing
         self.set_trace(frame, break_=False)
         self.tracing = True
         self.below = below
         self.under = under
+        self.under_code = self._get_under_code_ref()
+        self.frame_depths.clear()
         self.full = full
 
     def set_trace(self, frame=None, break_=True):
@@ -456,22 +677,35 @@ class Wdb(object):
         if self.stepping or self.closed:
             return
         self.reset()
-        trace = (
-            self.trace_dispatch
-            if trace_log.level >= 30
-            else self.trace_debug_dispatch
-        )
         trace_frame = frame = frame or sys._getframe().f_back
+        self.state = Step(trace_frame) if break_ else Running(trace_frame)
+        if self.monitor:
+            if self.monitor.start(self):
+                return
+            # Monitoring tool in use, fall back to settrace
+            self.monitor = None
+        trace = self.trace_function()
         while frame:
             frame.f_trace = trace
             frame = frame.f_back
-        self.state = Step(trace_frame) if break_ else Running(trace_frame)
+        self.update_trace_lines()
         sys.settrace(trace)
 
+    def trace_function(self):
+        """The frame trace function according to the trace log level"""
+        return (
+            self.trace_dispatch
+            if trace_log.level >= 30
+            else self.trace_debug_dispatch
+        )
+
     def stop_trace(self, frame=None):
         """Stop tracing from here"""
         self.tracing = False
         self.full = False
+        self.frame_depths.clear()
+        if self.monitor:
+            self.monitor.stop(self)
         frame = frame or sys._getframe().f_back
         while frame:
             del frame.f_trace
@@ -479,42 +713,102 @@ class Wdb(object):
         sys.settrace(None)
         log.info('Stopping trace')
 
+    def update_monitor(self):
+        """Refresh sys.monitoring events after a state/breakpoint change"""
+        if self.monitor:
+            self.monitor.update()
+
+    def update_breakpoints(self):
+        """Refresh the events of the running frames after a breakpoint
+        change"""
+        self.update_monitor()
+        self.update_trace_lines(sys._getframe().f_back)
+
+    def update_trace_lines(self, frame=None):
+        """Disable line events on running frames without breakpoints,
+        any frame can stop when stepping"""
+        if self.monitor:
+            # Local events are set by the monitor
+            return
+        running = isinstance(self.state, Running)
+        frame = frame or sys._getframe().f_back
+        while frame is not None:
+            if frame.f_trace is not None:
+                try:
+                    frame.f_trace_lines = not running or self.needs_trace(
+                        frame.f_code
+                    )
+                except AttributeError:
+                    # No per frame line events
+                    return
+            frame = frame.f_back
+
     def set_until(self, frame, lineno=None):
         """Stop on the next line number."""
         self.state = Until(frame, frame.f_lineno)
+        self.update_monitor()
+        self.update_trace_lines()
 
     def set_step(self, frame):
         """Stop on the next line."""
         self.state = Step(frame)
+        self.update_monitor()
+        self.update_trace_lines()
 
     def set_next(self, frame):
         """Stop on the next line in current frame."""
         self.state = Next(frame)
+        self.update_monitor()
+        self.update_trace_lines()
 
     def set_return(self, frame):
         """Stop when returning from the given frame."""
         self.state = Return(frame)
+        self.update_monitor()
+        self.update_trace_lines()
 
     def set_continue(self, frame):
         """Don't stop anymore"""
         self.state = Running(frame)
+        self.update_monitor()
+        self.update_trace_lines()
         if not self.tracing and not self.breakpoints:
             # If we were in a set_trace and there's no breakpoint to trace for
             # Run without trace
             self.stop_trace()
 
-    def get_break(self, filename, lineno, temporary, cond, funcname):
-        if lineno and not cond:
-            return LineBreakpoint(filename, lineno, temporary)
-        elif cond:
-            return ConditionalBreakpoint(filename, lineno, cond, temporary)
-        elif funcname:
-            return FunctionBreakpoint(filename, funcname, temporary)
-        else:
-            return Breakpoint(filename, temporary)
+    def get_break(
+        self,
+        filename,
+        lineno,
+        temporary,
+        cond,
+        funcname,
+        ignore=0,
+        hit=None,
+        sample=None,
+    ):
+        return make_breakpoint(
+            filename,
+            lineno,
+            temporary,
+            cond,
+            funcname,
+            ignore=ignore,
+            hit=hit,
+            sample=sample,
+        )
 
     def set_break(
-        self, filename, lineno=None, temporary=False, cond=None, funcname=None
+        self,
+        filename,
+        lineno=None,
+        temporary=False,
+        cond=None,
+        funcname=None,
+        ignore=0,
+        hit=None,
+        sample=None,
     ):
         """Put a breakpoint for filename"""
         log.info(
@@ -522,9 +816,12 @@ class Wdb(object):
             % (filename, lineno, temporary, cond, funcname)
         )
         breakpoint = self.get_break(
-            filename, lineno, temporary, cond, funcname
+            filename, lineno, temporary, cond, funcname, ignore, hit, sample
         )
+        # Replace an existing breakpoint to update its options
+        self.breakpoints.discard(breakpoint)
         self.breakpoints.add(breakpoint)
+        self.update_breakpoints()
         log.info('Breakpoint %r added' % breakpoint)
         return breakpoint
 
@@ -545,12 +842,16 @@ class Wdb(object):
 
         try:
             self.breakpoints.remove(breakpoint)
+            self.update_breakpoints()
             log.info('Breakpoint %r removed' % breakpoint)
         except Exception:
             log.info('Breakpoint %r not removed: not found' % breakpoint)
 
     def safe_repr(self, obj):
-        """Like a repr but without exception"""
+        """Like a repr but without exception, summarized for large types"""
+        summary = summarize(obj)
+        if summary is not None:
+            return summary
         try:
             return repr(obj)
         except Exception as e:
@@ -560,162 +861,52 @@ class Wdb(object):
         self, obj, context=None, html=True, level=0, full=False
     ):
         """Repr with inspect links on objects"""
-        context = context and dict(context) or {}
-        recursion = id(obj) in context
-        if not recursion:
-            context[id(obj)] = obj
-            try:
-                rv = self.better_repr(obj, context, html, level + 1, full)
-            except Exception:
-                rv = None
-            if rv:
-                return rv
-
-        self.obj_cache[id(obj)] = obj
-        if html:
-            return '<a href="%d" class="inspect">%s%s</a>' % (
-                id(obj),
-                'Recursion of ' if recursion else '',
-                escape(self.safe_repr(obj)),
-            )
-        return '%s%s' % (
-            'Recursion of ' if recursion else '',
-            self.safe_repr(obj),
-        )
+        renderer = Renderer(self, html, full, context)
+        box = time_box(renderer.timeout)
+        try:
+            with box:
+                return renderer.repr(obj, level)
+        except EvaluationTimeout:
+            if not box.expired:
+                raise
+            return self.timed_out(self.retry_repr(obj), html)
 
     def better_repr(self, obj, context=None, html=True, level=1, full=False):
-        """Repr with html decorations or indentation"""
-        abbreviate = (lambda x, level, **kw: x) if full else cut_if_too_long
-
-        def get_too_long_repr(ie):
-            r = '[%d more…]' % ie.size
-            if html:
-                self.obj_cache[id(obj)] = obj
-                return '<a href="dump/%d" class="inspect">%s</a>' % (
-                    id(obj),
-                    r,
-                )
-            return r
+        """Repr with html decorations or indentation of containers"""
+        return Renderer(self, html, full, context).container_repr(obj, level)
 
-        if isinstance(obj, dict):
-            if isinstance(obj, OrderedDict):
-                dict_sorted = lambda it, f: it
-            else:
-                dict_sorted = sorted
+    def page_repr(self, obj, offset, limit, html=True):
+        """Repr of the `limit` items of a container from `offset`"""
+        renderer = Renderer(self, html)
+        box = time_box(renderer.timeout)
+        try:
+            with box:
+                return renderer.page_repr(obj, offset, limit)
+        except EvaluationTimeout:
+            if not box.expired:
+                raise
+            return self.timed_out(self.retry_repr(obj), html)
+
+    def timed_out(self, retry, html=True):
+        """Placeholder of a timed out evaluation, retried when clicked"""
+        if not html:
+            return 'Timed out'
+        return '<a href="retry/%d" class="inspect">Timed out, retry…</a>' % (
+            self.handles.add(retry)
+        )
 
-            dict_repr = '  ' * (level - 1)
-            if type(obj) != dict:
-                dict_repr = type(obj).__name__ + '({'
-                closer = '})'
-            else:
-                dict_repr = '{'
-                closer = '}'
-            if len(obj) > 2:
-                dict_repr += '\n' + '  ' * level
-                if html:
-                    dict_repr += '''<table class="
-                        mdl-data-table mdl-js-data-table
-                        mdl-data-table--selectable mdl-shadow--2dp">'''
-                    dict_repr += ''.join(
-                        [
-                            (
-                                '<tr><td class="key">'
-                                + self.safe_repr(key)
-                                + ':'
-                                + '</td>'
-                                '<td class="val '
-                                + 'mdl-data-table__cell--non-numeric">'
-                                + self.safe_better_repr(
-                                    val, context, html, level, full
-                                )
-                                + '</td></tr>'
-                            )
-                            if not isinstance(key, IterableEllipsis)
-                            else (
-                                '<tr><td colspan="2" class="ellipse">'
-                                + get_too_long_repr(key)
-                                + '</td></tr>'
-                            )
-                            for key, val in abbreviate(
-                                dict_sorted(obj.items(), key=lambda x: x[0]),
-                                level,
-                                tuple_=True,
-                            )
-                        ]
-                    )
-                    dict_repr += '</table>'
-                else:
-                    dict_repr += ('\n' + '  ' * level).join(
-                        [
-                            self.safe_repr(key)
-                            + ': '
-                            + self.safe_better_repr(
-                                val, context, html, level, full
-                            )
-                            if not isinstance(key, IterableEllipsis)
-                            else get_too_long_repr(key)
-                            for key, val in abbreviate(
-                                dict_sorted(obj.items(), key=lambda x: x[0]),
-                                level,
-                                tuple_=True,
-                            )
-                        ]
-                    )
-                closer = '\n' + '  ' * (level - 1) + closer
-            else:
-                dict_repr += ', '.join(
-                    [
-                        self.safe_repr(key)
-                        + ': '
-                        + self.safe_better_repr(
-                            val, context, html, level, full
-                        )
-                        for key, val in dict_sorted(
-                            obj.items(), key=lambda x: x[0]
-                        )
-                    ]
-                )
-            dict_repr += closer
-            return dict_repr
-
-        if any(
-            [
-                isinstance(obj, list),
-                isinstance(obj, set),
-                isinstance(obj, tuple),
-            ]
-        ):
-            iter_repr = '  ' * (level - 1)
-            if type(obj) == list:
-                iter_repr = '['
-                closer = ']'
-            elif type(obj) == set:
-                iter_repr = '{'
-                closer = '}'
-            elif type(obj) == tuple:
-                iter_repr = '('
-                closer = ')'
-            else:
-                iter_repr = escape(obj.__class__.__name__) + '(['
-                closer = '])'
-
-            splitter = ', '
-            if len(obj) > 2 and html:
-                splitter += '\n' + '  ' * level
-                iter_repr += '\n' + '  ' * level
-                closer = '\n' + '  ' * (level - 1) + closer
-
-            iter_repr += splitter.join(
-                [
-                    self.safe_better_repr(val, context, html, level, full)
-                    if not isinstance(val, IterableEllipsis)
-                    else get_too_long_repr(val)
-                    for val in abbreviate(obj, level)
-                ]
+    def retry_repr(self, obj):
+        description = '%s object' % type(obj).__name__
+
+        def retry():
+            return 'Print|%s' % dump(
+                {
+                    'for': description,
+                    'result': self.safe_better_repr(obj, full=True),
+                }
             )
 
-            iter_repr += closer
-            return iter_repr
+        return Retry(description, retry)
 
     @contextmanager
     def capture_output(self, with_hook=True):
@@ -745,30 +936,25 @@ class Wdb(object):
             sys.stdout, sys.stderr = stdout, stderr
 
     def dmp(self, thing):
-        """Dump the content of an object in a dict for wdb.js"""
-
-        def safe_getattr(key):
-            """Avoid crash on getattr"""
-            try:
-                return getattr(thing, key)
-            except Exception as e:
-                return 'Error getting attr "%s" from "%s" (%s: %s)' % (
-                    key,
-                    thing,
-                    type(e).__name__,
-                    e,
+        """Dump the attributes of an object in a dict for wdb.js.
+        Only simple values are rendered, the others are links to get
+        them on demand."""
+        handle = self.handles.add(thing)
+        attributes = {}
+        for key in dir(thing):
+            type_, value = peek_attribute(thing, key)
+            if value is not LAZY and (
+                is_simple(value) or get_renderer(type(value))
+            ):
+                val = self.safe_better_repr(value)
+            else:
+                val = '<a href="attr/%d/%s" class="inspect">%s…</a>' % (
+                    handle,
+                    escape(key),
+                    escape(type_),
                 )
-
-        return dict(
-            (
-                escape(key),
-                {
-                    'val': self.safe_better_repr(safe_getattr(key)),
-                    'type': type(safe_getattr(key)).__name__,
-                },
-            )
-            for key in dir(thing)
-        )
+            attributes[escape(key)] = {'val': val, 'type': type_}
+        return attributes
 
     def get_file(self, filename):
         """Get file source from cache"""
@@ -815,15 +1001,15 @@ class Wdb(object):
             filename = code.co_filename or '<unspecified>'
             line = None
             if filename[0] == '<' and filename[-1] == '>':
-                line = get_source_from_byte_code(code)
+                # Evaluated snippets are in linecache, only decompile others
+                if compile_cache.get(code) is None:
+                    line = get_source_from_byte_code(code)
                 fn = filename
             else:
                 fn = os.path.abspath(filename)
             if not line:
                 linecache.checkcache(filename)
                 line = linecache.getline(filename, lno, stack_frame.f_globals)
-                if not line:
-                    line = self.compile_cache.get(id(code), '')
                 line = to_unicode_string(line, filename)
                 line = line and line.strip()
             startlnos = dis.findlinestarts(code)
@@ -854,12 +1040,22 @@ class Wdb(object):
             return
         self._socket.send_bytes(data.encode('utf-8'))
 
+    def pending(self):
+        """Return True if data from the websocket is waiting"""
+        try:
+            return bool(self._socket and self._socket.poll(0))
+        except Exception:
+            return False
+
     def receive(self, timeout=None):
         """Receive data through websocket"""
         log.debug('Receiving')
         if not self._socket:
             log.warning('No connection')
             return
+        if self._received is not None:
+            data, self._received = self._received, None
+            return data
         try:
             if timeout:
                 rv = self._socket.poll(timeout)
@@ -872,7 +1068,12 @@ class Wdb(object):
             log.error('Connection lost')
             return 'Quit'
         log.debug('Got %s' % data)
-        return data.decode('utf-8')
+        data = data.decode('utf-8')
+        if data.startswith('BreaksDelta|'):
+            # Changes are pushed on dedicated connections too
+            self.receive_push(data)
+            return self.receive(timeout)
+        return data
 
     def open_browser(self, type_='debug'):
         if not self.connected:
@@ -932,6 +1133,10 @@ class Wdb(object):
             % (frame, tb, exception, exception_description)
         )
         self.reconnect_if_needed()
+        if not self._socket:
+            log.error('No wdb server to interact with, continuing')
+            self.set_continue(frame)
+            return
         self.stepping = not shell
 
         if not iframe_mode:
@@ -972,7 +1177,12 @@ class Wdb(object):
         else:
             self.begun = True
 
-        interaction.loop()
+        # Objects linked during the interaction are released at its end
+        generation = self.handles.begin()
+        try:
+            interaction.loop()
+        finally:
+            self.handles.release(generation)
         self.interaction_stack.pop()
         if lvl:
             self.interaction_stack[-1].init()
@@ -1009,7 +1219,6 @@ class Wdb(object):
 
     def handle_return(self, frame, return_value):
         """This function is called when a return trap is set here."""
-        self.obj_cache[id(return_value)] = return_value
         self.extra_vars['__return__'] = return_value
         fun = frame.f_code.co_name
         log.info('Returning from %r with value: %r' % (fun, return_value))
@@ -1034,7 +1243,6 @@ class Wdb(object):
             _value = type_(value)
         fake_exc_info = type_, _value, tb
         log.error('Exception during trace', exc_info=fake_exc_info)
-        self.obj_cache[id(exc_info)] = exc_info
         self.extra_vars['__exception__'] = exc_info
         exception = type_.__name__
         exception_description = str(value)
@@ -1052,33 +1260,20 @@ class Wdb(object):
 
     def breaks(self, frame, no_remove=False):
         """Return True if there's a breakpoint at frame"""
-        for breakpoint in set(self.breakpoints):
-            if breakpoint.breaks(frame):
+        for breakpoint in self.breakpoints.candidates(frame):
+            if breakpoint.matches(frame) and (no_remove or breakpoint.count()):
                 if breakpoint.temporary and not no_remove:
-                    self.breakpoints.remove(breakpoint)
+                    self.breakpoints.discard(breakpoint)
                 return True
         return False
 
     def get_file_breaks(self, filename):
         """List all file `filename` breakpoints"""
-        return [
-            breakpoint
-            for breakpoint in self.breakpoints
-            if breakpoint.on_file(filename)
-        ]
+        return self.breakpoints.get_file_breaks(filename)
 
     def get_breaks_lno(self, filename):
         """List all line numbers that have a breakpoint"""
-        return list(
-            filter(
-                lambda x: x is not None,
-                [
-                    getattr(breakpoint, 'line', None)
-                    for breakpoint in self.breakpoints
-                    if breakpoint.on_file(filename)
-                ],
-            )
-        )
+        return self.breakpoints.get_breaks_lno(filename)
 
     def die(self):
         """Time to quit"""
@@ -1090,6 +1285,9 @@ class Wdb(object):
                 pass
         if self._socket:
             self._socket.close()
+        if self.monitor:
+            self.monitor.stop(self)
+        self.snapshots.clear()
         self.pop()
 
 
@@ -1157,6 +1355,12 @@ def with_trace(fun):
     return traced
 
 
+def server_state(server=None, port=None):
+    """Get the connection circuit state of the wdb server:
+    `closed` when reachable, `open` or `half-open` when down"""
+    return get_circuit(server or SOCKET_SERVER, port or SOCKET_PORT).to_dict()
+
+
 @atexit.register
 def cleanup():
     """Close all sockets at exit"""
@@ -0,0 +1,91 @@
+"""Memory allocations traced with tracemalloc
+
+`Snapshots` starts tracemalloc on demand and keeps the last snapshots
+taken by name, to compare the allocations between two breakpoints.
+The allocations made by wdb itself are filtered out. The store is
+bounded and cleared with tracing when the debugging session ends.
+"""
+import os
+
+from ._compat import OrderedDict, logger
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+log = logger('wdb.allocations')
+
+# Snapshots kept by session
+SNAPSHOTS = 5
+# Frames stored by allocation when tracing is started by wdb
+ALLOCATIONS_FRAMES = 10
+# Statistics displayed
+ALLOCATIONS_TOP = 20
+# Ways to group the allocations, the first is the default
+GROUPS = ('lineno', 'filename', 'traceback')
+SYNTAX = (
+    'start [frames] | stop | snapshot [name] | top [name] [group] [n] | '
+    'diff first second [group] [n]'
+)
+
+WDB_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class Snapshots(object):
+    """Bounded store of named tracemalloc snapshots"""
+
+    def __init__(self, size=SNAPSHOTS):
+        self.size = size
+        self.snapshots = OrderedDict()
+        self.taken = 0
+        # Whether tracing was started by wdb
+        self.started = False
+
+    def __len__(self):
+        return len(self.snapshots)
+
+    def names(self):
+        return list(self.snapshots)
+
+    def start(self, frames=ALLOCATIONS_FRAMES):
+        """Start tracing, return False if it was already started"""
+        if tracemalloc.is_tracing():
+            return False
+        tracemalloc.start(frames)
+        self.started = True
+        return True
+
+    def take(self, name=None):
+        """Take a snapshot named name or numbered and return its name.
+        The oldest one is dropped if there are too many"""
+        if not name:
+            self.taken += 1
+            name = '#%d' % self.taken
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, os.path.join(WDB_DIR, '*')),
+            )
+        )
+        self.snapshots.pop(name, None)
+        self.snapshots[name] = snapshot
+        while len(self.snapshots) > self.size:
+            dropped, _ = self.snapshots.popitem(last=False)
+            log.info('Dropping snapshot %s' % dropped)
+        return name
+
+    def get(self, name=None):
+        """The snapshot named name or the last one, KeyError if none"""
+        if name is None:
+            if not self.snapshots:
+                raise KeyError(name)
+            name = next(reversed(self.snapshots))
+        return name, self.snapshots[name]
+
+    def clear(self):
+        """Drop the snapshots and stop tracing if wdb started it"""
+        self.snapshots.clear()
+        if self.started and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.started = False
@@ -1,9 +1,15 @@
 import os.path
-from hashlib import sha1
+from collections import deque
+from random import random
+from threading import RLock
+
 from ._compat import import_module, logger
 
 log = logger('wdb.bp')
 
+# Server changes kept to be replayed over the next snapshot
+SERVER_DELTAS = 100
+
 
 def canonic(filename):
     if filename == "<" + filename[1:-1] + ">":
@@ -29,20 +35,45 @@ def file_from_import(filename, function=None):
 
 
 class Breakpoint(object):
-    """Simple breakpoint that breaks if in file"""
+    """Simple breakpoint that breaks if in file
 
-    def __init__(self, file, temporary=False):
+    Options:
+    `ignore`: don't break on the first `ignore` hits
+    `hit`: only break on the `hit`th hit
+    `sample`: break randomly on 1 hit in `sample`
+    """
+
+    def __init__(self, file, temporary=False, ignore=0, hit=None, sample=None):
         self.fn = file
         if not file.endswith(('.py', '.pyc', '.pyo')):
             file = file_from_import(file)
         self.file = canonic(file)
         self.temporary = temporary
+        self.ignore = ignore or 0
+        self.hit = hit
+        self.sample = sample
+        self.hits = 0
 
     def on_file(self, filename):
         return canonic(filename) == self.file
 
     def breaks(self, frame):
-        return self.on_file(frame.f_code.co_filename)
+        return self.on_file(frame.f_code.co_filename) and self.matches(frame)
+
+    def matches(self, frame):
+        """Test the breakpoint on a frame known to be in the file"""
+        return True
+
+    def count(self):
+        """Count a hit and return True if the options allow to break"""
+        self.hits += 1
+        if self.hits <= self.ignore:
+            return False
+        if self.hit and self.hits != self.hit:
+            return False
+        if self.sample and self.sample > 1 and random() * self.sample >= 1:
+            return False
+        return True
 
     def __repr__(self):
         s = 'Temporary ' if self.temporary else ''
@@ -51,12 +82,14 @@ class Breakpoint(object):
         return s
 
     def __eq__(self, other):
-        return self.file == other.file and self.temporary == other.temporary
+        return (
+            type(self) is type(other)
+            and self.file == other.file
+            and self.temporary == other.temporary
+        )
 
     def __hash__(self):
-        s = sha1()
-        s.update(repr(self).encode('utf-8'))
-        return int(s.hexdigest(), 16)
+        return hash((self.__class__.__name__, self.file, self.temporary))
 
     def to_dict(self):
         return {
@@ -65,21 +98,21 @@ class Breakpoint(object):
             'cond': getattr(self, 'condition', None),
             'fun': getattr(self, 'function', None),
             'temporary': self.temporary,
+            'ignore': self.ignore,
+            'hit': self.hit,
+            'sample': self.sample,
         }
 
 
 class LineBreakpoint(Breakpoint):
     """Simple breakpoint that breaks if in file at line"""
 
-    def __init__(self, file, line, temporary=False):
+    def __init__(self, file, line, temporary=False, **options):
         self.line = line
-        super(LineBreakpoint, self).__init__(file, temporary)
+        super(LineBreakpoint, self).__init__(file, temporary, **options)
 
-    def breaks(self, frame):
-        return (
-            super(LineBreakpoint, self).breaks(frame)
-            and frame.f_lineno == self.line
-        )
+    def matches(self, frame):
+        return frame.f_lineno == self.line
 
     def __repr__(self):
         return (
@@ -93,23 +126,29 @@ class LineBreakpoint(Breakpoint):
         )
 
     def __hash__(self):
-        return super(LineBreakpoint, self).__hash__()
+        return hash((super(LineBreakpoint, self).__hash__(), self.line))
 
 
 class ConditionalBreakpoint(Breakpoint):
     """Breakpoint that breaks if condition is True at line in file"""
 
-    def __init__(self, file, line, condition, temporary=False):
+    def __init__(self, file, line, condition, temporary=False, **options):
         self.line = line
         self.condition = condition
-        super(ConditionalBreakpoint, self).__init__(file, temporary)
+        self._code = None
+        super(ConditionalBreakpoint, self).__init__(file, temporary, **options)
 
-    def breaks(self, frame):
+    @property
+    def code(self):
+        """The condition compiled once"""
+        if self._code is None:
+            self._code = compile(self.condition, '<breakpoint>', 'eval')
+        return self._code
+
+    def matches(self, frame):
         try:
-            return (
-                super(ConditionalBreakpoint, self).breaks(frame)
-                and (self.line is None or frame.f_lineno == self.line)
-                and eval(self.condition, frame.f_globals, frame.f_locals)
+            return (self.line is None or frame.f_lineno == self.line) and eval(
+                self.code, frame.f_globals, frame.f_locals
             )
         except Exception:
             # Break in case of
@@ -129,24 +168,22 @@ class ConditionalBreakpoint(Breakpoint):
         )
 
     def __hash__(self):
-        return super(ConditionalBreakpoint, self).__hash__()
+        return hash(
+            (super(ConditionalBreakpoint, self).__hash__(), self.condition)
+        )
 
 
 class FunctionBreakpoint(Breakpoint):
     """Breakpoint that breaks if in file in function"""
 
-    def __init__(self, file, function, temporary=False):
+    def __init__(self, file, function, temporary=False, **options):
         self.function = function
         if not file.endswith(('.py', '.pyc', '.pyo')):
             file = file_from_import(file, function)
-        self.file = canonic(file)
-        self.temporary = temporary
+        super(FunctionBreakpoint, self).__init__(file, temporary, **options)
 
-    def breaks(self, frame):
-        return (
-            super(FunctionBreakpoint, self).breaks(frame)
-            and frame.f_code.co_name == self.function
-        )
+    def matches(self, frame):
+        return frame.f_code.co_name == self.function
 
     def __repr__(self):
         return (
@@ -161,4 +198,226 @@ class FunctionBreakpoint(Breakpoint):
         )
 
     def __hash__(self):
-        return super(FunctionBreakpoint, self).__hash__()
+        return hash(
+            (super(FunctionBreakpoint, self).__hash__(), self.function)
+        )
+
+
+def make_breakpoint(
+    filename, lineno, temporary, cond, funcname, **options
+):
+    """Get the breakpoint kind matching the given arguments"""
+    if lineno and not cond:
+        return LineBreakpoint(filename, lineno, temporary, **options)
+    elif cond:
+        return ConditionalBreakpoint(
+            filename, lineno, cond, temporary, **options
+        )
+    elif funcname:
+        return FunctionBreakpoint(filename, funcname, temporary, **options)
+    else:
+        return Breakpoint(filename, temporary, **options)
+
+
+def from_server(brk):
+    """Get a breakpoint from its server representation"""
+    return make_breakpoint(
+        brk['fn'],
+        brk['lno'],
+        False,
+        brk['cond'],
+        brk['fun'],
+        ignore=brk.get('ignore'),
+        hit=brk.get('hit'),
+        sample=brk.get('sample'),
+    )
+
+
+class Breakpoints(object):
+    """Thread safe breakpoint registry indexed by canonical filename
+
+    Breakpoints are bucketed by line, by function name and file wide so that
+    the line event path only looks at the breakpoints that can match.
+    Buckets are tuples replaced on change, reading is lock free.
+    `version` is incremented on every change to allow cache invalidation.
+    `server_version` is the version of the server breakpoints snapshot,
+    None when unknown or when a server change was missed. Versions are
+    only comparable in the same `server_epoch`, renewed by the server
+    when it restarts.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self.server_version = None
+        self.server_epoch = None
+        # Changes received while a snapshot may be on its way
+        self._deltas = deque(maxlen=SERVER_DELTAS)
+        # Breakpoints coming from the server, the others are kept on sync
+        self._server = set()
+        self._lock = RLock()
+        # Breakpoint equality can ignore some attributes, keep the instances
+        self._all = {}
+        self._files = {}
+        self._canonics = {}
+
+    def canonic(self, filename):
+        """Memoized canonic"""
+        try:
+            return self._canonics[filename]
+        except KeyError:
+            rv = self._canonics[filename] = canonic(filename)
+            return rv
+
+    def _bucket(self, breakpoint):
+        line = getattr(breakpoint, 'line', None)
+        if line is not None:
+            return 'lines', line
+        function = getattr(breakpoint, 'function', None)
+        if function is not None:
+            return 'functions', function
+        return 'file', None
+
+    def add(self, breakpoint):
+        with self._lock:
+            if breakpoint in self._all:
+                return
+            self._all[breakpoint] = breakpoint
+            index = self._files.setdefault(
+                breakpoint.file, {'lines': {}, 'functions': {}, 'file': ()}
+            )
+            kind, key = self._bucket(breakpoint)
+            if kind == 'file':
+                index['file'] += (breakpoint,)
+            else:
+                index[kind][key] = index[kind].get(key, ()) + (breakpoint,)
+            self.version += 1
+
+    def remove(self, breakpoint):
+        with self._lock:
+            breakpoint = self._all.pop(breakpoint)
+            index = self._files[breakpoint.file]
+            kind, key = self._bucket(breakpoint)
+            if kind == 'file':
+                bucket = index['file']
+            else:
+                bucket = index[kind][key]
+            bucket = tuple(brk for brk in bucket if brk is not breakpoint)
+            if kind == 'file':
+                index['file'] = bucket
+            elif bucket:
+                index[kind][key] = bucket
+            else:
+                del index[kind][key]
+            if not any((index['lines'], index['functions'], index['file'])):
+                del self._files[breakpoint.file]
+            self.version += 1
+
+    def discard(self, breakpoint):
+        try:
+            self.remove(breakpoint)
+        except KeyError:
+            pass
+
+    def clear(self):
+        with self._lock:
+            self._all.clear()
+            self._files.clear()
+            self._server.clear()
+            self.version += 1
+
+    def sync(self, breakpoints, version, epoch=None):
+        """Replace the breakpoints of the previous server snapshot by this
+        one and replay the changes received after it, return False if one
+        was missed"""
+        with self._lock:
+            breakpoints = set(breakpoints)
+            for breakpoint in self._server - breakpoints:
+                self.discard(breakpoint)
+            for breakpoint in breakpoints:
+                # Replace to update options
+                self.discard(breakpoint)
+                self.add(breakpoint)
+            self._server = breakpoints
+            self.server_version = version
+            self.server_epoch = epoch
+            deltas = sorted(
+                (delta for delta in self._deltas if delta[0] == epoch),
+                key=lambda delta: delta[1],
+            )
+            self._deltas.clear()
+            for delta in deltas:
+                if not self._apply(*delta[1:]):
+                    return False
+            return True
+
+    def apply(self, version, add=None, remove=None, epoch=None):
+        """Apply a server change, return False if a change was missed"""
+        with self._lock:
+            self._deltas.append((epoch, version, add, remove))
+            if epoch != self.server_epoch:
+                # The server restarted, its versions start over
+                self.server_version = None
+            return self._apply(version, add, remove)
+
+    def _apply(self, version, add, remove):
+        if self.server_version is not None:
+            if version <= self.server_version:
+                # Already in the snapshot
+                return True
+        if add is not None:
+            self.discard(add)
+            self.add(add)
+            self._server.discard(add)
+            self._server.add(add)
+        if remove is not None:
+            self.discard(remove)
+            self._server.discard(remove)
+        if (
+            self.server_version is not None
+            and version == self.server_version + 1
+        ):
+            self.server_version = version
+            return True
+        self.server_version = None
+        return False
+
+    def candidates(self, frame):
+        """Breakpoints that can break at this frame"""
+        index = self._files.get(self.canonic(frame.f_code.co_filename))
+        if index is None:
+            return ()
+        return (
+            index['lines'].get(frame.f_lineno, ())
+            + index['functions'].get(frame.f_code.co_name, ())
+            + index['file']
+        )
+
+    def get_file_breaks(self, filename):
+        """List all file `filename` breakpoints"""
+        index = self._files.get(self.canonic(filename))
+        if index is None:
+            return []
+        breaks = list(index['file'])
+        for bucket in ('lines', 'functions'):
+            for brks in index[bucket].values():
+                breaks.extend(brks)
+        return breaks
+
+    def get_breaks_lno(self, filename):
+        """List all line numbers that have a breakpoint"""
+        index = self._files.get(self.canonic(filename))
+        if index is None:
+            return []
+        return list(index['lines'].keys())
+
+    def __contains__(self, breakpoint):
+        return breakpoint in self._all
+
+    def __iter__(self):
+        return iter(list(self._all))
+
+    def __len__(self):
+        return len(self._all)
+
+    def __repr__(self):
+        return repr(set(self._all))
@@ -0,0 +1,108 @@
+"""Census of the objects tracked by the garbage collector
+
+To find what fills the memory of a process, `census` counts the objects
+returned by `gc.get_objects()` by type in one pass, with their size and
+a few samples to inspect. The deep size adds to each object the size of
+the untracked objects it references (strings, numbers...). It is an
+approximation as these can be shared by several objects.
+
+The pass stops at its time budget, the census is then partial.
+"""
+import gc
+import sys
+import time
+from operator import attrgetter
+
+from ._compat import logger
+from .utils import get_referents, type_name
+
+log = logger('wdb.census')
+
+# Seconds spent counting objects
+CENSUS_TIMEOUT = 5
+# Instances kept by type to be inspected
+CENSUS_SAMPLES = 5
+# Types displayed by page
+CENSUS_PAGE = 50
+# Objects counted between checks of the time
+CENSUS_CHECK = 10000
+# Orders of the census
+SORTS = ('size', 'deep', 'count')
+
+
+def sizeof(obj):
+    try:
+        return sys.getsizeof(obj, 0)
+    except Exception:
+        return 0
+
+
+class Row(object):
+    """Objects of one type"""
+
+    def __init__(self, type_):
+        self.type = type_
+        self.name = type_name(type_)
+        self.count = 0
+        self.size = 0
+        self.deep = 0
+        self.samples = []
+
+
+class Census(object):
+    """Histogram of the types of the gc tracked objects, sorted by sort
+    and restricted to the type names containing match"""
+
+    def __init__(self, sort='size', match=None):
+        self.sort = sort
+        self.match = match
+        self.timeout = CENSUS_TIMEOUT
+        self.rows = []
+        self.total = 0
+        self.counted = 0
+
+    @property
+    def partial(self):
+        return self.counted < self.total
+
+    def take(self):
+        deadline = time.time() + self.timeout
+        is_tracked = gc.is_tracked
+        rows = {}
+        objects = gc.get_objects()
+        self.total = len(objects)
+        for i, obj in enumerate(objects):
+            if not i % CENSUS_CHECK and time.time() > deadline:
+                log.warning('Census stopped after %d objects' % i)
+                break
+            type_ = type(obj)
+            row = rows.get(type_)
+            if row is None:
+                row = rows[type_] = Row(type_)
+            size = sizeof(obj)
+            deep = size
+            for referent in get_referents(obj):
+                if not is_tracked(referent):
+                    deep += sizeof(referent)
+            row.count += 1
+            row.size += size
+            row.deep += deep
+            if len(row.samples) < CENSUS_SAMPLES:
+                row.samples.append(obj)
+            self.counted = i + 1
+        del objects
+
+        self.rows = sorted(
+            (
+                row
+                for row in rows.values()
+                if not self.match or self.match in row.name
+            ),
+            key=attrgetter(self.sort),
+            reverse=True,
+        )
+        return self
+
+    def page(self, offset):
+        """The rows of the page starting at offset"""
+        return self.rows[offset : offset + CENSUS_PAGE]
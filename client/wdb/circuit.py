@@ -0,0 +1,120 @@
+"""Server connection circuit breaker
+
+When the wdb server can't be reached the circuit opens: connections fail
+fast instead of blocking the debugged thread, and a background thread
+probes the server with a jittered exponential backoff until it answers,
+closing the circuit again.
+"""
+import os
+import socket
+import threading
+import time
+from random import uniform
+
+from ._compat import logger
+
+log = logger('wdb.circuit')
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+# First retry delay in seconds, doubled on each try
+BACKOFF_BASE = 0.1
+# Maximum delay between two background probes
+BACKOFF_CAP = 30
+PROBE_TIMEOUT = 1
+
+
+def backoff(tries, cap=BACKOFF_CAP):
+    """Jittered exponential delay before the `tries`th retry"""
+    delay = min(cap, BACKOFF_BASE * 2 ** tries)
+    # Spread reconnections of all the processes waiting for the server
+    return uniform(delay / 2, delay)
+
+
+class Circuit(object):
+    """Availability of one wdb server"""
+
+    def __init__(self, address):
+        self.address = address
+        self.state = CLOSED
+        self.failures = 0
+        self.retry_at = None
+        self.lock = threading.Lock()
+        self.prober_pid = None
+
+    def allows(self):
+        """Return True if a connection can be attempted"""
+        if self.state == CLOSED:
+            return True
+        if self.prober_pid != os.getpid():
+            # Probing thread did not survive a fork
+            self.probe()
+        return False
+
+    def success(self):
+        with self.lock:
+            if self.state != CLOSED:
+                log.info('Server %s:%d is back' % self.address)
+            self.state = CLOSED
+            self.failures = 0
+            self.retry_at = None
+
+    def failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.state != CLOSED:
+                return
+            log.warning(
+                'Server %s:%d is down, not connecting until it is back'
+                % self.address
+            )
+            self.state = OPEN
+        self.probe()
+
+    def probe(self):
+        """Start probing the server in the background"""
+        with self.lock:
+            if self.prober_pid == os.getpid():
+                return
+            self.prober_pid = os.getpid()
+        prober = threading.Thread(
+            target=self.run_probe, name='wdb_circuit_probe'
+        )
+        prober.daemon = True
+        prober.start()
+
+    def run_probe(self):
+        tries = 0
+        while self.state != CLOSED:
+            delay = backoff(tries)
+            self.retry_at = time.time() + delay
+            time.sleep(delay)
+            self.state = HALF_OPEN
+            try:
+                socket.create_connection(self.address, PROBE_TIMEOUT).close()
+            except socket.error:
+                self.state = OPEN
+                tries += 1
+                continue
+            self.success()
+        self.prober_pid = None
+
+    def to_dict(self):
+        return {
+            'state': self.state,
+            'failures': self.failures,
+            'retry_at': self.retry_at,
+        }
+
+
+_circuits = {}
+
+
+def get_circuit(server, port):
+    """Get the process wide circuit of the server at server:port"""
+    address = (server, port)
+    if address not in _circuits:
+        _circuits[address] = Circuit(address)
+    return _circuits[address]
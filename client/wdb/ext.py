@@ -60,7 +60,6 @@ def post_mortem_interaction(uuid, exc_info):
     if not isinstance(_value, BaseException):
         _value = type_(value)
 
-    wdb.obj_cache[id(exc_info)] = exc_info
     wdb.extra_vars['__exception__'] = exc_info
     exception = type_.__name__
     exception_description = str(value) + ' [POST MORTEM]'
@@ -0,0 +1,142 @@
+"""Handles of the objects linked in the ui
+
+Inspect links refer to objects by handle. Handles are never reused, unlike
+`id()`, and the registry is bounded: only the most recently used objects
+are kept alive, within a size budget, older ones are only weakly
+referenced when possible. Handles belong to the interaction that created
+them and are released when it ends.
+"""
+import sys
+import weakref
+from itertools import count
+from threading import RLock
+
+from ._compat import OrderedDict
+
+# Objects kept alive by the registry
+HANDLES_SIZE = 1000
+# Approximative size of the objects kept alive by the registry
+HANDLES_BUDGET = 64 * 1024 * 1024
+# Weakly referenced objects
+HANDLES_WEAK_SIZE = 10000
+# Returned for released handles
+RELEASED = object()
+
+
+def sizeof(obj):
+    try:
+        return sys.getsizeof(obj)
+    except Exception:
+        return 0
+
+
+class Handle(object):
+    __slots__ = ('obj', 'ref', 'generation', 'size')
+
+    def __init__(self, obj, generation):
+        self.obj = obj
+        self.generation = generation
+        self.size = sizeof(obj)
+        try:
+            self.ref = weakref.ref(obj)
+        except TypeError:
+            self.ref = None
+
+    def get(self, default=None):
+        if self.ref is None:
+            return self.obj
+        obj = self.ref()
+        return default if obj is None else obj
+
+    def weaken(self):
+        """Stop keeping the object alive, return False if it can't be
+        weakly referenced"""
+        self.obj = None
+        return self.ref is not None
+
+
+class Handles(object):
+    """Thread safe bounded handle registry"""
+
+    def __init__(self):
+        self.lock = RLock()
+        self.counter = count(1)
+        # Most recently used last
+        self.strong = OrderedDict()
+        self.weak = OrderedDict()
+        self.ids = {}
+        self.size = 0
+        self.generation = 0
+        self.interactions = 0
+
+    def add(self, obj):
+        """Get the handle of obj, creating it if needed"""
+        with self.lock:
+            handle = self.ids.get(id(obj))
+            if handle is not None and self.get(handle, RELEASED) is obj:
+                return handle
+            handle = next(self.counter)
+            entry = Handle(obj, self.generation)
+            self.strong[handle] = entry
+            self.ids[id(obj)] = handle
+            self.size += entry.size
+            self.evict()
+            return handle
+
+    def get(self, handle, default=None):
+        """Get the object of handle, default if it was released"""
+        with self.lock:
+            entry = self.strong.pop(handle, None)
+            if entry is not None:
+                # Most recently used
+                self.strong[handle] = entry
+                return entry.obj
+            entry = self.weak.get(handle)
+            if entry is None:
+                return default
+            return entry.get(default)
+
+    def evict(self):
+        while self.strong and (
+            len(self.strong) > HANDLES_SIZE or self.size > HANDLES_BUDGET
+        ):
+            if len(self.strong) == 1:
+                # Keep the last one whatever its size
+                break
+            handle, entry = self.strong.popitem(last=False)
+            self.size -= entry.size
+            if entry.weaken():
+                self.weak[handle] = entry
+        while len(self.weak) > HANDLES_WEAK_SIZE:
+            self.weak.popitem(last=False)
+
+    def begin(self):
+        """Start a new generation, return the generation to release at
+        interaction end. Outside of interactions it includes the objects
+        added just before, while preparing the interaction."""
+        with self.lock:
+            if self.interactions:
+                self.generation += 1
+            generation = self.generation
+            self.generation += 1
+            self.interactions += 1
+            return generation
+
+    def release(self, generation):
+        """Release all the handles of `generation` and newer ones"""
+        with self.lock:
+            for entries in (self.strong, self.weak):
+                for handle, entry in list(entries.items()):
+                    if entry.generation >= generation:
+                        del entries[handle]
+                        if entries is self.strong:
+                            self.size -= entry.size
+            self.ids = dict(
+                (key, handle)
+                for key, handle in self.ids.items()
+                if handle in self.strong or handle in self.weak
+            )
+            self.interactions -= 1
+
+    def __len__(self):
+        return len(self.strong) + len(self.weak)
@@ -0,0 +1,209 @@
+"""sys.monitoring (PEP 669) tracing backend
+
+Instead of installing a python trace function on every frame, the monitor
+listens to PY_START / LINE / PY_RETURN / RAISE events and returns DISABLE
+for every code location wdb has no interest in, so code without breakpoints
+runs at full speed once it has been seen.
+
+sys.monitoring is process wide whereas sys.settrace is per thread, the
+monitor therefore dispatches each event to the wdb instance of the current
+thread (if any is tracing).
+"""
+import os
+import sys
+import threading
+
+from ._compat import logger
+from .state import Running, Step
+
+log = logger('wdb.trace')
+
+monitoring = getattr(sys, 'monitoring', None)
+WDB_DIR = os.path.dirname(os.path.abspath(__file__))
+
+if monitoring:
+    E = monitoring.events
+    DISABLE = monitoring.DISABLE
+    TOOL = monitoring.DEBUGGER_ID
+    ARMED_EVENTS = E.LINE | E.PY_RETURN
+    RUNNING_EVENTS = E.PY_START | E.RAISE | E.PY_UNWIND
+    STEPPING_EVENTS = RUNNING_EVENTS | E.LINE | E.PY_RETURN
+
+
+class Monitor(object):
+    """Process wide sys.monitoring event dispatcher"""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.instances = {}
+        self.armed = set()
+        self.registered = False
+        self.stepping = False
+
+    def register(self):
+        if self.registered:
+            return True
+        try:
+            monitoring.use_tool_id(TOOL, 'wdb')
+        except ValueError:
+            log.warning(
+                'sys.monitoring debugger tool id is already in use '
+                'by %s' % monitoring.get_tool(TOOL)
+            )
+            return False
+        for event, callback in (
+            (E.PY_START, self.py_start),
+            (E.LINE, self.line),
+            (E.PY_RETURN, self.py_return),
+            (E.RAISE, self.raise_),
+            (E.PY_UNWIND, self.py_unwind),
+        ):
+            monitoring.register_callback(TOOL, event, callback)
+        self.registered = True
+        return True
+
+    def unregister(self):
+        if not self.registered:
+            return
+        monitoring.set_events(TOOL, 0)
+        for code in self.armed:
+            monitoring.set_local_events(TOOL, code, 0)
+        self.armed.clear()
+        for event in (E.PY_START, E.LINE, E.PY_RETURN, E.RAISE, E.PY_UNWIND):
+            monitoring.register_callback(TOOL, event, None)
+        monitoring.free_tool_id(TOOL)
+        self.registered = False
+
+    def start(self, wdb):
+        """Start dispatching the current thread events to `wdb`"""
+        with self.lock:
+            if not self.register():
+                return False
+            self.instances[threading.get_ident()] = wdb
+            self.update()
+        return True
+
+    def stop(self, wdb):
+        """Stop dispatching the current thread events"""
+        with self.lock:
+            for ident, instance in list(self.instances.items()):
+                if instance is wdb:
+                    del self.instances[ident]
+            if self.instances:
+                self.update()
+            else:
+                self.unregister()
+
+    def update(self):
+        """Recompute global events after a state or breakpoint change
+        and re-enable previously disabled locations.
+        Only stepping into needs global line events, stepping over or out
+        only listens to the state frame code and codes with breakpoints"""
+        with self.lock:
+            if not self.registered:
+                return
+            self.stepping = any(
+                isinstance(instance.state, Step)
+                for instance in self.instances.values()
+            )
+            for instance in self.instances.values():
+                frame = instance.state.frame
+                if frame is not None:
+                    self.arm(
+                        frame.f_code,
+                        E.PY_RETURN
+                        if isinstance(instance.state, Running)
+                        else ARMED_EVENTS,
+                    )
+                # Already running frames won't emit PY_START anymore
+                while frame is not None:
+                    if instance.needs_trace(frame.f_code):
+                        self.arm(frame.f_code)
+                    frame = frame.f_back
+            # Enable events last, this is called from non monitored code
+            monitoring.set_events(
+                TOOL, STEPPING_EVENTS if self.stepping else RUNNING_EVENTS
+            )
+            monitoring.restart_events()
+
+    def arm(self, code, events=None):
+        """Enable local events on code"""
+        if events is None:
+            events = ARMED_EVENTS
+        events |= monitoring.get_local_events(TOOL, code)
+        monitoring.set_local_events(TOOL, code, events)
+        self.armed.add(code)
+
+    def wanted(self, code):
+        """Return True if code must keep emitting events"""
+        if self.stepping:
+            return True
+        for instance in self.instances.values():
+            if instance.needs_trace(code) or (
+                instance.state.frame is not None
+                and instance.state.frame.f_code is code
+            ):
+                return True
+        return False
+
+    def dispatch(self, code, event, arg):
+        if code.co_filename.startswith(WDB_DIR):
+            # Never trace ourself
+            return DISABLE
+        wdb = self.instances.get(threading.get_ident())
+        frame = None
+        if wdb is not None:
+            # The monitored frame is 2 frames away from here
+            frame = sys._getframe(2)
+            wdb.trace_dispatch(frame, event, arg)
+        if self.wanted(code):
+            return
+        if frame is not None and event == 'call':
+            # No return event will come to uncache it
+            wdb.frame_depths.pop(frame, None)
+        return DISABLE
+
+    def py_start(self, code, offset):
+        rv = self.dispatch(code, 'call', None)
+        if rv is None and not self.stepping:
+            self.arm(code)
+        return rv
+
+    def line(self, code, line_number):
+        return self.dispatch(code, 'line', None)
+
+    def py_return(self, code, offset, retval):
+        return self.dispatch(code, 'return', retval)
+
+    def raise_(self, code, offset, exception):
+        # RAISE and PY_UNWIND can't be disabled
+        if code.co_filename.startswith(WDB_DIR):
+            return
+        wdb = self.instances.get(threading.get_ident())
+        if wdb is not None:
+            wdb.trace_dispatch(
+                sys._getframe(1),
+                'exception',
+                (type(exception), exception, exception.__traceback__),
+            )
+
+    def py_unwind(self, code, offset, exception):
+        # sys.settrace reports a None return on unwind
+        if code.co_filename.startswith(WDB_DIR):
+            return
+        wdb = self.instances.get(threading.get_ident())
+        if wdb is not None:
+            wdb.trace_dispatch(sys._getframe(1), 'return', None)
+
+
+_monitor = None
+
+
+def get_monitor():
+    """Get the process wide monitor, None if sys.monitoring is missing"""
+    global _monitor
+    if monitoring is None:
+        return
+    if _monitor is None:
+        _monitor = Monitor()
+    return _monitor
@@ -0,0 +1,194 @@
+"""Multiplexed server connection
+
+All the wdb sessions of a process share one connection to the server.
+The connection starts with a `MULTIPLEX` frame, then every frame is
+prefixed by the channel id of its session. As with a dedicated
+connection, the first frame of a channel is the session uuid, an empty
+frame closes the channel. The server pushes process wide messages on
+channel 0.
+"""
+import os
+import socket
+import threading
+from multiprocessing.connection import Client as Socket
+from struct import pack, unpack
+
+from ._compat import logger
+
+try:
+    from queue import Empty, Queue
+except ImportError:
+    from Queue import Empty, Queue
+
+log = logger('wdb.multiplex')
+
+MULTIPLEX = b'MULTIPLEX'
+# Put in channel queues when the channel or the connection is closed
+CLOSED = None
+
+
+class Channel(object):
+    """One session over the multiplexed connection, with the
+    multiprocessing connection interface used by wdb"""
+
+    def __init__(self, multiplexer, id):
+        self.multiplexer = multiplexer
+        self.id = id
+        self.queue = Queue()
+        self.pending = []
+        self.closed = False
+
+    def send_bytes(self, data):
+        if self.closed:
+            raise socket.error('Channel %d is closed' % self.id)
+        self.multiplexer.send(self.id, data)
+
+    def poll(self, timeout=0):
+        if self.pending:
+            return True
+        try:
+            self.pending.append(self.queue.get(timeout=timeout))
+        except Empty:
+            return False
+        return True
+
+    def recv_bytes(self):
+        data = self.pending.pop() if self.pending else self.queue.get()
+        if data is CLOSED:
+            self.closed = True
+            raise EOFError('Channel %d is closed' % self.id)
+        return data
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        self.multiplexer.close_channel(self.id)
+
+
+class Multiplexer(object):
+    """The process connection to the server"""
+
+    def __init__(self, address, on_push=None):
+        self.connection = Socket(address)
+        self.connection.send_bytes(MULTIPLEX)
+        self.on_push = on_push
+        # Set when the pushed messages keep the breakpoints up to date
+        self.synced = False
+        self.pid = os.getpid()
+        self.lock = threading.Lock()
+        self.channels = {}
+        self.next_id = 0
+        self.closed = False
+        reader = threading.Thread(target=self.read, name='wdb_multiplex')
+        reader.daemon = True
+        reader.start()
+
+    def open(self):
+        """Open a new channel"""
+        with self.lock:
+            self.next_id += 1
+            channel = self.channels[self.next_id] = Channel(
+                self, self.next_id
+            )
+        return channel
+
+    def send(self, id, data):
+        with self.lock:
+            self.connection.send_bytes(pack('!i', id) + data)
+
+    def close_channel(self, id):
+        self.channels.pop(id, None)
+        try:
+            self.send(id, b'')
+        except Exception:
+            log.debug('Connection lost on channel %d close' % id)
+
+    def push(self, message):
+        if not self.on_push:
+            return
+        try:
+            self.on_push(self, message)
+        except Exception:
+            log.exception('Error handling pushed message')
+            self.synced = False
+
+    def read(self):
+        """Dispatch received frames to their channel"""
+        try:
+            while True:
+                frame = self.connection.recv_bytes()
+                id, = unpack('!i', frame[:4])
+                if id == 0:
+                    self.push(frame[4:].decode('utf-8'))
+                    continue
+                channel = self.channels.get(id)
+                if channel is None:
+                    log.debug('Frame for unknown channel %d' % id)
+                    continue
+                channel.queue.put(frame[4:] or CLOSED)
+        except (EOFError, OSError):
+            log.warning('Multiplexed connection lost')
+        except Exception:
+            # The stream can't be read anymore
+            log.exception('Multiplexed connection broken')
+        with self.lock:
+            self.abandon()
+        for channel in list(self.channels.values()):
+            channel.closed = True
+            channel.queue.put(CLOSED)
+        self.channels.clear()
+
+    def abandon(self):
+        """Close the connection, without waking up the channels"""
+        self.closed = True
+        try:
+            self.connection.close()
+        except Exception:
+            log.debug('Error closing multiplexed connection', exc_info=True)
+
+
+_multiplexers = {}
+_lock = threading.Lock()
+
+
+def after_fork():
+    """Close the connections inherited from the parent process, their
+    reader threads are gone"""
+    global _lock
+    _lock = threading.Lock()
+    for multiplexer in _multiplexers.values():
+        multiplexer.abandon()
+    _multiplexers.clear()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=after_fork)
+
+
+def get_multiplexer(server, port, on_push=None):
+    """Get the connection of this process to the server at server:port,
+    raises socket.error if the server can't be reached"""
+    address = (server, port)
+    with _lock:
+        multiplexer = _multiplexers.get(address)
+        if multiplexer is not None and multiplexer.pid != os.getpid():
+            # Forked without register_at_fork
+            multiplexer.abandon()
+        if multiplexer is None or multiplexer.closed:
+            multiplexer = _multiplexers[address] = Multiplexer(
+                address, on_push
+            )
+        return multiplexer
+
+
+def find_multiplexer(server, port):
+    """Get the open connection of this process to server:port if any"""
+    multiplexer = _multiplexers.get((server, port))
+    if (
+        multiplexer is None
+        or multiplexer.closed
+        or multiplexer.pid != os.getpid()
+    ):
+        return None
+    return multiplexer
@@ -0,0 +1,195 @@
+"""Paths keeping an object alive
+
+To find who keeps an object alive, `Retention` walks its referrers
+breadth first until it reaches roots: modules and the frames of the
+running threads. The objects of a level are looked up together with one
+`gc.get_referrers()` call, as each call scans all the tracked objects.
+
+wdb's own objects and frames, like the handles of the inspect links,
+are skipped as they don't keep the object alive once the debugger
+continues. The walk is bounded in depth, objects and time.
+"""
+import gc
+import os
+import sys
+import time
+import types
+
+from ._compat import logger
+from .utils import get_referents
+
+log = logger('wdb.referrers')
+
+# Levels of referrers walked from the object
+REFERRERS_DEPTH = 20
+# Referrers visited
+REFERRERS_NODES = 10000
+# Seconds spent walking referrers
+REFERRERS_TIMEOUT = 5
+# Paths found
+REFERRERS_PATHS = 5
+
+WDB_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def stacks():
+    """The frames of the running threads but wdb ones. Their locals are
+    not listed by the gc"""
+    frames = []
+    for frame in sys._current_frames().values():
+        while frame is not None:
+            if not is_wdb(frame):
+                frames.append(frame)
+            frame = frame.f_back
+    return frames
+
+
+def f_locals(frame):
+    try:
+        return list(frame.f_locals.values())
+    except Exception:
+        return []
+
+
+def is_root(obj):
+    return isinstance(obj, (types.ModuleType, types.FrameType))
+
+
+def is_wdb(obj):
+    """Return True if obj belongs to wdb"""
+    if isinstance(obj, types.FrameType):
+        return os.path.dirname(
+            os.path.abspath(obj.f_code.co_filename)
+        ).startswith(WDB_DIR)
+    module = getattr(type(obj), '__module__', None) or ''
+    return module == 'wdb' or module.startswith('wdb.')
+
+
+def edge(referrer, obj):
+    """How referrer refers to obj, if known"""
+    try:
+        if isinstance(referrer, dict):
+            for key, value in referrer.items():
+                if value is obj:
+                    return '[%r]' % (key,)
+                if key is obj:
+                    return 'key'
+        elif isinstance(referrer, (list, tuple)):
+            for i, value in enumerate(referrer):
+                if value is obj:
+                    return '[%d]' % i
+        elif isinstance(referrer, types.FrameType):
+            for key, value in referrer.f_locals.items():
+                if value is obj:
+                    return 'local %s' % key
+        elif getattr(referrer, '__dict__', None) is obj:
+            return '__dict__'
+        else:
+            for key, value in getattr(referrer, '__dict__', {}).items():
+                if value is obj:
+                    return '.%s' % key
+    except Exception:
+        log.debug('Unable to find edge', exc_info=True)
+    return ''
+
+
+class Retention(object):
+    """Shortest paths from the roots to obj"""
+
+    def __init__(self, obj):
+        self.obj = obj
+        self.depth = REFERRERS_DEPTH
+        self.nodes = REFERRERS_NODES
+        self.timeout = REFERRERS_TIMEOUT
+        self.max_paths = REFERRERS_PATHS
+        self.paths = []
+        self.visited = 0
+        # Why the walk didn't end, None if it did
+        self.stopped = None
+
+    def find(self):
+        deadline = time.time() + self.timeout
+        frames = stacks()
+        # Objects and the id of the object they refer to, by id
+        objects = {id(self.obj): self.obj}
+        children = {}
+        level = [self.obj]
+        own = set([id(objects), id(children), id(frames)])
+
+        for depth in range(self.depth):
+            if not level:
+                break
+            if time.time() > deadline:
+                self.stopped = 'timed out after %ds' % self.timeout
+                break
+            # The arguments tuple refers to the level too
+            args = tuple(level)
+            own.update((id(level), id(args)))
+            ids = set(id(obj) for obj in level)
+            referrers = gc.get_referrers(*args) + [
+                frame
+                for frame in frames
+                if id(frame) not in objects
+                and any(id(value) in ids for value in f_locals(frame))
+            ]
+            own.add(id(referrers))
+            next_level = []
+            # Globals of modules, no need for longer paths through them
+            rooted = set()
+            for referrer in referrers:
+                if (
+                    id(referrer) in own
+                    or id(referrer) in objects
+                    or is_wdb(referrer)
+                ):
+                    continue
+                child = next(
+                    (
+                        referent
+                        for referent in (
+                            f_locals(referrer)
+                            if isinstance(referrer, types.FrameType)
+                            else get_referents(referrer)
+                        )
+                        if id(referent) in ids
+                    ),
+                    None,
+                )
+                if child is None:
+                    continue
+                objects[id(referrer)] = referrer
+                children[id(referrer)] = id(child)
+                self.visited += 1
+                if is_root(referrer):
+                    if isinstance(referrer, types.ModuleType):
+                        rooted.add(id(child))
+                    path = self.path(referrer, objects, children)
+                    own.update(id(step) for step in path)
+                    own.add(id(path))
+                    self.paths.append(path)
+                    if len(self.paths) >= self.max_paths:
+                        return self
+                else:
+                    next_level.append(referrer)
+                if self.visited >= self.nodes:
+                    self.stopped = '%d referrers visited' % self.nodes
+                    return self
+            del args, referrers
+            level = [
+                obj for obj in next_level if children[id(obj)] not in rooted
+            ]
+        else:
+            if level:
+                self.stopped = 'depth %d reached' % self.depth
+        return self
+
+    def path(self, root, objects, children):
+        """The (object, edge to the next object) from root to obj"""
+        path = []
+        obj = root
+        while obj is not self.obj:
+            child = objects[children[id(obj)]]
+            path.append((obj, edge(obj, child)))
+            obj = child
+        path.append((obj, ''))
+        return path
@@ -0,0 +1,292 @@
+# *-* coding: utf-8 *-*
+"""Repr of objects with inspect links and html decorations
+
+Containers are rendered recursively in one buffer, long ones abbreviated
+to their first and last items. Rendering is bounded in size and time:
+once the budget is spent the remaining items of each container are
+replaced by a link expanding them page by page.
+"""
+import heapq
+import time
+from collections import deque
+from itertools import islice
+from operator import itemgetter
+
+from ._compat import OrderedDict, escape
+from .timebox import EvaluationTimeout
+from .utils import IterableEllipsis
+
+# Rendered characters and seconds spent by a repr
+REPR_BUDGET = 256 * 1024
+REPR_TIMEOUT = 0.5
+# Same for full dumps
+DUMP_BUDGET = 4 * 1024 * 1024
+DUMP_TIMEOUT = 5
+# Items displayed by an expansion page
+PAGE_SIZE = 100
+
+TABLE = (
+    '<table class="mdl-data-table mdl-js-data-table '
+    'mdl-data-table--selectable mdl-shadow--2dp">'
+)
+key = itemgetter(0)
+
+
+def abbreviation(level):
+    """Maximum number of items displayed at `level`, and the number of
+    first and last ones displayed when there are more"""
+    max_ = 100
+    for i in range(1, min(level, 4)):
+        max_ /= 2
+    start = 10
+    end = 5
+    return max(start + end, int(max_)), start, end
+
+
+def first_last(iterable, start, end):
+    if isinstance(iterable, (list, tuple)):
+        return list(iterable[:start]), list(iterable[-end:])
+    iterator = iter(iterable)
+    return list(islice(iterator, start)), list(deque(iterator, maxlen=end))
+
+
+def remaining(entries):
+    return sum(
+        entry.size if isinstance(entry, IterableEllipsis) else 1
+        for entry in entries
+    )
+
+
+class Renderer(object):
+    """Render one object for a wdb instance"""
+
+    def __init__(self, db, html=True, full=False, context=None):
+        self.db = db
+        self.html = html
+        self.full = full
+        self.buffer = []
+        self.size = 0
+        # Containers being rendered, to detect recursions
+        self.visited = set(context or ())
+        self.budget = DUMP_BUDGET if full else REPR_BUDGET
+        self.timeout = DUMP_TIMEOUT if full else REPR_TIMEOUT
+        self.deadline = time.time() + self.timeout
+        self.truncated = False
+
+    def repr(self, obj, level=0):
+        self.render(obj, level)
+        return ''.join(self.buffer)
+
+    def container_repr(self, obj, level=1):
+        """Repr of a container, None for other objects"""
+        if self.container(obj, level):
+            return ''.join(self.buffer)
+
+    def page_repr(self, obj, offset, limit):
+        """Repr of the `limit` items of a container from `offset`,
+        the ones after the page size are linked to the next page"""
+        count = max(0, min(limit, PAGE_SIZE))
+        entries = self.slice(obj, offset, count)
+        if limit > count:
+            entries.append(IterableEllipsis(limit - count))
+        self.visited.add(id(obj))
+        if isinstance(obj, dict):
+            self.dict(obj, 1, entries, offset)
+        else:
+            self.iterable(obj, 1, entries, offset)
+        return ''.join(self.buffer)
+
+    def write(self, string):
+        self.buffer.append(string)
+        self.size += len(string)
+
+    def rollback(self, mark):
+        self.size -= sum(len(string) for string in self.buffer[mark:])
+        del self.buffer[mark:]
+
+    def exhausted(self):
+        if not self.truncated:
+            self.truncated = (
+                self.size > self.budget or time.time() > self.deadline
+            )
+        return self.truncated
+
+    def render(self, obj, level):
+        recursion = id(obj) in self.visited
+        if not recursion:
+            self.visited.add(id(obj))
+            mark = len(self.buffer)
+            try:
+                if self.container(obj, level + 1):
+                    return
+            except Exception:
+                self.rollback(mark)
+            finally:
+                self.visited.discard(id(obj))
+
+        try:
+            text = self.db.safe_repr(obj)
+        except EvaluationTimeout:
+            # Don't render the remaining items
+            self.truncated = True
+            self.write(self.db.timed_out(self.db.retry_repr(obj), self.html))
+            return
+
+        if self.html:
+            self.write(
+                '<a href="%d" class="inspect">%s%s</a>'
+                % (
+                    self.db.handles.add(obj),
+                    'Recursion of ' if recursion else '',
+                    escape(text),
+                )
+            )
+        else:
+            self.write('%s%s' % ('Recursion of ' if recursion else '', text))
+
+    def container(self, obj, level):
+        if isinstance(obj, dict):
+            self.dict(obj, level)
+            return True
+        if isinstance(obj, (list, set, tuple)):
+            self.iterable(obj, level)
+            return True
+        return False
+
+    def entries(self, obj, level, ordered=True):
+        """Items to display, with an ellipsis for the abbreviated ones"""
+        max_, start, end = abbreviation(level)
+        items = obj.items() if isinstance(obj, dict) else obj
+        if self.full or len(obj) <= max_:
+            return list(items) if ordered else sorted(items, key=key)
+        if ordered:
+            first, last = first_last(items, start, end)
+        else:
+            # Don't sort all the items to display a few
+            first = heapq.nsmallest(start, items, key=key)
+            last = heapq.nlargest(end, items, key=key)[::-1]
+        return first + [IterableEllipsis(len(obj) - start - end)] + last
+
+    def slice(self, obj, offset, count):
+        """The `count` items from `offset` in display order"""
+        if isinstance(obj, (list, tuple)):
+            return list(obj[offset : offset + count])
+        if isinstance(obj, dict) and not isinstance(obj, OrderedDict):
+            return heapq.nsmallest(offset + count, obj.items(), key=key)[
+                offset:
+            ]
+        items = obj.items() if isinstance(obj, dict) else obj
+        return list(islice(items, offset, offset + count))
+
+    def items(self, entries, separator, render, ellipsis, offset=0):
+        for i, entry in enumerate(entries):
+            if i:
+                self.write(separator)
+            if self.exhausted():
+                entry = IterableEllipsis(remaining(entries[i:]))
+            if isinstance(entry, IterableEllipsis):
+                # Position of the hidden items in the container
+                entry.offset = offset
+                ellipsis(entry)
+                offset += entry.size
+                if self.truncated:
+                    break
+            else:
+                render(entry)
+                offset += 1
+
+    def ellipsis(self, obj, ie):
+        more = '[%d more…]' % ie.size
+        if self.html:
+            more = '<a href="page/%d/%d/%d" class="inspect">%s</a>' % (
+                self.db.handles.add(obj),
+                ie.offset,
+                ie.size,
+                more,
+            )
+        return more
+
+    def dict(self, obj, level, entries=None, offset=0):
+        ordered = isinstance(obj, OrderedDict)
+        if type(obj) != dict:
+            self.write(type(obj).__name__ + '({')
+            closer = '})'
+        else:
+            self.write('{')
+            closer = '}'
+
+        def item(entry):
+            self.write(self.db.safe_repr(entry[0]) + ': ')
+            self.render(entry[1], level)
+
+        if entries is None and len(obj) <= 2:
+            items = obj.items() if ordered else sorted(obj.items(), key=key)
+            for i, entry in enumerate(items):
+                if i:
+                    self.write(', ')
+                item(entry)
+            self.write(closer)
+            return
+
+        indent = '\n' + '  ' * level
+        self.write(indent)
+        if entries is None:
+            entries = self.entries(obj, level, ordered)
+        if self.html:
+
+            def row(entry):
+                self.write(
+                    '<tr><td class="key">%s:</td><td class="val '
+                    'mdl-data-table__cell--non-numeric">'
+                    % self.db.safe_repr(entry[0])
+                )
+                self.render(entry[1], level)
+                self.write('</td></tr>')
+
+            def ellipsis_row(ie):
+                self.write(
+                    '<tr><td colspan="2" class="ellipse">%s</td></tr>'
+                    % self.ellipsis(obj, ie)
+                )
+
+            self.write(TABLE)
+            self.items(entries, '', row, ellipsis_row, offset)
+            self.write('</table>')
+        else:
+            self.items(
+                entries,
+                indent,
+                item,
+                lambda ie: self.write(self.ellipsis(obj, ie)),
+                offset,
+            )
+        self.write('\n' + '  ' * (level - 1) + closer)
+
+    def iterable(self, obj, level, entries=None, offset=0):
+        if type(obj) == list:
+            opener, closer = '[', ']'
+        elif type(obj) == set:
+            opener, closer = '{', '}'
+        elif type(obj) == tuple:
+            opener, closer = '(', ')'
+        else:
+            opener = escape(obj.__class__.__name__) + '(['
+            closer = '])'
+
+        if entries is None:
+            entries = self.entries(obj, level)
+        splitter = ', '
+        if len(entries) > 2 and self.html:
+            splitter += '\n' + '  ' * level
+            opener += '\n' + '  ' * level
+            closer = '\n' + '  ' * (level - 1) + closer
+
+        self.write(opener)
+        self.items(
+            entries,
+            splitter,
+            lambda val: self.render(val, level),
+            lambda ie: self.write(self.ellipsis(obj, ie)),
+            offset,
+        )
+        self.write(closer)
@@ -0,0 +1,167 @@
+"""Search of keys or values in the objects reachable from an object
+
+`find` walks dictionaries, lists, tuples and attributes breadth first,
+so the closest matches come first and deep graphs don't exhaust the
+stack. Each object is visited once and the walk stops when its depth,
+node, result or time budget is spent, or when it's cancelled. Matches
+are yielded as they are found to be streamed to the client.
+"""
+import sys
+import time
+import types
+from collections import deque
+
+from ._compat import escape, is_str, logger
+from .utils import LAZY, peek_attribute
+
+log = logger('wdb.search')
+
+# Levels of attributes or items walked from the searched object
+FIND_DEPTH = 10
+# Objects visited
+FIND_NODES = 100000
+# Matches found
+FIND_RESULTS = 500
+# Seconds spent searching
+FIND_TIMEOUT = 10
+# Matches sent at once, or after some seconds
+FIND_BATCH = 20
+FIND_FLUSH = 0.5
+# Objects visited between checks for cancellation
+CANCEL_CHECK = 1000
+
+# Values which are not walked
+LEAVES = (type(None), bool, int, float, complex, bytes)
+# Attribute values created at each access
+BOUND_METHODS = (
+    types.MethodType,
+    types.BuiltinMethodType,
+    type(object().__str__),
+)
+
+
+def key_matcher(key):
+    """Match the attributes and string keys containing key"""
+    marked = '<mark>%s</mark>' % escape(key)
+
+    def match(name, value):
+        if key in name:
+            return escape(name).replace(escape(key), marked)
+
+    return match
+
+
+def value_matcher(source):
+    """Match the values for which the expression `source` of x is true,
+    compiled once for all the values"""
+    code = compile(source, '<find>', 'eval')
+
+    def match(name, value):
+        try:
+            if eval(code, {'x': value}):
+                return escape(name)
+        except Exception:
+            pass
+
+    return match
+
+
+class Search(object):
+    """Breadth first search of the objects reachable from obj"""
+
+    def __init__(self, match, obj, path, cancelled=None):
+        self.match = match
+        self.obj = obj
+        self.path = path
+        self.cancelled = cancelled
+        self.depth = FIND_DEPTH
+        self.nodes = FIND_NODES
+        self.results = FIND_RESULTS
+        self.timeout = FIND_TIMEOUT
+        self.visited = 0
+        self.found = 0
+        # Why the search didn't walk everything, None if it did
+        self.stopped = None
+
+    def __iter__(self):
+        """Yield the (path, value) of the matches"""
+        deadline = time.time() + self.timeout
+        seen = set([id(self.obj)])
+        queue = deque([(self.obj, self.path, 0)])
+        while queue:
+            obj, path, depth = queue.popleft()
+            self.visited += 1
+            if self.visited > self.nodes:
+                self.stopped = '%d objects visited' % self.nodes
+                return
+            if not self.visited % CANCEL_CHECK:
+                if time.time() > deadline:
+                    self.stopped = 'timed out after %ds' % self.timeout
+                    return
+                if self.cancelled and self.cancelled():
+                    self.stopped = 'cancelled'
+                    return
+
+            for kind, name, value in self.children(obj):
+                label = self.match(name, value)
+                if label is not None:
+                    yield self.child_path(path, kind, label), value
+                    self.found += 1
+                    if self.found >= self.results:
+                        self.stopped = '%d matches found' % self.results
+                        return
+
+                if isinstance(value, LEAVES) or is_str(value):
+                    continue
+                if id(value) in seen:
+                    continue
+                if depth + 1 >= self.depth:
+                    self.stopped = 'depth %d reached' % self.depth
+                    continue
+                seen.add(id(value))
+                queue.append(
+                    (
+                        value,
+                        self.child_path(path, kind, escape(name)),
+                        depth + 1,
+                    )
+                )
+
+    def child_path(self, path, kind, label):
+        if kind == 'key':
+            return "%s['%s']" % (path, label)
+        if kind == 'item':
+            return '%s[%s]' % (path, label)
+        return '%s.%s' % (path, label)
+
+    def children(self, obj):
+        """The (kind, name, value) of the items and attributes of obj"""
+        if isinstance(obj, dict):
+            try:
+                items = list(obj.items())
+            except Exception:
+                items = []
+            for key, value in items:
+                if is_str(key) and not isinstance(value, type(sys)):
+                    yield 'key', key, value
+
+        elif isinstance(obj, (list, tuple)):
+            for i, value in enumerate(obj):
+                if not isinstance(value, type(sys)):
+                    yield 'item', str(i), value
+
+        try:
+            names = dir(obj)
+        except Exception:
+            log.debug('dir failed on %s' % type(obj), exc_info=True)
+            return
+        for name in names:
+            if name.startswith('__') and name != '__class__':
+                continue
+            # Don't run properties or __getattr__ of the searched objects
+            value = peek_attribute(obj, name)[1]
+            if value is LAZY or isinstance(
+                value, BOUND_METHODS + (type(sys),)
+            ):
+                continue
+            yield 'attr', name, value
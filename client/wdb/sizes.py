@@ -0,0 +1,155 @@
+# *-* coding: utf-8 *-*
+"""Deep size of objects
+
+The deep size of an object is its size plus the size of the objects it
+holds: items of containers, `__dict__` and `__slots__` attributes and
+buffers. Each object is counted once, even if held several times.
+Modules, classes and functions are shared and not counted.
+
+Numpy arrays count their data with `nbytes` without walking their items,
+unless these are python objects. The walk stops at a node or time budget,
+the size is then a lower bound.
+"""
+import sys
+import time
+import types
+from array import array
+
+from ._compat import logger
+from .utils import human_size, type_name
+
+log = logger('wdb.sizes')
+
+# Objects walked and seconds spent for a dump
+SIZE_NODES = 1000000
+SIZE_TIMEOUT = 1
+# Same for a watcher, computed at each step
+WATCH_SIZE_NODES = 10000
+WATCH_SIZE_TIMEOUT = 0.05
+# Objects walked between checks of the time
+SIZE_CHECK = 1000
+
+SHARED = (
+    types.ModuleType,
+    type,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    types.CodeType,
+    types.FrameType,
+)
+# Containers walked by items
+ITEMS = (tuple, list, set, frozenset)
+# Types holding no other objects
+ATOMS = (type(None), bool, int, float, complex, str, bytes, bytearray, array)
+
+
+def sizeof(obj):
+    try:
+        return sys.getsizeof(obj, 0)
+    except Exception:
+        return 0
+
+
+def slots(type_):
+    """The slot names of type_ and its bases"""
+    names = []
+    for klass in getattr(type_, '__mro__', ()):
+        slot = klass.__dict__.get('__slots__', ())
+        names.extend((slot,) if isinstance(slot, str) else slot)
+    return [name for name in names if name not in ('__dict__', '__weakref__')]
+
+
+def is_ndarray(type_):
+    return any(
+        type_name(klass) == 'numpy.ndarray'
+        for klass in getattr(type_, '__mro__', ())
+    )
+
+
+class DeepSize(object):
+    """Size of obj and of the objects it holds"""
+
+    def __init__(self, obj, nodes=SIZE_NODES, timeout=SIZE_TIMEOUT):
+        self.obj = obj
+        self.nodes = nodes
+        self.timeout = timeout
+        self.size = 0
+        self.objects = 0
+        self.complete = True
+
+    def __str__(self):
+        return '%s%s' % (
+            '≥ ' if not self.complete else '',
+            human_size(self.size),
+        )
+
+    def measure(self):
+        deadline = time.time() + self.timeout
+        seen = set()
+        stack = [self.obj]
+        while stack:
+            obj = stack.pop()
+            if id(obj) in seen or (
+                obj is not self.obj and isinstance(obj, SHARED)
+            ):
+                continue
+            seen.add(id(obj))
+            self.objects += 1
+            if self.objects > self.nodes or (
+                not self.objects % SIZE_CHECK and time.time() > deadline
+            ):
+                self.complete = False
+                break
+            self.size += sizeof(obj)
+            try:
+                stack.extend(self.children(obj))
+            except Exception:
+                log.debug('Unable to walk %s' % type(obj), exc_info=True)
+        return self
+
+    def children(self, obj):
+        if isinstance(obj, ATOMS):
+            return ()
+        if isinstance(obj, dict):
+            return [item for items in obj.items() for item in items]
+        if isinstance(obj, ITEMS):
+            return obj
+        if is_ndarray(type(obj)):
+            return self.array_children(obj)
+        if isinstance(obj, memoryview):
+            return (obj.obj,)
+
+        children = []
+        dict_ = getattr(obj, '__dict__', None)
+        if isinstance(dict_, dict):
+            children.append(dict_)
+        for name in slots(type(obj)):
+            try:
+                children.append(getattr(obj, name))
+            except AttributeError:
+                pass
+        if not children and not hasattr(obj, '__iter__'):
+            self.size += self.buffer_size(obj)
+        return children
+
+    def array_children(self, ndarray):
+        """Arrays owning their data count its nbytes in their size, views
+        refer to the array owning it"""
+        children = [] if ndarray.base is None else [ndarray.base]
+        if ndarray.dtype.hasobject:
+            children.extend(ndarray.flat)
+        return children
+
+    def buffer_size(self, obj):
+        """Size of the buffer of objects supporting the buffer protocol
+        not counted by their sys.getsizeof"""
+        try:
+            return max(0, memoryview(obj).nbytes - sizeof(obj))
+        except TypeError:
+            return 0
+
+
+def deep_size(obj, nodes=SIZE_NODES, timeout=SIZE_TIMEOUT):
+    """Human readable deep size of obj"""
+    return str(DeepSize(obj, nodes, timeout).measure())
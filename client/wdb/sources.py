@@ -0,0 +1,54 @@
+"""Sources of the code compiled by wdb
+
+Evaluated snippets are compiled with a unique filename, so a code object
+is identified by its `co_filename` even after its id is reused, and their
+source is registered in linecache for the trace and the tracebacks.
+Only the most recent sources are kept.
+"""
+import linecache
+import threading
+from itertools import count
+
+from ._compat import OrderedDict
+
+# Evaluated sources kept in linecache
+COMPILE_CACHE_SIZE = 256
+
+
+class CompileCache(object):
+    """Process wide bounded registry of the evaluated sources"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counter = count(1)
+        # Most recent last
+        self.sources = OrderedDict()
+
+    def compile(self, source, name='<stdin>', mode='exec'):
+        """Compile source under a unique filename and register it"""
+        filename = '<%s-%d>' % (name.strip('<>'), next(self.counter))
+        code = compile(source, filename, mode)
+        self.register(filename, source)
+        return code
+
+    def register(self, filename, source):
+        lines = source.splitlines(True)
+        if lines and not lines[-1].endswith('\n'):
+            lines[-1] += '\n'
+        with self.lock:
+            self.sources[filename] = source
+            # No mtime: checkcache keeps it
+            linecache.cache[filename] = (len(source), None, lines, filename)
+            while len(self.sources) > COMPILE_CACHE_SIZE:
+                evicted, _ = self.sources.popitem(last=False)
+                linecache.cache.pop(evicted, None)
+
+    def get(self, code):
+        """Source of the snippet `code` comes from, None if evicted"""
+        return self.sources.get(code.co_filename)
+
+    def __len__(self):
+        return len(self.sources)
+
+
+compile_cache = CompileCache()
@@ -0,0 +1,205 @@
+# *-* coding: utf-8 *-*
+"""Short reprs of large objects
+
+Some types like numpy arrays or pandas data frames have a huge or slow
+repr. A summary renderer registered for the type is used instead, with
+an inspect link to the object as for any repr.
+
+Renderers are registered by the dotted name of the type, so wdb never
+imports the libraries itself. Other packages can register theirs in the
+`wdb.summaries` entry point group, named after the type they render:
+
+    entry_points={'wdb.summaries': [
+        'mylib.Tensor = mylib.debug:summary'
+    ]}
+
+A renderer is called with the object and a `Budget`, it returns a string
+or None to fall back to repr.
+"""
+import time
+import weakref
+from itertools import islice
+
+from ._compat import logger
+from .utils import human_size
+
+log = logger('wdb.summaries')
+
+ENTRY_POINTS = 'wdb.summaries'
+# Items used to compute statistics, larger objects are sampled
+SUMMARY_ITEMS = 1000000
+# Characters of a summary
+SUMMARY_SIZE = 4096
+# Seconds after which a renderer should stop adding details
+SUMMARY_TIMEOUT = 0.2
+
+summaries = {}
+_entry_points = None
+_renderers = weakref.WeakKeyDictionary()
+
+
+class Budget(object):
+    """Limits of a summary"""
+
+    def __init__(self):
+        self.items = SUMMARY_ITEMS
+        self.size = SUMMARY_SIZE
+        self.deadline = time.time() + SUMMARY_TIMEOUT
+
+    def expired(self):
+        return time.time() > self.deadline
+
+
+def summary(*names):
+    """Register the decorated function as renderer of the types named"""
+
+    def register(renderer):
+        for name in names:
+            summaries[name] = renderer
+        _renderers.clear()
+        return renderer
+
+    return register
+
+
+def entry_points():
+    global _entry_points
+    if _entry_points is None:
+        _entry_points = {}
+        try:
+            from importlib.metadata import entry_points as get_entry_points
+        except ImportError:
+            return _entry_points
+        try:
+            found = get_entry_points(group=ENTRY_POINTS)
+        except TypeError:
+            found = get_entry_points().get(ENTRY_POINTS, [])
+        except Exception:
+            log.exception('Unable to list summary renderers')
+            found = []
+        for entry_point in found:
+            _entry_points[entry_point.name] = entry_point
+    return _entry_points
+
+
+def lookup(name):
+    if name not in summaries and name in entry_points():
+        try:
+            summaries[name] = entry_points()[name].load()
+        except Exception:
+            log.exception('Unable to load summary renderer for %s' % name)
+            summaries[name] = None
+    return summaries.get(name)
+
+
+def get_renderer(type_):
+    """Renderer of type_ or of its closest base class, None if there is
+    none"""
+    try:
+        return _renderers[type_]
+    except KeyError:
+        pass
+    except TypeError:
+        return
+    renderer = None
+    for klass in getattr(type_, '__mro__', ()):
+        renderer = lookup(
+            '%s.%s' % (klass.__module__, getattr(klass, '__name__', ''))
+        )
+        if renderer is not None:
+            break
+    _renderers[type_] = renderer
+    return renderer
+
+
+def summarize(obj):
+    """Summary of obj, None if there is no renderer for its type"""
+    renderer = get_renderer(type(obj))
+    if renderer is None:
+        return
+    budget = Budget()
+    try:
+        text = renderer(obj, budget)
+    except Exception:
+        log.debug('Summary of %s failed' % type(obj), exc_info=True)
+        return
+    if text is not None and len(text) > budget.size:
+        text = text[: budget.size] + '…'
+    return text
+
+
+def sample(array, budget):
+    """Flat array of at most budget.items items"""
+    step = array.size // budget.items + 1
+    return array.flat[::step], step > 1
+
+
+@summary('numpy.ndarray')
+def ndarray(array, budget):
+    text = '%s(shape=%s, dtype=%s' % (
+        type(array).__name__,
+        array.shape,
+        array.dtype,
+    )
+    if array.size and array.dtype.kind in 'biuf':
+        values, sampled = sample(array, budget)
+        text += ', min=%s, max=%s, mean=%s' % (
+            values.min(),
+            values.max(),
+            values.mean(),
+        )
+        if sampled:
+            text += ' (sampled)'
+    return text + ')'
+
+
+def head_tail(frame, rows=5):
+    if len(frame) <= 2 * rows:
+        return frame.to_string()
+    return '%s\n...\n%s' % (
+        frame.head(rows).to_string(),
+        frame.tail(rows).to_string(header=False),
+    )
+
+
+# Recent pandas versions set the __module__ of their public types
+@summary('pandas.DataFrame', 'pandas.core.frame.DataFrame')
+def dataframe(frame, budget):
+    rows, columns = frame.shape
+    lines = ['%s %d rows × %d columns' % (type(frame).__name__, rows, columns)]
+    lines.append(
+        ', '.join(
+            '%s: %s' % (name, dtype)
+            for name, dtype in islice(frame.dtypes.items(), 20)
+        )
+        + (', …' if columns > 20 else '')
+    )
+    if budget.expired():
+        return '\n'.join(lines)
+    lines.append(
+        'memory: %s'
+        % human_size(
+            frame.memory_usage(index=True, deep=rows <= budget.items).sum()
+        )
+    )
+    if not budget.expired():
+        lines.append(head_tail(frame.iloc[:, :20]))
+    return '\n'.join(lines)
+
+
+@summary('pandas.Series', 'pandas.core.series.Series')
+def series(series, budget):
+    lines = [
+        '%s %s%d rows, dtype: %s'
+        % (
+            type(series).__name__,
+            '' if series.name is None else '%s ' % series.name,
+            len(series),
+            series.dtype,
+        ),
+        'memory: %s'
+        % human_size(series.memory_usage(deep=len(series) <= budget.items)),
+    ]
+    if not budget.expired():
+        lines.append(head_tail(series))
+    return '\n'.join(lines)
@@ -0,0 +1,240 @@
+"""Process wide importmagic symbol index
+
+The index is used to suggest imports on NameError. Scanning sys.path is
+expensive, so it is built once per process, in the background, the
+first time it is needed.
+
+Each sys.path directory is indexed separately and saved in a cache
+directory per interpreter, so other processes load it from disk and only
+index again the directories modified since.
+"""
+import os
+import sys
+import threading
+from hashlib import sha1
+
+from ._compat import logger
+
+try:
+    import importmagic
+except ImportError:
+    importmagic = None
+
+log = logger('wdb.symbols')
+
+# Directory where symbol indexes are saved, empty to disable
+SYMBOLS_CACHE = os.getenv(
+    'WDB_SYMBOLS_CACHE',
+    os.path.join(
+        os.getenv('XDG_CACHE_HOME', os.path.expanduser('~/.cache')),
+        'wdb',
+        'symbols',
+    ),
+)
+# Cache key of the builtin modules index
+BUILTINS = '<builtins>'
+
+
+def cache_directory():
+    """Cache directory of the running interpreter"""
+    key = '%s %s' % (sys.executable, sys.version)
+    return os.path.join(
+        SYMBOLS_CACHE, sha1(key.encode('utf-8')).hexdigest()[:16]
+    )
+
+
+def cache_file(path):
+    return os.path.join(
+        cache_directory(), sha1(path.encode('utf-8')).hexdigest() + '.json'
+    )
+
+
+def mtime(path):
+    if path == BUILTINS:
+        # Cache directory is already per interpreter
+        return 0
+    return os.stat(path).st_mtime
+
+
+def load(path):
+    """Load the index of `path` if saved since its last modification"""
+    if not SYMBOLS_CACHE:
+        return
+    try:
+        with open(cache_file(path)) as file:
+            header = file.readline().split(' ', 1)
+            if float(header[0]) != mtime(path):
+                return
+            return importmagic.SymbolIndex.deserialize(file)
+    except Exception:
+        return
+
+
+def build(path):
+    """Index `path` and save the result"""
+    modified = mtime(path)
+    index = importmagic.SymbolIndex()
+    if path == BUILTINS:
+        index.build_index([])
+    else:
+        for filename in os.listdir(path):
+            index.index_path(os.path.join(path, filename))
+    if SYMBOLS_CACHE:
+        filename = cache_file(path)
+        try:
+            if not os.path.isdir(os.path.dirname(filename)):
+                os.makedirs(os.path.dirname(filename))
+            with open(filename + '.tmp', 'w') as file:
+                file.write('%r %s\n' % (modified, path))
+                index.serialize(file)
+            # Atomic for other processes reading it
+            os.rename(filename + '.tmp', filename)
+        except (IOError, OSError):
+            log.warning('Unable to save symbol index in %s' % filename)
+    return index
+
+
+class Indexes(object):
+    """Indexes of several paths queried as one"""
+
+    def __init__(self, indexes):
+        self.indexes = indexes
+
+    def symbol_scores(self, symbol):
+        scores = []
+        for index in self.indexes:
+            scores.extend(index.symbol_scores(symbol))
+        scores.sort(key=lambda score: score[0], reverse=True)
+        seen = set()
+        unique = []
+        for score, module, variable in scores:
+            if (module, variable) not in seen:
+                seen.add((module, variable))
+                unique.append((score, module, variable))
+        return unique
+
+
+class ImportIndex(object):
+    """Lazily built importmagic index shared by all wdb instances"""
+
+    def __init__(self):
+        self.reset()
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self.after_fork)
+
+    def reset(self):
+        self.lock = threading.Lock()
+        self.index = None
+        # Pids of the processes loading and building the index
+        self.loader = None
+        self.builder = None
+        self.complete = False
+
+    def after_fork(self):
+        if not self.complete:
+            # A build in progress is lost with its thread
+            self.reset()
+        else:
+            self.lock = threading.Lock()
+
+    def get(self):
+        """Return the index, None if nothing is loaded yet.
+        The first call starts building it."""
+        if importmagic is None:
+            return
+        if not self.complete:
+            self.start()
+        return self.index
+
+    def preload(self):
+        """Start loading the indexes saved for this interpreter, without
+        indexing what is missing"""
+        if (
+            importmagic is None
+            or not SYMBOLS_CACHE
+            or not os.path.isdir(cache_directory())
+        ):
+            return
+        with self.lock:
+            if os.getpid() in (self.loader, self.builder):
+                return
+            self.loader = os.getpid()
+        self.run(self.load_saved, 'wdb_importmagic_load_index')
+
+    def start(self):
+        with self.lock:
+            if self.builder == os.getpid():
+                return
+            if self.builder is not None and not self.complete:
+                # Forked while building, without register_at_fork
+                self.index = None
+            self.builder = os.getpid()
+        self.run(self.build, 'wdb_importmagic_build_index')
+
+    def run(self, target, name):
+        thread = threading.Thread(target=target, name=name)
+        # Don't wait for completion, let it die alone:
+        thread.daemon = True
+        thread.start()
+
+    def paths(self):
+        return [BUILTINS] + [
+            path
+            for path in (path or '.' for path in sys.path)
+            if os.path.isdir(path)
+        ]
+
+    def load_saved(self):
+        indexes = [
+            index for index in map(load, self.paths()) if index is not None
+        ]
+        with self.lock:
+            # The build may have been faster
+            if indexes and self.index is None and self.loader == os.getpid():
+                self.index = Indexes(indexes)
+
+    def build(self):
+        paths = self.paths()
+        indexes = {}
+        for path in paths:
+            index = load(path)
+            if index is not None:
+                indexes[path] = index
+        if len(indexes) != len(paths):
+            if indexes:
+                # Use what is up to date while indexing the rest
+                self.ready(Indexes(list(indexes.values())))
+            log.info('Indexing imports')
+            for path in paths:
+                if path not in indexes:
+                    try:
+                        indexes[path] = build(path)
+                    except Exception:
+                        log.warning('Failed to index %s' % path)
+        self.ready(
+            Indexes([indexes[path] for path in paths if path in indexes]),
+            True,
+        )
+        log.info('Indexing imports done')
+
+    def ready(self, index, complete=False):
+        with self.lock:
+            if self.builder == os.getpid():
+                self.index = index
+                self.complete = complete
+
+    def suggest(self, name):
+        """Imports defining `name`, None if the index is not ready"""
+        index = self.get()
+        if index is None:
+            return
+        imports = []
+        for _, module, variable in index.symbol_scores(name):
+            if variable is None:
+                imports.append('import %s' % module)
+            else:
+                imports.append('from %s import %s' % (module, variable))
+        return imports
+
+
+import_index = ImportIndex()
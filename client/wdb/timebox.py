@@ -0,0 +1,174 @@
+"""Time boxed evaluation of user code
+
+Reprs, watchers or dumps run user code which can be slow or hang, like a
+lazy ORM relationship hitting the database. `time_box` interrupts the
+current thread when its time is over by raising `EvaluationTimeout` in
+it asynchronously. Unlike `timeout_of` and SIGALRM it works in any
+thread, but code blocked in C is only interrupted when it returns.
+"""
+import ctypes
+import os
+import threading
+import time
+
+from ._compat import logger
+
+log = logger('wdb.timebox')
+
+try:
+    set_async_exc = ctypes.pythonapi.PyThreadState_SetAsyncExc
+except AttributeError:
+    # Not CPython, evaluations are not interrupted
+    set_async_exc = None
+
+# Seconds given to watchers, dumps and diffs
+EVALUATION_TIMEOUT = 2
+# Seconds given to an evaluation retried on demand
+RETRY_TIMEOUT = 30
+# Seconds waited for an exception sent at the end of a block
+DRAIN_TIMEOUT = 0.1
+# Seconds slept between checks that it was raised
+DRAIN_SLEEP = 0.001
+
+try:
+    get_ident = threading.get_ident
+except AttributeError:
+    get_ident = threading._get_ident
+
+
+class EvaluationTimeout(BaseException):
+    """Raised in a thread when its evaluation takes too long.
+    Not an Exception so user code doesn't catch it."""
+
+    def __init__(self, *args):
+        # Created by the interpreter when the exception is raised
+        watchdog.pending.discard(get_ident())
+        BaseException.__init__(self, *args)
+
+
+class Retry(object):
+    """A timed out evaluation that can be retried on demand, function
+    returns the message to send"""
+
+    def __init__(self, description, function):
+        self.description = description
+        self.function = function
+
+
+class Watchdog(object):
+    """Thread raising EvaluationTimeout in threads past a deadline.
+    Each thread has a stack of time boxes, the outermost one past its
+    deadline expires and the others wait for it to be exited."""
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.stacks = {}
+        # Threads with an EvaluationTimeout sent but not raised yet
+        self.pending = set()
+        self.pid = None
+
+    def start(self, box):
+        """Push box on the stack of the current thread"""
+        ident = get_ident()
+        with self.condition:
+            if self.pid != os.getpid():
+                # Forked: watchdog thread and other threads are gone
+                self.stacks.clear()
+                self.pending.clear()
+                self.pid = os.getpid()
+                watchdog = threading.Thread(
+                    target=self.run, name='wdb_watchdog'
+                )
+                watchdog.daemon = True
+                watchdog.start()
+            self.stacks.setdefault(ident, []).append(box)
+            self.condition.notify()
+
+    def stop(self, box):
+        """Pop box from the stack of the current thread, return True if
+        an outer box has expired"""
+        ident = get_ident()
+        with self.condition:
+            stack = self.stacks.get(ident, [])
+            if box in stack:
+                stack.remove(box)
+            if not stack:
+                self.stacks.pop(ident, None)
+            return any(outer.expired for outer in stack)
+
+    def run(self):
+        with self.condition:
+            while True:
+                now = time.time()
+                waiting = []
+                for ident, stack in self.stacks.items():
+                    if ident in self.pending or any(
+                        box.expired for box in stack
+                    ):
+                        continue
+                    expired = [box for box in stack if box.deadline <= now]
+                    if not expired:
+                        waiting.append(min(box.deadline for box in stack))
+                        continue
+                    expired[0].expired = True
+                    self.pending.add(ident)
+                    log.warning('Interrupting evaluation in %d' % ident)
+                    set_async_exc(
+                        ctypes.c_ulong(ident),
+                        ctypes.py_object(EvaluationTimeout),
+                    )
+                self.condition.wait(
+                    max(0, min(waiting) - now) if waiting else None
+                )
+
+
+watchdog = Watchdog()
+
+
+class time_box(object):
+    """Raise EvaluationTimeout in the block after `time` seconds.
+    The timeout of a nested box is raised through the inner boxes up to
+    the box which expired: code catching EvaluationTimeout must re-raise
+    it if its box has not `expired`."""
+
+    def __init__(self, time):
+        self.time = time
+        self.deadline = None
+        self.expired = False
+
+    def __enter__(self):
+        self.expired = False
+        if set_async_exc is not None:
+            self.deadline = time.time() + self.time
+            watchdog.start(self)
+        return self
+
+    def __exit__(self, type_, value, traceback):
+        if self.deadline is None:
+            return
+        outer = False
+        while True:
+            try:
+                outer = watchdog.stop(self)
+                if self.expired or outer:
+                    drain()
+                break
+            except EvaluationTimeout:
+                # Raised right at the end of the block
+                pass
+        if outer and type_ is not EvaluationTimeout:
+            # Caught in the block or raised after it, up to the outer box
+            raise EvaluationTimeout()
+
+
+def drain():
+    """Let an EvaluationTimeout sent but not raised yet be raised here.
+    Clearing it with PyThreadState_SetAsyncExc(ident, NULL) leaves the
+    interpreter checking for it on every instruction."""
+    ident = get_ident()
+    deadline = time.time() + DRAIN_TIMEOUT
+    while ident in watchdog.pending:
+        if time.time() > deadline:
+            log.warning('EvaluationTimeout not raised in %d' % ident)
+            return
+        time.sleep(DRAIN_SLEEP)
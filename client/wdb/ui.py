@@ -31,11 +31,40 @@ from .utils import (
     executable_line,
     get_doc,
     get_source,
+    human_size,
     importable_module,
     inplace,
-    search_key_in_obj,
-    search_value_in_obj,
     timeout_of,
+    type_name,
+)
+from .allocations import (
+    ALLOCATIONS_FRAMES,
+    ALLOCATIONS_TOP,
+    GROUPS,
+    SYNTAX,
+    tracemalloc,
+)
+from .census import CENSUS_PAGE, SORTS, Census
+from .handles import RELEASED
+from .referrers import Retention
+from .render import TABLE
+from .search import (
+    FIND_BATCH,
+    FIND_FLUSH,
+    FIND_TIMEOUT,
+    Search,
+    key_matcher,
+    value_matcher,
+)
+from .sizes import WATCH_SIZE_NODES, WATCH_SIZE_TIMEOUT, deep_size
+from .sources import compile_cache
+from .symbols import import_index
+from .timebox import (
+    EVALUATION_TIMEOUT,
+    RETRY_TIMEOUT,
+    EvaluationTimeout,
+    Retry,
+    time_box,
 )
 
 try:
@@ -130,6 +159,8 @@ class Interaction(object):
         self.locals = list(map(lambda x: x[0].f_locals, self.stack))
         self.htmldiff = Html5Diff(4)
         self.timeout = timeout
+        # Saved symbol indexes load fast enough to be ready for the prompt
+        import_index.preload()
 
         if self.shell:
             self.locals[self.index] = shell_vars or {}
@@ -277,9 +308,15 @@ class Interaction(object):
     def update_watchers(self):
         watched = {}
         for watcher in self.db.watchers[self.current_file]:
+            box = time_box(EVALUATION_TIMEOUT)
             try:
-                watched[watcher] = self.db.safe_better_repr(
-                    eval_(watcher, self.get_globals(), self.current_locals)
+                with box:
+                    watched[watcher] = self.watch(watcher)
+            except EvaluationTimeout:
+                if not box.expired:
+                    raise
+                watched[watcher] = self.db.timed_out(
+                    Retry(watcher, self.retry_watch(watcher))
                 )
             except Exception as e:
                 watched[watcher] = type(e).__name__
@@ -348,6 +385,45 @@ class Interaction(object):
             % dump({'frame': self.current, 'name': fn, 'file': file})
         )
 
+    def watch(self, watcher):
+        value = eval_(watcher, self.get_globals(), self.current_locals)
+        return '%s <small class="size">%s</small>' % (
+            self.db.safe_better_repr(value),
+            deep_size(value, WATCH_SIZE_NODES, WATCH_SIZE_TIMEOUT),
+        )
+
+    def retry_watch(self, watcher):
+        def retry():
+            return 'Print|%s' % dump(
+                {'for': watcher, 'result': self.watch(watcher)}
+            )
+
+        return retry
+
+    def time_boxed(self, description, function, timeout=EVALUATION_TIMEOUT):
+        """Run function and send the message it returns once out of the
+        time box, if it takes longer than timeout send a placeholder to
+        retry it"""
+        box = time_box(timeout)
+        try:
+            with box:
+                message = function()
+        except EvaluationTimeout:
+            if not box.expired:
+                raise
+            self.db.send(
+                'Echo|%s'
+                % dump(
+                    {
+                        'for': escape(description),
+                        'val': self.db.timed_out(Retry(description, function)),
+                    }
+                )
+            )
+            return
+        if message:
+            self.db.send(message)
+
     def do_inspect(self, data):
         if '/' in data:
             mode, data = data.split('/', 1)
@@ -355,10 +431,69 @@ class Interaction(object):
             mode = 'inspect'
 
         try:
-            thing = self.db.obj_cache.get(int(data))
+            if mode == 'page':
+                handle, offset, limit = map(int, data.split('/'))
+            elif mode == 'census':
+                handle, offset = map(int, data.split('/'))
+            elif mode == 'attr':
+                handle, key = data.split('/', 1)
+                handle = int(handle)
+            else:
+                handle = int(data)
         except Exception:
             self.fail('Inspect')
             return
+        thing = self.db.handles.get(handle, RELEASED)
+        if thing is RELEASED:
+            self.fail(
+                'Inspect',
+                title='Object released',
+                message='This object is not available anymore',
+            )
+            return
+
+        if mode == 'retry':
+            self.time_boxed(thing.description, thing.function, RETRY_TIMEOUT)
+            return
+        if mode == 'page':
+            self.db.send(
+                'Print|%s'
+                % dump(
+                    {
+                        'for': '%s[%d:%d]'
+                        % (type(thing).__name__, offset, offset + limit),
+                        'result': self.db.page_repr(thing, offset, limit),
+                    }
+                )
+            )
+            return
+
+        if mode == 'census':
+            self.send_census(thing, offset)
+            return
+
+        if mode == 'referrers':
+            self.send_referrers(thing, type_name(type(thing)))
+            return
+
+        if mode == 'attr':
+            description = '%s.%s' % (type(thing).__name__, key)
+
+            def print_attribute():
+                try:
+                    value = getattr(thing, key)
+                except Exception:
+                    return self.failure('Inspect')
+                return 'Print|%s' % dump(
+                    {
+                        'for': description,
+                        'result': self.db.safe_better_repr(value),
+                    }
+                )
+
+            self.time_boxed(description, print_attribute)
+            return
+
         if mode == 'dump':
             self.db.send(
                 'Print|%s'
@@ -384,36 +519,38 @@ class Interaction(object):
             )
             return
 
-        self.db.send(
-            'Dump|%s'
+        self.time_boxed(
+            '%s object' % type(thing).__name__,
+            lambda: 'Dump|%s'
             % dump(
                 {
                     'for': self.db.safe_repr(thing),
                     'val': self.db.dmp(thing),
+                    'size': deep_size(thing),
                     'doc': get_doc(thing),
                     'source': get_source(thing),
                 }
-            )
+            ),
         )
 
     def do_dump(self, data):
-        try:
-            thing = eval_(data, self.get_globals(), self.current_locals)
-        except Exception:
-            self.fail('Dump')
-            return
+        def dump_message():
+            try:
+                thing = eval_(data, self.get_globals(), self.current_locals)
+            except Exception:
+                return self.failure('Dump')
 
-        self.db.send(
-            'Dump|%s'
-            % dump(
+            return 'Dump|%s' % dump(
                 {
                     'for': u('%s ⟶ %s ') % (data, self.db.safe_repr(thing)),
                     'val': self.db.dmp(thing),
+                    'size': deep_size(thing),
                     'doc': get_doc(thing),
                     'source': get_source(thing),
                 }
             )
-        )
+
+        self.time_boxed(data, dump_message)
 
     def do_trace(self, data):
         self.db.send('Trace|%s' % dump({'trace': self.trace}))
@@ -451,17 +588,17 @@ class Interaction(object):
         with self.db.capture_output(with_hook=redir is None) as (out, err):
             compiled_code = None
             try:
-                compiled_code = compile(data, '<stdin>', 'single')
+                compiled_code = compile_cache.compile(data, mode='single')
             except Exception:
                 try:
-                    compiled_code = compile(data, '<stdin>', 'exec')
+                    compiled_code = compile_cache.compile(data)
                 except Exception:
                     maybe_hook = self.handle_exc()
 
                 # Hack from codeop
                 e1 = e2 = None
                 try:
-                    compiled_code = compile(data + '\n', '<stdin>', 'exec')
+                    compiled_code = compile_cache.compile(data + '\n')
                 except Exception as e:
                     e1 = e
                 try:
@@ -480,25 +617,15 @@ class Interaction(object):
             loc = self.current_locals
             start = time.time()
             if compiled_code is not None:
-                self.db.compile_cache[id(compiled_code)] = data
                 try:
                     execute(compiled_code, self.get_globals(), loc)
                 except NameError as e:
                     m = re.match("name '(.+)' is not defined", str(e))
                     if m:
                         name = m.groups()[0]
-                        if self.db._importmagic_index:
-                            scores = self.db._importmagic_index.symbol_scores(
-                                name
-                            )
-                            for _, module, variable in scores:
-                                if variable is None:
-                                    imports.append('import %s' % module)
-                                else:
-                                    imports.append(
-                                        'from %s import %s'
-                                        % (module, variable)
-                                    )
+                        suggestions = import_index.suggest(name)
+                        if suggestions is not None:
+                            imports.extend(suggestions)
                         elif importable_module(name):
                             imports.append('import %s' % name)
 
@@ -604,7 +731,8 @@ class Interaction(object):
             except Exception:
                 break_fail(
                     'Wrong breakpoint format must be '
-                    '[file][:lineno][#function][,condition].'
+                    '[file][:lineno][#function][,condition]'
+                    '[[ignore=n,hit=n,sample=n]].'
                 )
                 return
 
@@ -626,8 +754,22 @@ class Interaction(object):
                 break_fail('Blank line or comment')
                 return
 
+        options = {}
+        for option in ('ignore', 'hit', 'sample'):
+            if brk.get(option) is not None:
+                try:
+                    options[option] = int(brk[option])
+                except Exception:
+                    break_fail('Breakpoint %s must be an integer' % option)
+                    return
+
         breakpoint = self.db.set_break(
-            brk['fn'], brk['lno'], brk['temporary'], brk['cond'], brk['fun']
+            brk['fn'],
+            brk['lno'],
+            brk['temporary'],
+            brk['cond'],
+            brk['fun'],
+            **options
         )
         break_set = breakpoint.to_dict()
         break_set['temporary'] = brk['temporary']
@@ -848,37 +990,38 @@ class Interaction(object):
                 data.split('?') if '?' in data else data.split('<>')
             )
         ]
-        strings = []
-        for expression in expressions:
-            try:
-                strings.append(
-                    eval_(expression, self.get_globals(), self.current_locals)
-                )
-            except Exception:
-                self.fail(
-                    'Diff',
-                    "Diff failed: Expression %s "
-                    "failed to evaluate to a string" % expression,
-                )
-                return
 
-        render = (
-            (
+        def diff():
+            strings = []
+            for expression in expressions:
+                try:
+                    strings.append(
+                        eval_(
+                            expression, self.get_globals(), self.current_locals
+                        )
+                    )
+                except Exception:
+                    return self.failure(
+                        'Diff',
+                        "Diff failed: Expression %s "
+                        "failed to evaluate to a string" % expression,
+                    )
+
+            render = (
                 (
-                    lambda x: self.db.better_repr(x, html=False)
-                    or self.db.safe_repr(x)
+                    (
+                        lambda x: self.db.better_repr(x, html=False)
+                        or self.db.safe_repr(x)
+                    )
                 )
+                if pretty
+                else str
             )
-            if pretty
-            else str
-        )
-        strings = [
-            render(string) if not is_str(string) else string
-            for string in strings
-        ]
-        self.db.send(
-            'RawHTML|%s'
-            % dump(
+            strings = [
+                render(string) if not is_str(string) else string
+                for string in strings
+            ]
+            return 'RawHTML|%s' % dump(
                 {
                     'for': u('Difference between %s')
                     % (' and '.join(expressions)),
@@ -890,6 +1033,9 @@ class Interaction(object):
                     ),
                 }
             )
+
+        self.time_boxed(
+            u('Difference between %s') % (' and '.join(expressions)), diff
         )
 
     def do_find(self, data):
@@ -910,48 +1056,339 @@ class Interaction(object):
         except Exception:
             self.fail('Find')
             return
-        if ' in ' in data:
-            matches = search_key_in_obj(key, value, path='%s.' % expr)
-        else:
-            matches = search_value_in_obj(key, value, path='%s.' % expr)
+        try:
+            if ' in ' in data:
+                match = key_matcher(key)
+            else:
+                match = value_matcher(key)
+        except Exception:
+            self.fail('Find')
+            return
 
+        title = 'Finding %s in %s' % (escape(key), escape(expr))
+        # A command sent by the client cancels the search
+        search = Search(match, value, escape(expr), self.db.pending)
+        results = iter(search)
+        deadline = time.time() + FIND_TIMEOUT
+        done = False
+        while not done:
+            # Batches are collected in the time box and sent out of it
+            batch = []
+            sent = time.time()
+            box = time_box(max(0, deadline - sent))
+            try:
+                with box:
+                    for path, val in results:
+                        batch.append(
+                            '%s: -> <a href="%d" class="inspect">%s</a>'
+                            % (
+                                path,
+                                self.db.handles.add(val),
+                                escape(self.db.safe_repr(val)),
+                            )
+                        )
+                        if len(batch) >= FIND_BATCH or (
+                            time.time() - sent > FIND_FLUSH
+                        ):
+                            break
+                    else:
+                        done = True
+            except EvaluationTimeout:
+                if not box.expired:
+                    raise
+                search.stopped = 'timed out after %ds' % FIND_TIMEOUT
+                done = True
+            if batch:
+                self.db.send(
+                    'Print|%s'
+                    % dump(
+                        {
+                            'for': title,
+                            'result': 'Found:\n%s' % '\n'.join(batch),
+                        }
+                    )
+                )
+
+        if not search.found:
+            self.db.send(
+                'Print|%s' % dump({'for': title, 'result': 'Not found'})
+            )
+        if search.stopped:
+            self.db.send(
+                'Echo|%s'
+                % dump(
+                    {
+                        'for': title,
+                        'val': 'Search stopped: %s, %d objects visited'
+                        % (search.stopped, search.visited),
+                    }
+                )
+            )
+
+    def do_census(self, data):
+        words = data.split()
+        sort = SORTS[0]
+        if words and words[0] in SORTS:
+            sort = words.pop(0)
+        if len(words) > 1:
+            self.fail(
+                'Census',
+                'Census error',
+                'Syntax for census is: "[%s] [type name part]"'
+                % '|'.join(SORTS),
+            )
+            return
+        census = Census(sort, words[0] if words else None).take()
+        self.send_census(census, 0)
+
+    def send_census(self, census, offset):
+        """Send a page of census rows, with links to their type, to their
+        samples and to the next page"""
+        rows = census.page(offset)
+        lines = [
+            '%d objects%s, %s (%s deep)'
+            % (
+                census.counted,
+                ' of %d (timed out)' % census.total if census.partial else '',
+                human_size(sum(row.size for row in census.rows)),
+                human_size(sum(row.deep for row in census.rows)),
+            ),
+            TABLE,
+            '<tr><th>Type</th><th>Count</th><th>Size</th><th>Deep size</th>'
+            '</tr>',
+        ]
+        for row in rows:
+            lines.append(
+                '<tr><td class="key"><a href="%d" class="inspect">%s</a></td>'
+                '<td><a href="%d" class="inspect">%d</a></td>'
+                '<td>%s</td><td>%s</td></tr>'
+                % (
+                    self.db.handles.add(row.type),
+                    escape(row.name),
+                    self.db.handles.add(row.samples),
+                    row.count,
+                    human_size(row.size),
+                    human_size(row.deep),
+                )
+            )
+        more = len(census.rows) - offset - len(rows)
+        if more > 0:
+            lines.append(
+                '<tr><td colspan="4" class="ellipse"><a href="census/%d/%d" '
+                'class="inspect">[%d more types…]</a></td></tr>'
+                % (self.db.handles.add(census), offset + CENSUS_PAGE, more)
+            )
+        lines.append('</table>')
         self.db.send(
             'Print|%s'
             % dump(
                 {
-                    'for': 'Finding %s in %s' % (key, expr),
-                    'result': 'Found:\n%s'
-                    % '\n'.join(
-                        [
-                            '%s: -> %s' % (k, escape(self.db.safe_repr(val)))
-                            for k, val in matches
-                        ]
+                    'for': 'Census by %s%s%s'
+                    % (
+                        census.sort,
+                        (
+                            ' of %s' % escape(census.match)
+                            if census.match
+                            else ''
+                        ),
+                        ' from %d' % offset if offset else '',
+                    ),
+                    'result': '\n'.join(lines),
+                }
+            )
+        )
+
+    def do_referrers(self, data):
+        try:
+            thing = eval_(data, self.get_globals(), self.current_locals)
+        except Exception:
+            self.fail('Referrers')
+            return
+        self.send_referrers(thing, escape(data))
+
+    def send_referrers(self, thing, description):
+        """Send the shortest paths from modules or frames to thing"""
+        retention = Retention(thing).find()
+        thing = None
+        lines = []
+        for path in retention.paths:
+            lines.append(
+                ' → '.join(
+                    '<a href="%d" class="inspect">%s</a>%s'
+                    % (
+                        self.db.handles.add(obj),
+                        escape(type_name(type(obj))),
+                        ' %s' % escape(edge) if edge else '',
                     )
-                    if matches
-                    else 'Not found',
+                    for obj, edge in path
+                )
+            )
+        if not lines:
+            lines.append('No path from a module or a running frame')
+        if retention.stopped:
+            lines.append(
+                'Search stopped: %s, %d referrers visited'
+                % (retention.stopped, retention.visited)
+            )
+        self.db.send(
+            'Print|%s'
+            % dump(
+                {
+                    'for': 'Referrers of %s' % description,
+                    'result': '\n'.join(lines),
                 }
             )
         )
 
+    def do_allocations(self, data):
+        if tracemalloc is None:
+            self.fail(
+                'Allocations',
+                'Allocations error',
+                'tracemalloc is not available',
+            )
+            return
+        words = data.split()
+        action = words.pop(0) if words else 'status'
+        snapshots = self.db.snapshots
+        title = 'Allocations %s' % escape(data)
+        try:
+            if action == 'start':
+                if not snapshots.start(
+                    int(words[0]) if words else ALLOCATIONS_FRAMES
+                ):
+                    self.fail(
+                        'Allocations',
+                        'Allocations error',
+                        'Allocations are already traced',
+                    )
+                    return
+                result = 'Tracing allocations'
+            elif action == 'stop':
+                snapshots.clear()
+                tracemalloc.stop()
+                result = 'Allocations not traced anymore'
+            elif action == 'snapshot':
+                if not tracemalloc.is_tracing():
+                    raise ValueError('Allocations are not traced, start first')
+                result = 'Snapshot %s taken' % escape(
+                    snapshots.take(words[0] if words else None)
+                )
+            elif action == 'top':
+                name = None
+                if words and words[0] not in GROUPS:
+                    name = None if words[0].isdigit() else words.pop(0)
+                group, top = self.allocations_options(words)
+                name, snapshot = snapshots.get(name)
+                title = 'Allocations of %s by %s' % (escape(name), group)
+                result = self.allocations_table(
+                    snapshot.statistics(group)[:top]
+                )
+            elif action == 'diff':
+                first, second = words[:2]
+                group, top = self.allocations_options(words[2:])
+                __, first_snapshot = snapshots.get(first)
+                __, second_snapshot = snapshots.get(second)
+                title = 'Allocations from %s to %s by %s' % (
+                    escape(first),
+                    escape(second),
+                    group,
+                )
+                result = self.allocations_table(
+                    second_snapshot.compare_to(first_snapshot, group)[:top],
+                    diff=True,
+                )
+            elif action == 'status':
+                current, peak = tracemalloc.get_traced_memory()
+                result = '%s, %s traced (peak %s), snapshots: %s' % (
+                    'Tracing' if tracemalloc.is_tracing() else 'Not tracing',
+                    human_size(current),
+                    human_size(peak),
+                    ', '.join(map(escape, snapshots.names())) or 'none',
+                )
+            else:
+                raise ValueError('Unknown action %s' % action)
+        except KeyError as e:
+            self.fail(
+                'Allocations',
+                'Allocations error',
+                'No snapshot %s' % (e.args[0] or 'taken'),
+            )
+            return
+        except ValueError as e:
+            self.fail(
+                'Allocations',
+                'Allocations error',
+                '%s. Syntax is: %s' % (e, SYNTAX),
+            )
+            return
+
+        self.db.send('Print|%s' % dump({'for': title, 'result': result}))
+
+    def allocations_options(self, words):
+        """The group and the number of statistics from words"""
+        group = GROUPS[0]
+        top = ALLOCATIONS_TOP
+        for word in words:
+            if word in GROUPS:
+                group = word
+            else:
+                top = int(word)
+        return group, top
+
+    def allocations_table(self, statistics, diff=False):
+        """Table of tracemalloc statistics or statistic diffs"""
+        lines = [
+            TABLE,
+            '<tr><th>Location</th><th>Size</th>%s<th>Count</th>%s</tr>'
+            % (('<th>Diff</th>',) * 2 if diff else ('', '')),
+        ]
+        for stat in statistics:
+            location = '<br>'.join(
+                escape('%s:%d' % (frame.filename, frame.lineno))
+                for frame in reversed(stat.traceback)
+            )
+            if diff:
+                lines.append(
+                    '<tr><td class="key">%s</td><td>%s</td><td>%s%s</td>'
+                    '<td>%d</td><td>%+d</td></tr>'
+                    % (
+                        location,
+                        human_size(stat.size),
+                        '-' if stat.size_diff < 0 else '+',
+                        human_size(abs(stat.size_diff)),
+                        stat.count,
+                        stat.count_diff,
+                    )
+                )
+            else:
+                lines.append(
+                    '<tr><td class="key">%s</td><td>%s</td><td>%d</td></tr>'
+                    % (location, human_size(stat.size), stat.count)
+                )
+        lines.append('</table>')
+        return '\n'.join(lines)
+
     def handle_exc(self):
         """Return a formated exception traceback for wdb.js use"""
         exc_info = sys.exc_info()
         type_, value = exc_info[:2]
-        self.db.obj_cache[id(exc_info)] = exc_info
-
         return '<a href="%d" class="inspect">%s: %s</a>' % (
-            id(exc_info),
+            self.db.handles.add(exc_info),
             escape(type_.__name__),
             escape(repr(value)),
         )
 
-    def fail(self, cmd, title=None, message=None):
-        """Send back captured exceptions"""
+    def failure(self, cmd, title=None, message=None):
+        """Message of captured exceptions"""
         if message is None:
             message = self.handle_exc()
         else:
             message = escape(message)
-        self.db.send(
-            'Echo|%s'
-            % dump({'for': escape(title or '%s failed' % cmd), 'val': message})
+        return 'Echo|%s' % dump(
+            {'for': escape(title or '%s failed' % cmd), 'val': message}
         )
+
+    def fail(self, cmd, title=None, message=None):
+        """Send back captured exceptions"""
+        self.db.send(self.failure(cmd, title, message))
@@ -1,13 +1,42 @@
 import dis
+import gc
 import inspect
 import io
 import os
 import signal
 import sys
+import types
+import weakref
 from contextlib import contextmanager
 from difflib import HtmlDiff, _mdiff
-
-from ._compat import OrderedDict, StringIO, existing_module
+from functools import wraps
+
+from ._compat import OrderedDict, StringIO, existing_module, is_str
+
+try:
+    from inspect import getattr_static
+except ImportError:
+    getattr_static = None
+
+# Returned by peek_attribute for values which need running code to get
+LAZY = object()
+# Descriptors getting their value without running python code
+CHEAP_DESCRIPTORS = (
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    staticmethod,
+    classmethod,
+    type(list.append),
+    type(object.__init__),
+    type(dict.__dict__['fromkeys']),
+    types.GetSetDescriptorType,
+    types.MemberDescriptorType,
+)
+# Memoized values of objects which can't be weakly referenced
+MEMOIZED_SIZE = 1000
+# Values displayed in dumps without being asked for
+SIMPLE_TYPES = (type(None), bool, int, float, complex)
 
 
 def pretty_frame(frame):
@@ -32,6 +61,115 @@ def get_code(obj):
         return obj
 
 
+def source_mtime(obj):
+    """Modification time of the file defining obj, None if unknown"""
+    code = get_code(obj)
+    if code is not None:
+        filename = code.co_filename
+    else:
+        if inspect.isclass(obj):
+            obj = sys.modules.get(obj.__module__)
+        filename = getattr(obj, '__file__', None)
+    try:
+        return os.stat(filename).st_mtime
+    except (OSError, TypeError):
+        return None
+
+
+def memoized(fun):
+    """Memoize fun(obj) per function, code object, module or class until
+    its file is modified.
+    The cache is keyed on obj itself as functions can share their code,
+    like the ones decorated with the same wrapper"""
+    cache = weakref.WeakKeyDictionary()
+    # Objects which can't be weakly referenced, by id with their value
+    strong_cache = OrderedDict()
+
+    @wraps(fun)
+    def wrapper(obj):
+        key = getattr(obj, '__func__', obj)
+        if get_code(key) is None and not (
+            inspect.ismodule(key) or inspect.isclass(key)
+        ):
+            return fun(obj)
+        mtime = source_mtime(key)
+        try:
+            cached = cache.get(key)
+            weak = True
+        except TypeError:
+            cached = strong_cache.get(id(key), (key, None))[1]
+            weak = False
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        rv = fun(obj)
+        if weak:
+            cache[key] = mtime, rv
+        else:
+            strong_cache[id(key)] = key, (mtime, rv)
+            while len(strong_cache) > MEMOIZED_SIZE:
+                strong_cache.popitem(last=False)
+        return rv
+
+    return wrapper
+
+
+def peek_attribute(obj, key):
+    """Get the type of the attribute `key` of obj and its value,
+    or LAZY if getting it would run code like a property"""
+    try:
+        if getattr_static is not None:
+            static = getattr_static(obj, key)
+            if hasattr(type(static), '__get__') and not isinstance(
+                static, CHEAP_DESCRIPTORS
+            ):
+                return type(static).__name__, LAZY
+        value = getattr(obj, key)
+    except AttributeError:
+        # Dynamic attribute, handled by __getattr__
+        return '?', LAZY
+    except Exception as e:
+        value = 'Error getting attr "%s" (%s: %s)' % (
+            key,
+            type(e).__name__,
+            e,
+        )
+    return type(value).__name__, value
+
+
+def is_simple(value):
+    """Return True if value is cheap and short to display"""
+    return type(value) in SIMPLE_TYPES or (
+        is_str(value) and len(value) <= 100
+    )
+
+
+def type_name(type_):
+    """Qualified name of type_, without the builtins module"""
+    module = getattr(type_, '__module__', None)
+    name = getattr(type_, '__qualname__', type_.__name__)
+    if module in (None, 'builtins', '__builtin__'):
+        return name
+    return '%s.%s' % (module, name)
+
+
+def get_referents(obj):
+    """gc.get_referents, modules only refer to their dict: walking the
+    state of some extension modules, like _asyncio on python 3.12,
+    corrupts them"""
+    if isinstance(obj, types.ModuleType):
+        return [obj.__dict__]
+    return gc.get_referents(obj)
+
+
+def human_size(size):
+    """Size in bytes with a unit"""
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024:
+            break
+        size /= 1024.0
+    return '%.1f %s' % (size, unit) if unit != 'B' else '%d B' % size
+
+
 def get_source_from_byte_code(code):
     try:
         import uncompyle6
@@ -45,6 +183,7 @@ def get_source_from_byte_code(code):
         return
 
 
+@memoized
 def get_source(obj):
     try:
         return inspect.getsource(obj)
@@ -70,6 +209,7 @@ def get_source(obj):
             return ''
 
 
+@memoized
 def get_doc(obj):
     doc = inspect.getdoc(obj)
     com = inspect.getcomments(obj)
@@ -267,157 +407,6 @@ class Html5Diff(HtmlDiff):
         )
 
 
-def search_key_in_obj(key, obj, matches=None, path='', context=None):
-    context = context or []
-    matches = matches or []
-    if id(obj) in context:
-        return matches
-    context.append(id(obj))
-
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            if not isinstance(k, str):
-                continue
-            if isinstance(v, type(sys)):
-                continue
-            if key in k:
-                matches.append(
-                    (
-                        "%s['%s']"
-                        % (
-                            path.rstrip('.'),
-                            k.replace(key, '<mark>%s</mark>' % key),
-                        ),
-                        v,
-                    )
-                )
-            try:
-                matches = search_key_in_obj(
-                    key,
-                    v,
-                    matches,
-                    "%s['%s']." % (path.rstrip('.'), k),
-                    context,
-                )
-            except Exception:
-                pass
-
-    if isinstance(obj, list):
-        for i, v in enumerate(obj):
-            if isinstance(v, type(sys)):
-                continue
-            try:
-                matches = search_key_in_obj(
-                    key, v, matches, "%s[%d]." % (path.rstrip('.'), i), context
-                )
-            except Exception:
-                pass
-
-    for k in dir(obj):
-        if k.startswith('__') and k not in ('__class__',):
-            continue
-        v = getattr(obj, k, None)
-        v2 = getattr(obj, k, None)
-        if id(v) != id(v2):
-            continue
-        if isinstance(v, type(sys)):
-            continue
-        if key in k:
-            matches.append(
-                ('%s%s' % (path, k.replace(key, '<mark>%s</mark>' % key)), v)
-            )
-        try:
-            matches = search_key_in_obj(
-                key, v, matches, '%s%s.' % (path, k), context
-            )
-        except Exception:
-            pass
-
-    return matches
-
-
-def search_value_in_obj(fun, obj, matches=None, path='', context=None):
-    context = context or []
-    matches = matches or []
-    if id(obj) in context:
-        return matches
-    context.append(id(obj))
-
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            if not isinstance(k, str):
-                continue
-            if isinstance(v, type(sys)):
-                continue
-
-            res = None
-            try:
-                res = eval(fun, {'x': v})
-            except Exception:
-                pass
-            new_path = "%s['%s']" % (path.rstrip('.'), k)
-
-            if res:
-                matches.append((new_path, v))
-            try:
-                matches = search_value_in_obj(
-                    fun, v, matches, new_path + '.', context
-                )
-            except Exception:
-                pass
-
-    if isinstance(obj, list):
-        for i, v in enumerate(obj):
-            if isinstance(v, type(sys)):
-                continue
-
-            res = None
-            try:
-                res = eval(fun, {'x': v})
-            except Exception:
-                pass
-
-            new_path = "%s[%d]" % (path.rstrip('.'), i)
-
-            if res:
-                matches.append((new_path, v))
-            try:
-                matches = search_value_in_obj(
-                    fun, v, matches, new_path + '.', context
-                )
-            except Exception:
-                pass
-
-    for k in dir(obj):
-        if k.startswith('__') and k not in ('__class__',):
-            continue
-        v = getattr(obj, k, None)
-        v2 = getattr(obj, k, None)
-        if id(v) != id(v2):
-            continue
-        if isinstance(v, type(sys)):
-            continue
-
-        res = None
-        try:
-            res = eval(fun, {'x': v})
-        except Exception:
-            pass
-
-        new_path = '%s%s' % (path, k)
-
-        if res:
-            matches.append((new_path, v))
-        try:
-            matches = search_value_in_obj(
-                fun, v, matches, new_path + '.', context
-            )
-        except Exception:
-            pass
-
-    return matches
-
-
 class timeout_of(object):
     def __init__(self, time, strict=False):
         self.time = time
@@ -18,6 +18,7 @@
 import tornado.options
 from tornado.util import unicode_type
 from struct import pack
+from uuid import uuid4
 import logging
 import json
 
@@ -78,10 +79,52 @@ class BaseSockets(object):
         return set(self._sockets.keys())
 
 
+class Channel(object):
+    """A client session multiplexed with the other sessions of its
+    process on one stream"""
+
+    def __init__(self, stream, id):
+        self.stream = stream
+        self.id = id
+
+    def close(self):
+        # An empty frame closes the channel, not the process stream
+        self.stream.write(pack("!ii", 4, self.id))
+
+
 class Sockets(BaseSockets):
     def __init__(self):
         super(Sockets, self).__init__()
         self._filenames = {}
+        # Multiplexed process streams
+        self._processes = set()
+
+    def add_process(self, stream):
+        self._processes.add(stream)
+
+    def remove_process(self, stream):
+        self._processes.discard(stream)
+
+    def push(self, cmd, message):
+        """Send to every process on the process channel of multiplexed
+        streams and to every dedicated connection"""
+        data = (cmd + '|' + json.dumps(message)).encode('utf-8')
+        for stream in list(self._processes):
+            try:
+                self._send(Channel(stream, 0), data)
+            except Exception:
+                log.warning('Failed push to process stream')
+                self._processes.discard(stream)
+        for uuid, sck in list(self._sockets.items()):
+            if isinstance(sck, Channel):
+                # Pushed on the process channel
+                continue
+            try:
+                self._send(sck, data)
+            except Exception:
+                log.warning('Failed push to socket %s' % uuid)
+                self.close(uuid)
+                self.remove(uuid)
 
     def add(self, uuid, sck):
         super(Sockets, self).add(uuid, sck)
@@ -107,6 +150,9 @@ class Sockets(BaseSockets):
         )
 
     def _send(self, sck, data):
+        if isinstance(sck, Channel):
+            data = pack("!i", sck.id) + data
+            sck = sck.stream
         sck.write(pack("!i", len(data)))
         sck.write(data)
 
@@ -130,22 +176,60 @@ class SyncWebSockets(WebSockets):
 
 
 class Breakpoints(object):
+    # Breakpoint options (ignore, hit, sample) are not part of its identity
+    identity = ('fn', 'lno', 'cond', 'fun')
+
     def __init__(self):
         self._breakpoints = []
+        # Incremented on every change
+        self.version = 0
+        # Versions restart with the server, clients resync on a new epoch
+        self.epoch = uuid4().hex
+
+    def find(self, brk):
+        key = [brk.get(attr) for attr in self.identity]
+        for stored in self._breakpoints:
+            if [stored.get(attr) for attr in self.identity] == key:
+                return stored
 
     def add(self, brk):
-        if brk not in self._breakpoints:
-            self._breakpoints.append(brk)
-            syncwebsockets.broadcast('AddBreak|' + json.dumps(brk))
+        stored = self.find(brk)
+        if stored == brk:
+            return
+        if stored is not None:
+            # Options update
+            self._breakpoints.remove(stored)
+        self._breakpoints.append(brk)
+        self.version += 1
+        syncwebsockets.broadcast('AddBreak|' + json.dumps(brk))
+        sockets.push('BreaksDelta', self.delta(add=brk))
 
     def remove(self, brk):
-        if brk in self._breakpoints:
-            self._breakpoints.remove(brk)
-            syncwebsockets.broadcast('RemoveBreak|' + json.dumps(brk))
+        stored = self.find(brk)
+        if stored is not None:
+            self._breakpoints.remove(stored)
+            self.version += 1
+            syncwebsockets.broadcast('RemoveBreak|' + json.dumps(stored))
+            sockets.push('BreaksDelta', self.delta(remove=stored))
 
     def get(self):
         return self._breakpoints
 
+    def delta(self, **change):
+        change.update(epoch=self.epoch, version=self.version)
+        return change
+
+    def snapshot(self, known=None):
+        """Breakpoints with their epoch and version, omitted if the
+        `known` epoch and version of the client are current"""
+        snapshot = {'epoch': self.epoch, 'version': self.version}
+        if not isinstance(known, dict) or (
+            known.get('epoch'),
+            known.get('version'),
+        ) != (self.epoch, self.version):
+            snapshot['breakpoints'] = self._breakpoints
+        return snapshot
+
 
 sockets = Sockets()
 websockets = WebSockets()
@@ -75,6 +75,7 @@ rm_uuid_line = function(uuid, socket) {
 
 make_brk_line = function(brk) {
   var elt, i, len, line, ref;
+  rm_brk_line(brk);
   line = '<tr>';
   ref = ['fn', 'lno', 'cond', 'fun'];
   for (i = 0, len = ref.length; i < len; i++) {
@@ -264,6 +264,15 @@ Source = (function(superClass) {
     if (brk.cond) {
       str += " If " + brk.cond;
     }
+    if (brk.ignore) {
+      str += " Ignoring " + brk.ignore + " hits";
+    }
+    if (brk.hit) {
+      str += " On hit " + brk.hit;
+    }
+    if (brk.sample) {
+      str += " Sampling 1/" + brk.sample;
+    }
     return str;
   };
 
@@ -801,13 +810,16 @@ Prompt = (function(superClass) {
                 m: 'Restart',
                 n: 'Next',
                 o: 'Open',
+                p: 'Census',
                 q: 'Quit',
                 r: 'Return',
                 s: 'Step',
                 t: 'Tbreak',
                 u: 'Until',
+                v: 'Allocations',
                 w: 'Watch',
                 x: 'Diff',
+                y: 'Referrers',
                 z: 'Unbreak'
               };
               results = [];
@@ -1330,7 +1342,7 @@ Switch = (function(superClass) {
 
 })(Log);
 
-help = "<div class=\"mdl-tabs mdl-js-tabs mdl-js-ripple-effect\">\n  <div class=\"mdl-tabs__tab-bar\">\n      <a href=\"#help-stepping\" class=\"mdl-tabs__tab is-active\">Stepping</a>\n      <a href=\"#help-breakpoints\" class=\"mdl-tabs__tab\">Breakpoints</a>\n      <a href=\"#help-inspecting\" class=\"mdl-tabs__tab\">Inspecting</a>\n      <a href=\"#help-prompt\" class=\"mdl-tabs__tab\">Prompt</a>\n      <a href=\"#help-misc\" class=\"mdl-tabs__tab\">Misc</a>\n  </div>\n\n  <div class=\"mdl-tabs__panel is-active\" id=\"help-stepping\">\n    <table class=\"mdl-data-table mdl-js-data-table mdl-shadow--2dp\">\n      <tr>\n        <td class=\"cmd\">\n          <samp>.s</samp> or <kbd>Alt</kbd> + <kbd>↓</kbd> or <kbd>F11</kbd>\n        </td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          Step into\n        </td>\n      </tr>\n      <tr>\n        <td class=\"cmd\">\n          <samp>.n</samp> or <kbd>Alt</kbd> + <kbd>→</kbd> or <kbd>F10</kbd>\n        </td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          Step over (Next)\n        </td>\n      </tr>\n      <tr>\n        <td class=\"cmd\">\n          <samp>.u</samp> or <kbd>Alt</kbd> + <kbd>←</kbd> or <kbd>F7</kbd>\n        </td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          Until (Next over loops)\n        </td>\n      </tr>\n      <tr>\n        <td class=\"cmd\">\n          <samp>.r</samp> or <kbd>Alt</kbd> + <kbd>↑</kbd> or <kbd>F9</kbd>\n        </td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          Step out (Return)\n        </td>\n      </tr>\n      <tr>\n        <td class=\"cmd\">\n          <samp>.c</samp> or <kbd>Alt</kbd> + <kbd>Enter</kbd> or <kbd>F8</kbd>\n        </td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          Continue\n        </td>\n      </tr>\n      <tr>\n        <td class=\"cmd\"><samp>.j</samp> lineno</td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          Jump to lineno (Must be at bottom frame and in the same function)\n        </td>\n      </tr>\n      <tr>\n        <td class=\"cmd\"><samp>.q</samp></td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          Quit\n        </td>\n      </tr>\n    </table>\n    <aside class=\"note\">\n      All commands are prefixed with a dot and can be\n      executed with <kbd>Alt</kbd> + <kbd>the-command-letter</kbd>,\n      i.e.: <kbd>Alt</kbd> + <kbd>h</kbd>\n    </aside>\n  </div>\n  <div class=\"mdl-tabs__panel\" id=\"help-breakpoints\">\n    <table class=\"mdl-data-table mdl-js-data-table mdl-shadow--2dp\">\n      <tr>\n        <td class=\"cmd\"><samp>.b</samp> arg</td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          Set a session breakpoint\n        </td>\n      </tr>\n      <tr>\n        <td class=\"cmd\"><samp>.t</samp> arg</td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          Set a temporary breakpoint\n        </td>\n      </tr>\n      <tr>\n        <td class=\"cmd\"><samp>.z</samp> arg</td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          Delete existing breakpoint\n        </td>\n      </tr>\n      <tr>\n        <td class=\"cmd\"><samp>.l</samp></td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          List active breakpoints\n        </td>\n      </tr>\n      <tr>\n        <td class=\"cmd\">Breakpoint argument format</td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          <code>[file/module][:lineno][#function][,condition]</code>\n        </td>\n      </tr>\n      <tr>\n        <td class=\"cmd\"><code>[file]</code></td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          Break if any line of <code>file</code> is executed</td>\n      </tr>\n      <tr>\n        <td class=\"cmd\"><code>[file]:lineno</code></td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          Break on <code>file</code> at <code>lineno</code></td>\n      </tr>\n      <tr>\n        <td class=\"cmd\"><code>[file][:lineno],condition</code></td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n            Break on <code>file</code> at <code>lineno</code> if\n            <code>condition</code> is <code>True</code>\n            (ie: <code>i == 10)</code></td>\n      </tr>\n      <tr>\n        <td class=\"cmd\"><code>[file]#function</code></td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          Break when inside <code>function</code> function</td>\n      </tr>\n    </table>\n    <aside class=\"note\">\n      File is always current file by default and you can also\n      specify a module like <code>logging.config</code>.\n    </aside>\n  </div>\n  <div class=\"mdl-tabs__panel\" id=\"help-inspecting\">\n    <table class=\"mdl-data-table mdl-js-data-table mdl-shadow--2dp\">\n    <tr>\n      <td class=\"cmd\"><samp>.a</samp></td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Echo all typed commands in the current debugging session\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><samp>.d</samp> expression</td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Dump the result of expression in a table\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><samp>.w</samp> expression</td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Watch expression in current file (Click on the name to remove)\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><samp>.i</samp> [mime/type;]expression</td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Display the result in an embed, mime type defaults to \"text/html\"\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><samp>.x</samp> left ? right</td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Display the difference between the pretty print of 'left' and 'right'\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><samp>.x</samp> left <> right</td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Display the difference between the repr of 'left' and 'right'\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><samp>.f</samp> key in expression</td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Search recursively the presence of key in expression object tree\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><samp>.f</samp> test of expression</td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Search recursively values that match test in expression inner tree.\n        i.e.: .f type(x) == int of sys\n      </td>\n    </tr>\n  </table>\n</div>\n<div class=\"mdl-tabs__panel\" id=\"help-prompt\">\n  <table class=\"mdl-data-table mdl-js-data-table mdl-shadow--2dp\">\n    <tr>\n      <td class=\"cmd\">iterable!sthg</td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        If <a href=\"https://github.com/paradoxxxzero/cutter\">\n          cutter\n        </a> is installed, executes cut(iterable).sthg\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\">expr >! file</td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Write the result of expr in file\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\">!< file</td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Eval the content of file\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><kbd>Enter</kbd></td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Eval the current selected text in page,\n        useful to eval code in the source\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><kbd>Shift</kbd> + <kbd>Enter</kbd></td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Insert the current selected text in page in the prompt\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><kbd>Ctrl</kbd> + <kbd>Enter</kbd></td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Force multiline prompt\n      </td>\n    </tr>\n  </table>\n</div>\n<div class=\"mdl-tabs__panel\" id=\"help-misc\">\n  <table class=\"mdl-data-table mdl-js-data-table mdl-shadow--2dp\">\n    <tr>\n      <td class=\"cmd\"><samp>.h</samp></td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Get some help\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><samp>.m</samp></td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Restart program\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><samp>.e</samp></td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Toggle file edition mode\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><samp>.o</samp></td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Try to open file in external ($EDITOR / $VISUAL / xdg-open) editor.\n        <br>\n        Add an argument (or hold shift with alt+o) if your editor does not\n        support the file:lno:col syntax.\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><samp>.g</samp></td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Clear scrollback\n      </td>\n    </tr>\n  </table>\n</div>";
+help = "<div class=\"mdl-tabs mdl-js-tabs mdl-js-ripple-effect\">\n  <div class=\"mdl-tabs__tab-bar\">\n      <a href=\"#help-stepping\" class=\"mdl-tabs__tab is-active\">Stepping</a>\n      <a href=\"#help-breakpoints\" class=\"mdl-tabs__tab\">Breakpoints</a>\n      <a href=\"#help-inspecting\" class=\"mdl-tabs__tab\">Inspecting</a>\n      <a href=\"#help-prompt\" class=\"mdl-tabs__tab\">Prompt</a>\n      <a href=\"#help-misc\" class=\"mdl-tabs__tab\">Misc</a>\n  </div>\n\n  <div class=\"mdl-tabs__panel is-active\" id=\"help-stepping\">\n    <table class=\"mdl-data-table mdl-js-data-table mdl-shadow--2dp\">\n      <tr>\n        <td class=\"cmd\">\n          <samp>.s</samp> or <kbd>Alt</kbd> + <kbd>↓</kbd> or <kbd>F11</kbd>\n        </td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          Step into\n        </td>\n      </tr>\n      <tr>\n        <td class=\"cmd\">\n          <samp>.n</samp> or <kbd>Alt</kbd> + <kbd>→</kbd> or <kbd>F10</kbd>\n        </td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          Step over (Next)\n        </td>\n      </tr>\n      <tr>\n        <td class=\"cmd\">\n          <samp>.u</samp> or <kbd>Alt</kbd> + <kbd>←</kbd> or <kbd>F7</kbd>\n        </td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          Until (Next over loops)\n        </td>\n      </tr>\n      <tr>\n        <td class=\"cmd\">\n          <samp>.r</samp> or <kbd>Alt</kbd> + <kbd>↑</kbd> or <kbd>F9</kbd>\n        </td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          Step out (Return)\n        </td>\n      </tr>\n      <tr>\n        <td class=\"cmd\">\n          <samp>.c</samp> or <kbd>Alt</kbd> + <kbd>Enter</kbd> or <kbd>F8</kbd>\n        </td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          Continue\n        </td>\n      </tr>\n      <tr>\n        <td class=\"cmd\"><samp>.j</samp> lineno</td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          Jump to lineno (Must be at bottom frame and in the same function)\n        </td>\n      </tr>\n      <tr>\n        <td class=\"cmd\"><samp>.q</samp></td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          Quit\n        </td>\n      </tr>\n    </table>\n    <aside class=\"note\">\n      All commands are prefixed with a dot and can be\n      executed with <kbd>Alt</kbd> + <kbd>the-command-letter</kbd>,\n      i.e.: <kbd>Alt</kbd> + <kbd>h</kbd>\n    </aside>\n  </div>\n  <div class=\"mdl-tabs__panel\" id=\"help-breakpoints\">\n    <table class=\"mdl-data-table mdl-js-data-table mdl-shadow--2dp\">\n      <tr>\n        <td class=\"cmd\"><samp>.b</samp> arg</td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          Set a session breakpoint\n        </td>\n      </tr>\n      <tr>\n        <td class=\"cmd\"><samp>.t</samp> arg</td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          Set a temporary breakpoint\n        </td>\n      </tr>\n      <tr>\n        <td class=\"cmd\"><samp>.z</samp> arg</td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          Delete existing breakpoint\n        </td>\n      </tr>\n      <tr>\n        <td class=\"cmd\"><samp>.l</samp></td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          List active breakpoints\n        </td>\n      </tr>\n      <tr>\n        <td class=\"cmd\">Breakpoint argument format</td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          <code>[file/module][:lineno][#function][,condition]</code>\n        </td>\n      </tr>\n      <tr>\n        <td class=\"cmd\"><code>[file]</code></td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          Break if any line of <code>file</code> is executed</td>\n      </tr>\n      <tr>\n        <td class=\"cmd\"><code>[file]:lineno</code></td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          Break on <code>file</code> at <code>lineno</code></td>\n      </tr>\n      <tr>\n        <td class=\"cmd\"><code>[file][:lineno],condition</code></td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n            Break on <code>file</code> at <code>lineno</code> if\n            <code>condition</code> is <code>True</code>\n            (ie: <code>i == 10)</code></td>\n      </tr>\n      <tr>\n        <td class=\"cmd\"><code>[file]#function</code></td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          Break when inside <code>function</code> function</td>\n      </tr>\n      <tr>\n        <td class=\"cmd\"><code>arg [ignore=n,hit=n,sample=n]</code></td>\n        <td class=\"mdl-data-table__cell--non-numeric dfn\">\n          Don't break on the first <code>ignore</code> hits, break only on\n          the <code>hit</code>th hit or randomly on one hit in\n          <code>sample</code></td>\n      </tr>\n    </table>\n    <aside class=\"note\">\n      File is always current file by default and you can also\n      specify a module like <code>logging.config</code>.\n    </aside>\n  </div>\n  <div class=\"mdl-tabs__panel\" id=\"help-inspecting\">\n    <table class=\"mdl-data-table mdl-js-data-table mdl-shadow--2dp\">\n    <tr>\n      <td class=\"cmd\"><samp>.a</samp></td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Echo all typed commands in the current debugging session\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><samp>.d</samp> expression</td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Dump the result of expression in a table\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><samp>.w</samp> expression</td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Watch expression in current file (Click on the name to remove)\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><samp>.i</samp> [mime/type;]expression</td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Display the result in an embed, mime type defaults to \"text/html\"\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><samp>.x</samp> left ? right</td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Display the difference between the pretty print of 'left' and 'right'\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><samp>.x</samp> left <> right</td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Display the difference between the repr of 'left' and 'right'\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><samp>.f</samp> key in expression</td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Search recursively the presence of key in expression object tree\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><samp>.f</samp> test of expression</td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Search recursively values that match test in expression inner tree.\n        i.e.: .f type(x) == int of sys\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><samp>.p</samp> [size|deep|count] [type]</td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Count the objects in memory by type, optionally only the types\n        whose name contains type\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><samp>.y</samp> expression</td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Display the shortest paths from modules or running frames keeping\n        the result of expression alive\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><samp>.v</samp> start [frames] | stop</td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Start or stop tracing memory allocations with tracemalloc,\n        without argument display the tracing status\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><samp>.v</samp> snapshot [name]</td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Take a snapshot of the traced allocations, the last 5 are kept\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><samp>.v</samp> top [name] [lineno|filename|traceback] [n]</td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Display the n biggest allocations of the last or named snapshot\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><samp>.v</samp> diff first second [lineno|filename|traceback] [n]</td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Display the n biggest allocation differences between two snapshots\n      </td>\n    </tr>\n  </table>\n</div>\n<div class=\"mdl-tabs__panel\" id=\"help-prompt\">\n  <table class=\"mdl-data-table mdl-js-data-table mdl-shadow--2dp\">\n    <tr>\n      <td class=\"cmd\">iterable!sthg</td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        If <a href=\"https://github.com/paradoxxxzero/cutter\">\n          cutter\n        </a> is installed, executes cut(iterable).sthg\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\">expr >! file</td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Write the result of expr in file\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\">!< file</td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Eval the content of file\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><kbd>Enter</kbd></td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Eval the current selected text in page,\n        useful to eval code in the source\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><kbd>Shift</kbd> + <kbd>Enter</kbd></td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Insert the current selected text in page in the prompt\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><kbd>Ctrl</kbd> + <kbd>Enter</kbd></td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Force multiline prompt\n      </td>\n    </tr>\n  </table>\n</div>\n<div class=\"mdl-tabs__panel\" id=\"help-misc\">\n  <table class=\"mdl-data-table mdl-js-data-table mdl-shadow--2dp\">\n    <tr>\n      <td class=\"cmd\"><samp>.h</samp></td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Get some help\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><samp>.m</samp></td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Restart program\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><samp>.e</samp></td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Toggle file edition mode\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><samp>.o</samp></td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Try to open file in external ($EDITOR / $VISUAL / xdg-open) editor.\n        <br>\n        Add an argument (or hold shift with alt+o) if your editor does not\n        support the file:lno:col syntax.\n      </td>\n    </tr>\n    <tr>\n      <td class=\"cmd\"><samp>.g</samp></td>\n      <td class=\"mdl-data-table__cell--non-numeric dfn\">\n        Clear scrollback\n      </td>\n    </tr>\n  </table>\n</div>";
 
 Wdb = (function(superClass) {
   extend(Wdb, superClass);
@@ -1569,6 +1581,8 @@ Wdb = (function(superClass) {
             return cmd('Next');
           case 'o':
             return this.source.external(!data);
+          case 'p':
+            return cmd('Census', data);
           case 'q':
             return cmd('Quit');
           case 'r':
@@ -1579,6 +1593,8 @@ Wdb = (function(superClass) {
             return this.toggle_break(data, true);
           case 'u':
             return cmd('Until');
+          case 'v':
+            return cmd('Allocations', data);
           case 'w':
             if (data) {
               return cmd('Watch', data);
@@ -1589,6 +1605,11 @@ Wdb = (function(superClass) {
               return cmd('Diff', data);
             }
             break;
+          case 'y':
+            if (data) {
+              return cmd('Referrers', data);
+            }
+            break;
           case 'z':
             return this.toggle_break(data, false, true);
         }
@@ -1705,6 +1726,9 @@ Wdb = (function(superClass) {
       "class": 'dump scroll-line'
     });
     this.interpreter.write($group);
+    if (data.size) {
+      this.code($group, data.size, ['duration'], false, 'Deep size');
+    }
     this.code($group, data["for"], ['for prompted']);
     $container = $('<div>');
     $table = $('<table>', {
@@ -1827,8 +1851,27 @@ Wdb = (function(superClass) {
     }
   };
 
+  Wdb.prototype.break_options = function(str) {
+    var j, key, len, match, option, options, ref, ref1, value;
+    options = {};
+    match = str.match(/\s*\[((\s*(ignore|hit|sample)\s*=\s*\d+\s*,?)+)\]\s*$/);
+    if (!match) {
+      return [str, options];
+    }
+    ref = match[1].split(',');
+    for (j = 0, len = ref.length; j < len; j++) {
+      option = ref[j];
+      if (!(option.trim())) {
+        continue;
+      }
+      ref1 = option.split('='), key = ref1[0], value = ref1[1];
+      options[key.trim()] = parseInt(value);
+    }
+    return [str.slice(0, match.index), options];
+  };
+
   Wdb.prototype.toggle_break = function(arg, temporary, remove_only) {
-    var brk, cmd, ebrk, exist, j, len, ref, ref1, ref2, ref3, remaining;
+    var brk, changed, cmd, ebrk, exist, j, key, len, option, options, ref, ref1, ref2, ref3, ref4, remaining, value;
     if (temporary == null) {
       temporary = false;
     }
@@ -1840,25 +1883,51 @@ Wdb = (function(superClass) {
       cond: null,
       fun: null,
       fn: null,
-      temporary: temporary
+      temporary: temporary,
+      ignore: null,
+      hit: null,
+      sample: null
     };
-    remaining = arg;
-    ref = this.split(remaining, ','), remaining = ref[0], brk.cond = ref[1];
-    ref1 = this.split(remaining, '#'), remaining = ref1[0], brk.fun = ref1[1];
-    ref2 = this.split(remaining, ':'), remaining = ref2[0], brk.lno = ref2[1];
+    ref = this.break_options(arg), remaining = ref[0], options = ref[1];
+    for (option in options) {
+      value = options[option];
+      brk[option] = value;
+    }
+    ref1 = this.split(remaining, ','), remaining = ref1[0], brk.cond = ref1[1];
+    ref2 = this.split(remaining, '#'), remaining = ref2[0], brk.fun = ref2[1];
+    ref3 = this.split(remaining, ':'), remaining = ref3[0], brk.lno = ref3[1];
     brk.fn = remaining || this.source.state.fn;
     brk.lno = parseInt(brk.lno) || null;
-    exist = false;
-    ref3 = this.source.breakpoints[brk.fn] || [];
-    for (j = 0, len = ref3.length; j < len; j++) {
-      ebrk = ref3[j];
+    exist = null;
+    ref4 = this.source.breakpoints[brk.fn] || [];
+    for (j = 0, len = ref4.length; j < len; j++) {
+      ebrk = ref4[j];
       if (ebrk.fn === brk.fn && ebrk.lno === brk.lno && ebrk.cond === brk.cond && ebrk.fun === brk.fun && (ebrk.temporary === brk.temporary || remove_only)) {
-        exist = true;
-        brk = ebrk;
+        exist = ebrk;
         break;
       }
     }
+    if (exist && !remove_only) {
+      changed = (function() {
+        var results;
+        results = [];
+        for (key in options) {
+          value = options[key];
+          if (exist[key] !== value) {
+            results.push(key);
+          }
+        }
+        return results;
+      })();
+      if (changed.length) {
+        this.source.clear_breakpoint(exist);
+        exist = null;
+      }
+    }
     if (exist || remove_only) {
+      if (exist) {
+        brk = exist;
+      }
       this.source.clear_breakpoint(brk);
       cmd = 'Unbreak';
       if (!brk.temporary) {
@@ -1,3 +1,3 @@
-/*! wdb 2019-09-16 */
+/*! wdb 2026-10-18 */
 
-var History,Interpreter,Log,Prompt,Source,Switch,Traceback,Watchers,Wdb,Websocket,help,extend=function(t,e){for(var n in e)hasProp.call(e,n)&&(t[n]=e[n]);function r(){this.constructor=t}return r.prototype=e.prototype,t.prototype=new r,t.__super__=e.prototype,t},hasProp={}.hasOwnProperty,indexOf=[].indexOf||function(t){for(var e=0,n=this.length;e<n;e++)if(e in this&&this[e]===t)return e;return-1};String.prototype.startsWith||(String.prototype.startsWith=function(t,e){return e=e||0,this.substr(e,t.length)===t}),document.createElement("dialog").showModal||$(function(){return $("head").append($("<script>",{src:"https://cdnjs.cloudflare.com/ajax/libs/dialog-polyfill/0.4.3/dialog-polyfill.min.js"})),$("head").append($("<link>",{rel:"stylesheet",href:"https://cdnjs.cloudflare.com/ajax/libs/dialog-polyfill/0.4.3/dialog-polyfill.min.css"}))}),Log=function(){function t(){this.debug=$("body").attr("data-debug")||!1}return t.prototype.time=function(){var t;return(t=new Date).getHours()+":"+t.getMinutes()+":"+t.getSeconds()+"."+t.getMilliseconds()},t.prototype.log=function(){var t;if(this.debug)return t=["["+this.constructor.name+"] ("+this.time()+")"].concat(Array.prototype.slice.call(arguments,0)),console.log.apply(console,t)},t.prototype.dbg=function(){var t;if(this.debug)return t=["["+this.constructor.name+"] ("+this.time()+")"].concat(Array.prototype.slice.call(arguments,0)),console.debug.apply(console,t)},t.prototype.fail=function(){var t;return t=[this.constructor.name].concat(Array.prototype.slice.call(arguments,0)),console.error.apply(console,t)},t}(),Websocket=function(){function r(t,e){var n;this.wdb=t,r.__super__.constructor.call(this),n="https:"===document.location.protocol?"wss:":"ws:",this.url=n+"//"+document.location.host+"/websocket/"+e,this.log("Opening new socket",this.url),this.ws=new WebSocket(this.url),this.ws.onclose=this.close.bind(this),this.ws.onopen=this.open.bind(this),this.ws.onerror=this.error.bind(this),this.ws.onmessage=this.message.bind(this)}return extend(r,Log),r.prototype.close=function(t){return this.log("Closed",t),this.wdb.die()},r.prototype.error=function(t){return this.fail("Error",t)},r.prototype.open=function(t){return this.log("Open",t),this.wdb.opening()},r.prototype.message=function(t){var e,n,r,o;return-1<(o=(r=t.data).indexOf("|"))?(e=r.substr(0,o),n=JSON.parse(r.substr(o+1))):e=r,this.dbg(this.time(),"<-",r),(e=e.toLowerCase())in this.wdb?this.wdb[e.toLowerCase()](n):this.fail("Unknown command",e)},r.prototype.send=function(t,e){var n;return null==e&&(e=null),n=e?("string"!=typeof e&&(e=JSON.stringify(e)),t+"|"+e):t,this.dbg("->",n),this.ws.send(n)},r}(),Source=function(){function o(t){var e,n,r;this.wdb=t,o.__super__.constructor.call(this),this.$container=$(".source").on("mousedown",(n=this,function(t){if(2===t.which&&n.code_mirror.getOption("readOnly"))return n.code_mirror.setOption("readOnly","nocursor")})).on("mouseup",(e=this,function(t){if(2===t.which)return e.code_mirror.setOption("readOnly",!0),e.wdb.paste_target(t)})),this.code_mirror=CodeMirror((r=this,function(t){return r.$code_mirror=$(t),r.$container.prepend(t)}),{value:"No active file",theme:"material",readOnly:!0,gutters:["breaks","CodeMirror-linenumbers"],lineNumbers:!0,extraKeys:{Esc:this.stop_edition.bind(this),"Ctrl-S":this.save.bind(this)}}),this.code_mirror.on("gutterClick",this.gutter_click.bind(this)),$(window).on("resize",this.size.bind(this)),this.state={fn:null,file:null,fun:null,lno:0},this.fun_scope=null,this.footsteps={},this.breakpoints={}}return extend(o,Log),o.prototype.external=function(t){var e,n;return null==t&&(t=!0),e=this.code_mirror.getCursor(),n=""+this.state.fn,t&&(n=n+":"+(e.line+1)+":"+(e.ch+1)),this.wdb.ws.send("External",n)},o.prototype.save=function(){var t;if(!this.code_mirror.getOption("readOnly"))return t=this.code_mirror.getValue(),this.wdb.ws.send("Save",this.state.fn+"|"+t),this.state.file=t},o.prototype.gutter_click=function(t,e){return this.wdb.toggle_break(":"+(e+1))},o.prototype.clear_breakpoint=function(t){var e,n;if(null==(e=this.breakpoints)[n=t.fn]&&(e[n]=[]),0<=indexOf.call(this.breakpoints[t.fn],t)&&this.breakpoints[t.fn].splice(this.breakpoints[t.fn].indexOf(t)),t.lno)return this.remove_mark(t.lno),this.remove_class(t.lno,"ask-breakpoint"),this.remove_class(t.lno,"breakpoint")},o.prototype.ask_breakpoint=function(t){return this.add_class(t,"ask-breakpoint")},o.prototype.set_breakpoint=function(t){var e,n;return null==(e=this.breakpoints)[n=t.fn]&&(e[n]=[]),this.breakpoints[t.fn].push(t),this.mark_breakpoint(t)},o.prototype.mark_breakpoint=function(t){if(t.lno)return this.remove_class(t.lno,"ask-breakpoint"),this.add_class(t.lno,"breakpoint"),this.add_mark(t.lno,"breakpoint","breaks",t.temporary?"○":"●",this.brk_to_str(t))},o.prototype.brk_to_str=function(t){var e;return e=t.temporary?"Temporary ":"",e+="Breakpoint",t.fun&&(e+=" On "+t.fun),t.lno&&(e+=" At "+t.lno),t.cond&&(e+=" If "+t.cond),e},o.prototype.get_selection=function(){return this.code_mirror.getSelection().trim()},o.prototype.get_breakpoint=function(t){var e,n,r,o,s,i;for(null==(e=this.breakpoints)[s=this.state.fn]&&(e[s]=[]),r=0,o=(i=this.breakpoints[this.state.fn]).length;r<o;r++)if((n=i[r]).lno===t)return n},o.prototype.add_class=function(t,e){return this.code_mirror.addLineClass(t-1,"background",e)},o.prototype.remove_class=function(t,e){return this.code_mirror.removeLineClass(t-1,"background",e)},o.prototype.add_mark=function(t,e,n,r,o){return this.code_mirror.setGutterMarker(t-1,n,$("<div>",{class:e,title:o}).html(r).get(0))},o.prototype.remove_mark=function(t){return this.code_mirror.setGutterMarker(t-1,"breaks",null)},o.prototype.stop_edition=function(){if(!this.code_mirror.getOption("readOnly"))return this.toggle_edition()},o.prototype.toggle_edition=function(){var t;if(t=this.code_mirror.getOption("readOnly"),this.code_mirror.setOption("readOnly",!t),this.$code_mirror.toggleClass("rw","ro"),this.wdb.print({for:"Toggling edition",result:"Edit mode "+(t?"on":"off")}),!t)return this.code_mirror.setValue(this.state.file)},o.prototype.open=function(t,e){var n;return n={fn:t.name,file:t.file||e.code,fun:e.function,lno:e.lno,flno:e.flno,llno:e.llno},this.set_state(n)},o.prototype.set_state=function(t){var e,n,r,o,s,i,a,l,c,d,p,h,u,m,f,b,y,g;if(y=!0,this.state.fn!==t.fn||this.state.file!==t.file)for(this.code_mirror.setOption("mode",this.get_mode(t.fn)),this.code_mirror.setValue(t.file),r=0,i=(p=this.breakpoints[t.fn]||[]).length;r<i;r++)n=p[r],this.mark_breakpoint(n);else if(this.state.fun!==t.fun){if("<module>"!==this.state.fun){for(this.remove_class(this.state.flno,"ctx-top"),l=o=h=this.state.flno,u=this.state.llno;h<=u?o<=u:u<=o;l=h<=u?++o:--o)this.remove_class(l,"ctx");this.remove_class(this.state.llno,"ctx-bottom")}}else y=!1;for(this.state=t,this.code_mirror.clearGutter("CodeMirror-linenumbers"),s=0,a=(m=this.footsteps[this.state.fn]||[]).length;s<a;s++)g=m[s],this.remove_class(g,"highlighted"),this.add_class(g,"footstep");if(y&&"<module>"!==this.state.fun){for(this.add_class(this.state.flno,"ctx-top"),l=d=f=this.state.flno,b=this.state.llno;f<=b?d<=b:b<=d;l=f<=b?++d:--d)this.add_class(l,"ctx");this.add_class(this.state.llno,"ctx-bottom")}return this.add_class(this.state.lno,"highlighted"),this.add_mark(this.state.lno,"highlighted","CodeMirror-linenumbers","➤"),null==(e=this.footsteps)[c=this.state.fn]&&(e[c]=[]),this.footsteps[this.state.fn].push(this.state.lno),this.code_mirror.scrollIntoView({line:this.state.lno,ch:1},this.$code_mirror.height()/2),this.code_mirror.refresh()},o.prototype.get_mode=function(t){switch(t.split(".").splice(-1)[0]){case"py":return"python";case"jinja2":return"jinja2";case"diff":return"diff";default:return"python"}},o.prototype.focused=function(){return this.$code_mirror.hasClass("CodeMirror-focused")},o.prototype.size=function(){return this.$code_mirror.height(0),this.$code_mirror.height(this.$container.height()),this.code_mirror.refresh()},o}(),History=function(){function n(t){var e;this.prompt=t,n.__super__.constructor.call(this),this.index=-1,this.current="",this.currentPos=CodeMirror.Pos(0,0),this.oldIndex=null,this.originalIndex=null,this.overlay=null;try{this.history=JSON.parse(localStorage.history||"[]")}catch(t){e=t,this.fail(e),this.history=[]}this.sessionIndexStart=this.history.filter(function(t){return 0!==t.indexOf(".")}).length}return extend(n,Log),n.prototype.up=function(){return-1===this.index&&this.saveCurrent(),this.index=Math.min(this.history.length-1,this.index+1),this.sync()},n.prototype.down=function(){return this.index=Math.max(this.index-1,-1),this.sync()},n.prototype.saveCurrent=function(){return this.current=this.prompt.get(),this.currentPos=this.prompt.code_mirror.getCursor()},n.prototype.sync=function(){return-1===this.index?(this.prompt.set(this.current),this.prompt.code_mirror.setCursor(this.currentPos)):(this.prompt.set(this.history[this.index]),this.prompt.code_mirror.setCursor(this.prompt.code_mirror.lineCount(),0))},n.prototype.historize=function(t){var e;if(t){for(;-1!==(e=this.history.indexOf(t));)this.history.splice(e,1);return this.history.unshift(t),localStorage&&(localStorage.history=JSON.stringify(this.history))}},n.prototype.reset=function(){return this.index=-1,this.current="",this.currentPos=CodeMirror.Pos(0,0)},n.prototype.clear=function(){return this.history=[],this.sessionIndexStart=0,this.reset()},n.prototype.getOverlay=function(n){return{token:function(t){var e;if(n.lastIndex=t.pos,(e=n.exec(t.string))&&e.index===t.pos)return t.pos+=e[0].length||1,"searching";e?t.pos=e.index:t.skipToEnd()}}},n.prototype.searchPrev=function(t){return this.searchNext(t,-1)},n.prototype.searchNext=function(t,e){var n;for(null==e&&(e=1),null==this.oldIndex&&(this.oldIndex=this.index),null==this.originalIndex&&(this.originalIndex=this.index,-1===this.index&&this.saveCurrent());1===e&&this.index<this.history.length||-1===e&&-1<this.index;)if(this.index+=e,(n=new RegExp("("+t.replace(/[\-\[\]\/\{\}\(\)\*\+\?\.\\\^\$\|]/g,"\\$&")+")","gi")).test(this.history[this.index]))return this.lastResult=this.index,this.sync(),null!=this.overlay&&this.prompt.code_mirror.removeOverlay(this.overlay,!0),this.overlay=this.getOverlay(n),this.prompt.code_mirror.addOverlay(this.overlay),!0;return!1},n.prototype.commitSearch=function(){return this.oldIndex=null,this.originalIndex=null,this.index=this.lastResult,this.sync()},n.prototype.rollbackSearch=function(){return(this.oldIndex=null)!=this.originalIndex&&(this.index=this.originalIndex),(this.originalIndex=null)!=this.overlay&&this.prompt.code_mirror.removeOverlay(this.overlay,!0),this.overlay=null,this.sync()},n.prototype.resetSearch=function(){return null!=this.oldIndex&&(this.index=this.oldIndex),this.oldIndex=null},n.prototype.getSessionHistory=function(){return this.history.slice(0,this.history.length-this.sessionIndexStart)},n.prototype.getHistory=function(t){var e,n;return e=0,n=this.history.length-this.sessionIndexStart,"down"===t?n=this.index+1:"up"===t&&(e=this.index),this.history.slice(e,n)},n}(),Traceback=function(){function e(t){this.wdb=t,e.__super__.constructor.call(this),this.$traceback=$(".traceback"),this.$traceback.on("click",".trace-line",this.select.bind(this))}return extend(e,Log),e.prototype.select=function(t){var e;return e=$(t.currentTarget).attr("data-level"),this.wdb.select_trace(e),$(".mdl-layout__obfuscator").is(".is-visible")&&$(".mdl-layout").get(0).MaterialLayout.toggleDrawer(),!1},e.prototype.make_trace=function(t){var e,n,r,o,s,i,a,l,c,d,p;for(this.clear(),this.show(),p=[],i=0,l=t.length;i<l;i++){for(s=t[i],r=$("<a>",{class:"trace-line ellipsis mdl-list__item mdl-list__item--three-line trace-"+s.level}).attr("data-level",s.level).attr("title",'File "'+s.file+'", line '+s.lno+", in "+s.function+"\n    "+s.code),a=0,c=(d=this.wdb.source.breakpoints[s.file]||[]).length;a<c;a++)if(!((o=d[a]).cond||o.fun||o.lno)){r.addClass("breakpoint");break}s.current&&r.addClass("real-selected"),(e=$("<div>",{class:"mdl-list__item-primary-content"})).append($("<div>",{class:"ellipsis"}).text(s.function)),e.append($("<div>",{class:"mdl-list__item-text-body"}).append(n=$("<div>",{class:"ellipsis"})).append($("<div>",{class:"ellipsis"}).text(s.file.split("/").slice(-1)[0]+":"+s.lno).prepend($("<i>",{class:"material-icons"}).text(this.get_fn_icon(s.file))))),this.wdb.code(n,s.code,["ellipsis"]),r.append(e),p.push(this.$traceback.prepend(r))}return p},e.prototype.hide=function(){return this.$traceback.addClass("hidden")},e.prototype.show=function(){return this.$traceback.removeClass("hidden")},e.prototype.clear=function(){return this.$traceback.empty()},e.prototype.get_fn_icon=function(t){return~t.indexOf("site-packages")?"library_books":t.startsWith(this.wdb.cwd)||"/"!==t[0]?"star":t.startsWith("/home/")?"home":t.startsWith("/usr/lib")&&~t.indexOf("/python")?"lock":"cloud"},e}(),Interpreter=function(){function n(t){var e;this.wdb=t,n.__super__.constructor.call(this),this.$terminal=$(".terminal").on("click",(e=this,function(){if(!getSelection().toString())return e.focus()})).on("click","a.inspect",this.inspect.bind(this)),this.$scrollback=$(".scrollback").on("click",".short.close",this.short_open.bind(this)).on("click",".short.open",this.short_close.bind(this)).on("click",".toggle",this.toggle_visibility.bind(this))}return extend(n,Log),n.prototype.scroll=function(t){if(null==t&&(t=null),!t)return this.wdb.prompt.$container.get(0).scrollIntoView({behavior:"smooth"});this.$terminal.scrollTop(this.$terminal.scrollTop()+t*this.$terminal.height())},n.prototype.clear=function(){return this.$scrollback.empty()},n.prototype.write=function(t){return this.$scrollback.append(t)},n.prototype.inspect=function(t){return this.wdb.inspect($(t.currentTarget).attr("href"))},n.prototype.short_open=function(t){return $(t.currentTarget).addClass("open").removeClass("close").next(".long").show("fast")},n.prototype.short_close=function(t){return $(t.currentTarget).addClass("close").removeClass("open").next(".long").hide("fast")},n.prototype.toggle_visibility=function(t){return $(t.currentTarget).add($(t.currentTarget).next()).toggleClass("closed","shown")},n.prototype.focus=function(t){var e;return e=this.$terminal.scrollTop(),this.wdb.prompt.focus(),this.$terminal.scrollTop(e)},n}(),Prompt=function(){function h(t){var e,c,o,n,r,s,i,a,l,d,p;this.wdb=t,h.__super__.constructor.call(this),this.$container=$(".prompt"),this.history=new History(this),this.code_mirror=CodeMirror((e=this,function(t){return e.$code_mirror=$(t),e.$container.prepend(t)}),{value:"",theme:"default",language:"python",viewportMargin:1/0,lineWrapping:!0,autofocus:!0,specialChars:/[\u0000-\u0019\u00a0\u00ad\u200b-\u200f\u2028\u2029\ufeff]/}),this.code_mirror.on("changes",this.changes.bind(this)),CodeMirror.registerHelper("hint","jedi",(c=this,function(t,e,n){var r,o,s,i,a,l;if(r=t.getCursor(),l=t.getTokenAt(r),!t.getValue().startsWith(".")||2!==t.getValue().length)if(o=CodeMirror.Pos(r.line,l.start),a=CodeMirror.Pos(r.line,l.end),"."!==t.getValue()){if(n.completeSingle||l.string.match(/[\w\.\(\[\{]/))return c.wdb.ws.send("Complete",{source:t.getValue(),pos:c.code_mirror.getRange({line:0,ch:0},r).length,line:r.line+1,column:r.ch,manual:n.completeSingle}),c.completion={cur:r,tok:l,from:o,to:a,callback:e}}else e({from:o,to:a,list:function(){var t,e;for(i in e=[],t={a:"History",b:"Break",c:"Continue",d:"Dump",e:"Edition",f:"Find",g:"Clear",h:"Help",i:"Display",j:"Jump",k:"Clear",l:"Breakpoints",m:"Restart",n:"Next",o:"Open",q:"Quit",r:"Return",s:"Step",t:"Tbreak",u:"Until",w:"Watch",x:"Diff",z:"Unbreak"})hasProp.call(t,i)&&(s=t[i],e.push({text:"."+i,displayText:"."+i+" <i>"+this.leftpad("("+s+")",14)+"</i>  ",render:function(t,e,n){return $(t).html(n.displayText)}}));return e}.call(c)})})),this.code_mirror.addKeyMap({Enter:this.newLineOrExecute.bind(this),Up:this.history.up.bind(this.history),Down:this.history.down.bind(this.history),"Ctrl-C":this.abort.bind(this),"Ctrl-D":(d=this,function(){if(!d.get())return d.wdb.die()}),"Ctrl-F":function(){},"Ctrl-R":(l=this,function(){return l.searchBack()}),"Ctrl-S":(a=this,function(){return a.searchBack(!1)}),"Ctrl-K":"killLine","Ctrl-L":this.wdb.cls.bind(this.wdb),"Ctrl-Enter":"newlineAndIndent","Alt-Backspace":"delGroupBefore","Ctrl-Space":this.triggerAutocomplete.bind(this),"Ctrl-Up":(i=this,function(){return i.insertHistory("up")}),"Ctrl-Down":(s=this,function(){return s.insertHistory("down")}),PageUp:"goLineUp",PageDown:"goLineDown",PageDown:"goLineDown","Shift-PageUp":(r=this,function(){return r.wdb.interpreter.scroll(-1)}),"Shift-PageDown":(n=this,function(){return n.wdb.interpreter.scroll(1)}),Tab:(o=this,function(t,e){var n,r;return n=o.code_mirror.getCursor(),o.code_mirror.getRange({line:n.line,ch:0},n).trim()?o.triggerAutocomplete(t,e):(r=Array(o.code_mirror.getOption("indentUnit")+1).join(" "),o.code_mirror.replaceSelection(r))})}),this.code_mirror.on("keyup",(p=this,function(t,e){var n;if(t.getValue()&&!(8<(n=e.keyCode)&&n<42))return CodeMirror.commands.autocomplete(t,CodeMirror.hint.jedi,{async:!0,completeSingle:!1,extraKeys:{PageUp:"goPageUp",PageDown:"goPageDown",Home:"goLineStartSmart",Up:function(t,e){return e._dirty=!0,e.moveFocus(-1)},Down:function(t,e){return e._dirty=!0,e.moveFocus(1)},Enter:function(t,e){return e._dirty?e.pick():p.newLineOrExecute(t)},Right:function(t,e){return e._dirty?e.pick():CodeMirror.commands.goCharRight(t)},End:"goLineEnd"}})}))}return extend(h,Log),h.prototype.complete=function(s){var o,i,t,e,n;return s.completions&&this.completion?(i=this.completion.cur,e=this.completion.tok,t={from:CodeMirror.Pos(i.line,e.start),to:CodeMirror.Pos(i.line,e.end),list:function(){var t,e,n,r;for(r=[],t=0,e=(n=s.completions).length;t<e;t++)o=n[t],r.push({text:o.base+o.complete,from:CodeMirror.Pos(i.line,i.ch-o.base.length),to:i,_completion:o,render:function(t,e,n){var r,o;return o="<b>"+(r=n._completion).base+"</b>"+r.complete,$(t).html(o)}});return r}()},CodeMirror.on(t,"shown",(n=this,function(){var t;return t=n.code_mirror.state.completionActive.options.completeSingle?"triggered":"auto",$(n.code_mirror.state.completionActive.widget.hints).addClass(t)})),void this.completion.callback(t)):s.imports?CodeMirror.commands.autocomplete(this.code_mirror,function(t,e){var o;return{from:CodeMirror.Pos(0,0),to:CodeMirror.Pos(0,0),list:function(){var t,e,n,r;for(r=[],t=0,e=(n=s.imports).length;t<e;t++)o=n[t],r.push({text:o,from:CodeMirror.Pos(0,0),to:CodeMirror.Pos(0,0),render:function(t,e,n){var r;return r="<em>"+n.text+"</em>",$(t).html(r)}});return r}()}},{async:!1,completeSingle:!1}):void 0},h.prototype.triggerAutocomplete=function(t,e){return CodeMirror.commands.autocomplete(t,CodeMirror.hint.jedi,{async:!0,extraKeys:{Right:function(t,e){return e.pick()}}})},h.prototype.newLineOrExecute=function(t){var e;if(e=t.getValue().trim())return t.setOption("readOnly","nocursor"),this.$container.addClass("loading"),this.wdb.execute(e)},h.prototype.focus=function(){return this.code_mirror.focus()},h.prototype.focused=function(){return this.$code_mirror.hasClass("CodeMirror-focused")},h.prototype.abort=function(){return this.history.reset(),this.set("")},h.prototype.ready=function(t){var e;return null==t&&(t=!1),t?this.code_mirror.execCommand("newlineAndIndent"):(e=this.code_mirror.getValue().trim(),this.history.historize(e),this.history.reset(),this.set("")),this.unlock()},h.prototype.unlock=function(){return this.$container.removeClass("loading"),this.code_mirror.setOption("readOnly",!1),this.focus()},h.prototype.get=function(){return this.code_mirror.getValue()},h.prototype.set=function(t){return this.code_mirror.setValue(t)},h.prototype.leftpad=function(t,e,n){var r,o;for(null==n&&(n=" "),r=0,o=e-t.length;0<=o?r<=o:o<=r;0<=o?++r:--r)t=n+t;return t},h.prototype.searchBack=function(t){var e,r,o,n;return null==t&&(t=!0),this.$code_mirror.addClass("extra-dialog"),this.code_mirror.openDialog('<span class="search-dialog-title">\n  Search '+(t?"backward":"forward")+':\n</span>\n<input type="text" style="width: 10em" class="CodeMirror-search-field"/>',(n=this,function(t,e){return n.history.commitSearch()}),{bottom:!0,onInput:(o=this,function(t,e,n){if(e)return o.history.resetSearch(),$(".CodeMirror-search-field").toggleClass("not-found",e&&!o.history[n.back?"searchNext":"searchPrev"](e))}),onKeyDown:(r=this,function(t,e,n){return(82===t.keyCode&&t.ctrlKey||83===t.keyCode&&t.altKey)&&(n.back=!0,$(".search-dialog-title").text("Search backward:"),$(".CodeMirror-search-field").toggleClass("not-found",e&&!r.history.searchNext(e)),t.preventDefault(),t.stopPropagation()),(83===t.keyCode&&t.ctrlKey||82===t.keyCode&&t.altKey)&&(n.back=!1,$(".search-dialog-title").text("Search forward:"),$(".CodeMirror-search-field").toggleClass("not-found",e&&!r.history.searchPrev(e)),t.preventDefault(),t.stopPropagation()),67===t.keyCode&&t.ctrlKey&&n(),!1}),onClose:(e=this,function(t){return e.history.rollbackSearch(),e.$code_mirror.removeClass("extra-dialog")})}).back=t},h.prototype.insert=function(t){return this.code_mirror.replaceRange(t,this.code_mirror.getCursor())},h.prototype.changes=function(){return window.setTimeout((t=this,function(){return t.wdb.interpreter.scroll()}));var t},h.prototype.insertHistory=function(t){var e;return e=this.history.getHistory(t).reverse().join("\n"),this.history.reset(),this.set(e)},h}(),Watchers=function(){function e(t){this.wdb=t,e.__super__.constructor.call(this),this.$watchers=$(".watchers").on("click",".watching .name",this.unwatch.bind(this))}return extend(e,Log),e.prototype.unwatch=function(t){var e;return e=$(t.currentTarget).closest(".watching").attr("data-expr"),this.wdb.unwatch(e)},e.prototype.updateAll=function(t){var e,n;for(n in t)hasProp.call(t,n)&&(e=t[n],this.update(n,e));return this.$watchers.find(".watching:not(.updated)").remove(),this.$watchers.find(".watching").removeClass("updated")},e.prototype.update=function(e,t){var n,r,o;return(o=this.$watchers.find(".watching").filter(function(t){return $(t).attr("data-expr")===e})).length?(o.find(".value code").remove(),this.wdb.code(o.find(".value"),t.toString(),[],!0)):(n=$("<code>",{class:"name"}),r=$("<div>",{class:"value"}),this.$watchers.append(o=$("<div>",{class:"watching"}).attr("data-expr",e).append(n.text(e),$("<code>").text(": "),r)),this.wdb.code(r,t.toString(),[],!0)),o.addClass("updated")},e}(),Switch=function(){function r(t){var e,n;this.wdb=t,r.__super__.constructor.call(this),this.$trace=$(".trace"),this.$switches=$(".switch").click((e=this,function(t){return e.switch($(t.currentTarget))})),this.$command=$(".command").click((n=this,function(t){return n.command($(t.currentTarget))})),this.$source=$(".source"),this.$interpreter=$(".interpreter")}return extend(r,Log),r.prototype.switch=function(t){if(t.is(".power")){if(t.is(".off"))return this.wdb.disable();if(t.is(".on"))return parent.postMessage("activate","*")}else if(t.is(".code")){if(t.is(".off"))return this.open_code();if(t.is(".on"))return this.close_code()}else if(t.is(".term")){if(t.is(".off"))return this.open_term();if(t.is(".on"))return this.close_term()}},r.prototype.open_trace=function(){return this.$trace.addClass("mdl-layout--fixed-drawer")},r.prototype.close_trace=function(){return this.$trace.removeClass("mdl-layout--fixed-drawer")},r.prototype.open_code=function(){return this.$switches.filter(".code").removeClass("off").addClass("on").removeClass("mdl-button--accent"),this.$source.removeClass("hidden"),this.wdb.source.size()},r.prototype.close_code=function(){return this.$switches.filter(".code").removeClass("on").addClass("off").addClass("mdl-button--accent"),this.$source.addClass("hidden"),this.wdb.source.size()},r.prototype.open_term=function(){return this.$switches.filter(".term").removeClass("off").addClass("on").removeClass("mdl-button--accent"),this.$interpreter.removeClass("hidden"),this.wdb.source.size()},r.prototype.close_term=function(){return this.$switches.filter(".term").removeClass("on").addClass("off").addClass("mdl-button--accent"),this.$interpreter.addClass("hidden"),this.wdb.source.size()},r.prototype.command=function(t){return this.wdb.execute("."+t.attr("data-command"))},r}(),help='<div class="mdl-tabs mdl-js-tabs mdl-js-ripple-effect">\n  <div class="mdl-tabs__tab-bar">\n      <a href="#help-stepping" class="mdl-tabs__tab is-active">Stepping</a>\n      <a href="#help-breakpoints" class="mdl-tabs__tab">Breakpoints</a>\n      <a href="#help-inspecting" class="mdl-tabs__tab">Inspecting</a>\n      <a href="#help-prompt" class="mdl-tabs__tab">Prompt</a>\n      <a href="#help-misc" class="mdl-tabs__tab">Misc</a>\n  </div>\n\n  <div class="mdl-tabs__panel is-active" id="help-stepping">\n    <table class="mdl-data-table mdl-js-data-table mdl-shadow--2dp">\n      <tr>\n        <td class="cmd">\n          <samp>.s</samp> or <kbd>Alt</kbd> + <kbd>↓</kbd> or <kbd>F11</kbd>\n        </td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          Step into\n        </td>\n      </tr>\n      <tr>\n        <td class="cmd">\n          <samp>.n</samp> or <kbd>Alt</kbd> + <kbd>→</kbd> or <kbd>F10</kbd>\n        </td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          Step over (Next)\n        </td>\n      </tr>\n      <tr>\n        <td class="cmd">\n          <samp>.u</samp> or <kbd>Alt</kbd> + <kbd>←</kbd> or <kbd>F7</kbd>\n        </td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          Until (Next over loops)\n        </td>\n      </tr>\n      <tr>\n        <td class="cmd">\n          <samp>.r</samp> or <kbd>Alt</kbd> + <kbd>↑</kbd> or <kbd>F9</kbd>\n        </td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          Step out (Return)\n        </td>\n      </tr>\n      <tr>\n        <td class="cmd">\n          <samp>.c</samp> or <kbd>Alt</kbd> + <kbd>Enter</kbd> or <kbd>F8</kbd>\n        </td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          Continue\n        </td>\n      </tr>\n      <tr>\n        <td class="cmd"><samp>.j</samp> lineno</td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          Jump to lineno (Must be at bottom frame and in the same function)\n        </td>\n      </tr>\n      <tr>\n        <td class="cmd"><samp>.q</samp></td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          Quit\n        </td>\n      </tr>\n    </table>\n    <aside class="note">\n      All commands are prefixed with a dot and can be\n      executed with <kbd>Alt</kbd> + <kbd>the-command-letter</kbd>,\n      i.e.: <kbd>Alt</kbd> + <kbd>h</kbd>\n    </aside>\n  </div>\n  <div class="mdl-tabs__panel" id="help-breakpoints">\n    <table class="mdl-data-table mdl-js-data-table mdl-shadow--2dp">\n      <tr>\n        <td class="cmd"><samp>.b</samp> arg</td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          Set a session breakpoint\n        </td>\n      </tr>\n      <tr>\n        <td class="cmd"><samp>.t</samp> arg</td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          Set a temporary breakpoint\n        </td>\n      </tr>\n      <tr>\n        <td class="cmd"><samp>.z</samp> arg</td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          Delete existing breakpoint\n        </td>\n      </tr>\n      <tr>\n        <td class="cmd"><samp>.l</samp></td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          List active breakpoints\n        </td>\n      </tr>\n      <tr>\n        <td class="cmd">Breakpoint argument format</td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          <code>[file/module][:lineno][#function][,condition]</code>\n        </td>\n      </tr>\n      <tr>\n        <td class="cmd"><code>[file]</code></td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          Break if any line of <code>file</code> is executed</td>\n      </tr>\n      <tr>\n        <td class="cmd"><code>[file]:lineno</code></td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          Break on <code>file</code> at <code>lineno</code></td>\n      </tr>\n      <tr>\n        <td class="cmd"><code>[file][:lineno],condition</code></td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n            Break on <code>file</code> at <code>lineno</code> if\n            <code>condition</code> is <code>True</code>\n            (ie: <code>i == 10)</code></td>\n      </tr>\n      <tr>\n        <td class="cmd"><code>[file]#function</code></td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          Break when inside <code>function</code> function</td>\n      </tr>\n    </table>\n    <aside class="note">\n      File is always current file by default and you can also\n      specify a module like <code>logging.config</code>.\n    </aside>\n  </div>\n  <div class="mdl-tabs__panel" id="help-inspecting">\n    <table class="mdl-data-table mdl-js-data-table mdl-shadow--2dp">\n    <tr>\n      <td class="cmd"><samp>.a</samp></td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Echo all typed commands in the current debugging session\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><samp>.d</samp> expression</td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Dump the result of expression in a table\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><samp>.w</samp> expression</td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Watch expression in current file (Click on the name to remove)\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><samp>.i</samp> [mime/type;]expression</td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Display the result in an embed, mime type defaults to "text/html"\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><samp>.x</samp> left ? right</td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Display the difference between the pretty print of \'left\' and \'right\'\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><samp>.x</samp> left <> right</td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Display the difference between the repr of \'left\' and \'right\'\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><samp>.f</samp> key in expression</td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Search recursively the presence of key in expression object tree\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><samp>.f</samp> test of expression</td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Search recursively values that match test in expression inner tree.\n        i.e.: .f type(x) == int of sys\n      </td>\n    </tr>\n  </table>\n</div>\n<div class="mdl-tabs__panel" id="help-prompt">\n  <table class="mdl-data-table mdl-js-data-table mdl-shadow--2dp">\n    <tr>\n      <td class="cmd">iterable!sthg</td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        If <a href="https://github.com/paradoxxxzero/cutter">\n          cutter\n        </a> is installed, executes cut(iterable).sthg\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd">expr >! file</td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Write the result of expr in file\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd">!< file</td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Eval the content of file\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><kbd>Enter</kbd></td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Eval the current selected text in page,\n        useful to eval code in the source\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><kbd>Shift</kbd> + <kbd>Enter</kbd></td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Insert the current selected text in page in the prompt\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><kbd>Ctrl</kbd> + <kbd>Enter</kbd></td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Force multiline prompt\n      </td>\n    </tr>\n  </table>\n</div>\n<div class="mdl-tabs__panel" id="help-misc">\n  <table class="mdl-data-table mdl-js-data-table mdl-shadow--2dp">\n    <tr>\n      <td class="cmd"><samp>.h</samp></td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Get some help\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><samp>.m</samp></td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Restart program\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><samp>.e</samp></td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Toggle file edition mode\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><samp>.o</samp></td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Try to open file in external ($EDITOR / $VISUAL / xdg-open) editor.\n        <br>\n        Add an argument (or hold shift with alt+o) if your editor does not\n        support the file:lno:col syntax.\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><samp>.g</samp></td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Clear scrollback\n      </td>\n    </tr>\n  </table>\n</div>',Wdb=function(){function t(){t.__super__.constructor.call(this),this.started=!1,this.cwd=null,this.file_cache={},this.last_cmd=null,this.evalTime=null,this.ws=new Websocket(this,$("[data-uuid]").attr("data-uuid")),this.traceback=new Traceback(this),this.source=new Source(this),this.interpreter=new Interpreter(this),this.prompt=new Prompt(this),this.switch=new Switch(this),this.watchers=new Watchers(this),this.$patience=$(".patience"),$(window).on("beforeunload",this.unload.bind(this))}return extend(t,Log),t.prototype.__version__="3.3.1",t.prototype.opening=function(){return this.started||($(window).on("keydown",this.global_key.bind(this)),this.started=!0),this.ws.send("Start"),this.switch.open_term()},t.prototype.working=function(){return $("body,.activity").addClass("is-active")},t.prototype.chilling=function(){return $("body,.activity").removeClass("is-active")},t.prototype.done=function(){return this.interpreter.scroll(),this.prompt.ready(),this.chilling()},t.prototype.init=function(t){var e,n,r,o,s,i,a;for(t.version!==this.constructor.prototype.__version__&&this.print({for:"Client Server version mismatch !",result:"Server is "+this.constructor.prototype.__version__+" and Client is "+(t.version||"<= 2.0")}),this.cwd=t.cwd,a=[],o=0,s=(r=t.breaks).length;o<s;o++)n=r[o],null==(e=this.source.breakpoints)[i=n.fn]&&(e[i]=[]),a.push(this.source.breakpoints[n.fn].push(n));return a},t.prototype.title=function(t){return $(".title").text(t.title).attr("title",t.title),$(".subtitle").text(t.subtitle).attr("title",t.subtitle)},t.prototype.trace=function(t){return this.switch.open_trace(),this.traceback.make_trace(t.trace)},t.prototype.select_trace=function(t){return this.ws.send("Select",t)},t.prototype.selectcheck=function(t){return t.name in this.file_cache?(t.file=this.file_cache[t.name],this.select(t)):this.ws.send("File",t.name)},t.prototype.select=function(t){var e;return e=t.frame,this.switch.open_code(),$(".trace-line").removeClass("selected"),$(".trace-"+e.level).addClass("selected"),this.file_cache[t.name]=t.file,this.source.open(t,e),this.done()},t.prototype.ellipsize=function(t){return t.find("span.cm-string").each(function(){var t;if(128<(t=$(this).text()).length)return $(this).text(""),$(this).append($('<span class="short close">').text(t.substr(0,128))),$(this).append($('<span class="long">').text(t.substr(128)))})},t.prototype.code=function(t,e,i,n,a,l){var r,o,s,c,d,p;if(null==i&&(i=[]),null==n&&(n=!1),null==a&&(a=null),null==l&&(l="python"),n)o="<"!==e[0]||">"!==e.slice(-1)?$("<div>",{class:"out"}).html(e):$(e),t.append(o),o.add(o.find("*")).contents().filter(function(){return 3===this.nodeType&&0<this.nodeValue.length&&!$(this.parentElement).closest("thead").length}).wrap("<code>").parent().each((p=this,function(t,e){var n,r,o,s;for((n=$(e)).addClass("waiting_for_hl").addClass("cm-s-default"),o=0,s=i.length;o<s;o++)r=i[o],n.addClass(r);return a&&n.attr("title",a),setTimeout(function(){return CodeMirror.runMode(n.text(),l,n.get(0)),n.removeClass("waiting_for_hl"),p.ellipsize(n)},50)}));else{for(r=$("<code>",{class:"cm-s-default"}),c=0,d=i.length;c<d;c++)s=i[c],r.addClass(s);a&&r.attr("title",a),t.append(r),CodeMirror.runMode(e,l,r.get(0)),this.ellipsize(r)}return r},t.prototype.execute=function(t){var e,n,r,o,s,i,a;if(i=this,e=function(){return i.ws.send.apply(i.ws,arguments),i.last_cmd=arguments,i.working()},0===t.indexOf("."))return s=t.indexOf(" "),n=-1<s?(r=t.substr(1,s-1),t.substr(s+1)):(r=t.substr(1),""),void(function(){switch(r){case"a":return this.printHistory();case"b":return this.toggle_break(n);case"c":return e("Continue");case"d":if(n)return e("Dump",n);break;case"e":return this.source.toggle_edition();case"f":if(n)return e("Find",n);break;case"g":return this.cls();case"h":return this.printHelp();case"i":if(n)return e("Display",n);break;case"j":if(n)return e("Jump",n);break;case"k":return this.clearHistory();case"l":return e("Breakpoints");case"m":return e("Restart");case"n":return e("Next");case"o":return this.source.external(!n);case"q":return e("Quit");case"r":return e("Return");case"s":return e("Step");case"t":return this.toggle_break(n,!0);case"u":return e("Until");case"w":if(n)return e("Watch",n);break;case"x":if(n)return e("Diff",n);break;case"z":return this.toggle_break(n,!1,!0)}}.call(this)||this.prompt.unlock());if(0!==t.indexOf("?")){if(""!==t||!this.last_cmd)return t?(this.working(),this.ws.send("Eval",t),this.evalTime="undefined"!=typeof performance&&null!==performance?performance.now():void 0,this.$patience.text(this.pretty_time(0)),a=this,o=function(){var t;if(a.evalTime)return t=parseInt(1e3*(performance.now()-a.evalTime)),a.$patience.text(a.pretty_time(t)),requestAnimationFrame(o);a.$patience.text("")},requestAnimationFrame(o)):void 0;e.apply(this,this.last_cmd)}else e("Dump",t.slice(1).trim())},t.prototype.cls=function(){return this.interpreter.clear(),this.done()},t.prototype.printHistory=function(t){return this.print({for:"History",result:this.prompt.history.getSessionHistory().reverse().filter(function(t){return 0!==t.indexOf(".")}).join("\n")})},t.prototype.clearHistory=function(){return this.prompt.history.clear()},t.prototype.printHelp=function(){return this.dialog("Help",help),this.done()},t.prototype.print=function(t){var e,n,r,o,s,i;return this.evalTime&&(o=parseInt(1e3*(performance.now()-this.evalTime)),i=performance.now(),this.evalTime=null),e=$("<div>",{class:"printed scroll-line"}),this.interpreter.write(e),e.append(r=$("<div>")),this.code(e,t.for,["for prompted"]),n=$("<div>",{class:"result"}),e.append(n),this.code(n,t.result||" ",["val"],!0),s=parseInt(1e3*(performance.now()-i)),t.duration&&this.code(r,this.pretty_time(t.duration),["duration"],!1,"Total "+this.pretty_time(o)+" + "+this.pretty_time(s)+" of rendering"),this.done()},t.prototype.echo=function(t){var e,n;return e=$("<div>",{class:"echoed scroll-line"}),this.interpreter.write(e),this.code(e,t.for,["for prompted"]),n=$("<div>",{class:"result"}),e.append(n),this.code(n,t.val||"",["val"],!0,null,t.mode),this.done()},t.prototype.rawhtml=function(t){var e;return e=$("<div>",{class:"rawhtml scroll-line"}),this.interpreter.write(e),this.code(e,t.for,["for prompted"]),this.interpreter.write(t.val),this.done()},t.prototype.dump=function(t){var e,n,r,o,s,i,a,l,c,d,p,h,u;for(p in i=$("<div>",{class:"dump scroll-line"}),this.interpreter.write(i),this.code(i,t.for,["for prompted"]),r=$("<div>"),c=$("<table>",{class:"mdl-data-table mdl-js-data-table mdl-shadow--2dp object"}).appendTo(r),o=$("<thead>",{class:"toggle closed"}).append($("<tr>").append($("<th>",{class:"core",colspan:2}).text("Core Members"))).appendTo(c),s=$("<tbody>",{class:"core closed"}).appendTo(c),a=$("<thead>",{class:"toggle closed"}).append($("<tr>").append($("<th>",{class:"method",colspan:2}).text("Methods"))).appendTo(c),l=$("<tbody>",{class:"method closed"}).appendTo(c),e=$("<thead>",{class:"toggle closed"}).append($("<tr>").append($("<th>",{class:"attr",colspan:2}).text("Attributes"))).appendTo(c),n=$("<tbody>",{class:"attr closed"}).appendTo(c),h=t.val)u=h[p],d=n,0===p.indexOf("__")&&-1!==p.indexOf("__",p.length-2)?d=s:-1!==u.type.indexOf("method")&&(d=l),d.append($("<tr>").append($("<td>",{class:"key"}).text(p)).append($("<td>",{class:"mdl-data-table__cell--non-numeric val"}).html(u.val)));return 0===s.find("tr").length&&(o.remove(),s.remove()),0===n.find("tr").length&&(e.remove(),n.remove()),0===l.find("tr").length&&(a.remove(),l.remove()),t.doc&&(c.append($("<thead>",{class:"toggle closed"}).append($("<tr>").append($("<th>",{class:"doc",colspan:2}).text("Documentation")))),$("<tbody>",{class:"doc closed"}).append($("<tr>").append($("<td>",{class:"mdl-data-table__cell--non-numeric doc",colspan:2}).text(t.doc))).appendTo(c)),t.source&&(c.append($("<thead>",{class:"toggle closed"}).append($("<tr>").append($("<th>",{class:"source",colspan:2}).text("Source")))),$("<tbody>",{class:"source closed"}).append($("<tr>").append($("<td>",{class:"mdl-data-table__cell--non-numeric source",colspan:2}).text(t.source))).appendTo(c)),componentHandler.upgradeElement(c.get(0)),this.code(i,r.html(),[],!0),this.done()},t.prototype.breakset=function(t){var e;return this.source.set_breakpoint(t),"."!==this.prompt.get()[0]||"b"!==(e=this.prompt.get()[1])&&"t"!==e?this.chilling():this.done()},t.prototype.breakunset=function(t){var e;return this.source.clear_breakpoint(t),"."!==this.prompt.get()[0]||"b"!==(e=this.prompt.get()[1])&&"t"!==e&&"z"!==e?this.chilling():this.done()},t.prototype.split=function(t,e){var n;return 0<=indexOf.call(t,e)?[(n=t.split(e))[0],n.slice(1).join(e).trim()]:[t,null]},t.prototype.toggle_break=function(t,e,n){var r,o,s,i,a,l,c,d,p,h,u;for(null==e&&(e=!1),null==n&&(n=!1),r={lno:null,cond:null,fun:null,fn:null,temporary:e},u=t,u=(c=this.split(u,","))[0],r.cond=c[1],u=(d=this.split(u,"#"))[0],r.fun=d[1],u=(p=this.split(u,":"))[0],r.lno=p[1],r.fn=u||this.source.state.fn,r.lno=parseInt(r.lno)||null,i=!1,a=0,l=(h=this.source.breakpoints[r.fn]||[]).length;a<l;a++)if((s=h[a]).fn===r.fn&&s.lno===r.lno&&s.cond===r.cond&&s.fun===r.fun&&(s.temporary===r.temporary||n)){i=!0,r=s;break}return i||n?(this.source.clear_breakpoint(r),o="Unbreak",r.temporary||(o="Broadcast|"+o),this.ws.send(o,r),void this.working()):(r.lno&&this.source.ask_breakpoint(r.lno),o="Break",e||(o="Broadcast|"+o),this.ws.send(o,r),this.working())},t.prototype.watched=function(t){return this.watchers.updateAll(t)},t.prototype.ack=function(){return this.done()},t.prototype.display=function(t){var e,n;return e=$("<div>",{class:"display scroll-line"}),this.interpreter.write(e),this.code(e,t.for,["for prompted"]),(n=0<=t.type.indexOf("image")?$("<img>"):0<=t.type.indexOf("audio")?$("<audio>",{controls:"controls",autoplay:"autoplay"}):0<=t.type.indexOf("video")||0<=t.type.indexOf("/ogg")?$("<video>",{controls:"controls",autoplay:"autoplay"}):$("<iframe>")).addClass("display"),n.attr("src","data:"+t.type+";charset=UTF-8;base64,"+t.val),e.append(n),this.done()},t.prototype.suggest=function(t){if(t)return this.prompt.complete(t)},t.prototype.die=function(){if(this.title({title:"Dead",subtitle:"Program has exited"}),this.ws.ws.close(),$("body").addClass("is-dead"),!$("body").attr("data-debug"))return setTimeout(function(){return window.close()},10)},t.prototype.global_key=function(t){var e,n,r,o,s,i;if(this.source.rw)return!0;if(i=this.source.focused()&&this.source.code_mirror.getSelection(),t.altKey&&(65<=(r=t.keyCode)&&r<=90||37<=(o=t.keyCode)&&o<=40||13===t.keyCode)||118<=(s=t.keyCode)&&s<=122)return n="","b"!==(e=(e=function(){switch(t.keyCode){case 37:case 118:return"u";case 13:case 119:return"c";case 38:case 120:return"r";case 39:case 121:return"n";case 40:case 122:return"s";default:return String.fromCharCode(t.keyCode)}}()).toLowerCase())&&"t"!==e&&"z"!==e||(n+=" :"+this.source.state.lno),"i"===e&&(n=" "+i),"o"===e&&t.shiftKey&&(n=" !"),this.execute("."+e+n),!1;if(13===t.keyCode){if(this.prompt.focused())return;if(!i)return;return t.shiftKey?(this.prompt.insert(i),this.prompt.focus()):t.ctrlKey?this.ws.send("Watch",i):(this.prompt.history.historize(i),this.execute(i)),!1}},t.prototype.newline=function(){return this.prompt.ready(!0),this.chilling()},t.prototype.inspect=function(t){return this.ws.send("Inspect",t),this.working(),!1},t.prototype.unwatch=function(t){return this.ws.send("Unwatch",t),this.working()},t.prototype.paste_target=function(t){var e;if(""===(e=$(t.target).text().trim()))return!0;if(t.shiftKey)this.prompt.insert(e);else{if(!t.ctrlKey)return this.prompt.history.historize(e),this.ws.send("Dump",e),this.working(),!1;this.ws.send("Watch",e)}},t.prototype.disable=function(){return this.ws.send("Disable")},t.prototype.shell=function(){return this.switch.close_trace(),this.switch.close_code(),this.switch.open_term(),this.done()},t.prototype.dialog=function(t,e){var n,r,o;return $(".modals").append(n=$('<dialog class="mdl-dialog">\n  <h3 class="mdl-dialog__title">'+t+'</h3>\n  <div class="mdl-dialog__content">\n    '+e+'\n  </div>\n  <div class="mdl-dialog__actions">\n    <button type="button" class="mdl-button dialog-close">Close</button>\n  </div>\n</dialog>')),n.find(".dialog-close").on("click",function(){return n.get(0).close(),n.remove()}),n.find(".mdl-tabs,.mdl-data-table").each(function(){return componentHandler.upgradeElement(this)}),n.on("close",(o=this,function(){return o.prompt.ready()})),r=n.get(0),"undefined"!=typeof dialogPolyfill&&null!==dialogPolyfill&&dialogPolyfill.registerDialog(r),r.showModal()},t.prototype.pretty_time=function(t){var e,n,r,o;return t<1e3?t+"μs":(t/=1e3)<10?t.toFixed(2)+"ms":t<100?t.toFixed(1)+"ms":t<1e3?t.toFixed(0)+"ms":(t/=1e3)<10?t.toFixed(2)+"s":t<60?t.toFixed(1)+"s":(o=function(t){return 1===(t=t.toString()).length?"0"+t:t},r=(t-60*(n=Math.floor(t/60))).toFixed(0),n<60?n+"m"+o(r)+"s":(e=Math.floor(n/60))+"h"+o(n=(n-60*e).toFixed(0))+"m"+o(r)+"s")},t.prototype.unload=function(){return this.ws.ws.close()},t}(),$(function(){return window.wdb=new Wdb});
\ No newline at end of file
+var History,Interpreter,Log,Prompt,Source,Switch,Traceback,Watchers,Wdb,Websocket,help,extend=function(t,e){for(var n in e)hasProp.call(e,n)&&(t[n]=e[n]);function r(){this.constructor=t}return r.prototype=e.prototype,t.prototype=new r,t.__super__=e.prototype,t},hasProp={}.hasOwnProperty,indexOf=[].indexOf||function(t){for(var e=0,n=this.length;e<n;e++)if(e in this&&this[e]===t)return e;return-1};String.prototype.startsWith||(String.prototype.startsWith=function(t,e){return e=e||0,this.substr(e,t.length)===t}),document.createElement("dialog").showModal||$(function(){return $("head").append($("<script>",{src:"https://cdnjs.cloudflare.com/ajax/libs/dialog-polyfill/0.4.3/dialog-polyfill.min.js"})),$("head").append($("<link>",{rel:"stylesheet",href:"https://cdnjs.cloudflare.com/ajax/libs/dialog-polyfill/0.4.3/dialog-polyfill.min.css"}))}),Log=function(){function t(){this.debug=$("body").attr("data-debug")||!1}return t.prototype.time=function(){var t;return(t=new Date).getHours()+":"+t.getMinutes()+":"+t.getSeconds()+"."+t.getMilliseconds()},t.prototype.log=function(){var t;if(this.debug)return t=["["+this.constructor.name+"] ("+this.time()+")"].concat(Array.prototype.slice.call(arguments,0)),console.log.apply(console,t)},t.prototype.dbg=function(){var t;if(this.debug)return t=["["+this.constructor.name+"] ("+this.time()+")"].concat(Array.prototype.slice.call(arguments,0)),console.debug.apply(console,t)},t.prototype.fail=function(){var t;return t=[this.constructor.name].concat(Array.prototype.slice.call(arguments,0)),console.error.apply(console,t)},t}(),Websocket=function(){function t(e,n){var r;this.wdb=e,t.__super__.constructor.call(this),r="https:"===document.location.protocol?"wss:":"ws:",this.url=r+"//"+document.location.host+"/websocket/"+n,this.log("Opening new socket",this.url),this.ws=new WebSocket(this.url),this.ws.onclose=this.close.bind(this),this.ws.onopen=this.open.bind(this),this.ws.onerror=this.error.bind(this),this.ws.onmessage=this.message.bind(this)}return extend(t,Log),t.prototype.close=function(t){return this.log("Closed",t),this.wdb.die()},t.prototype.error=function(t){return this.fail("Error",t)},t.prototype.open=function(t){return this.log("Open",t),this.wdb.opening()},t.prototype.message=function(t){var e,n,r,s;return(s=(r=t.data).indexOf("|"))>-1?(e=r.substr(0,s),n=JSON.parse(r.substr(s+1))):e=r,this.dbg(this.time(),"<-",r),(e=e.toLowerCase())in this.wdb?this.wdb[e.toLowerCase()](n):this.fail("Unknown command",e)},t.prototype.send=function(t,e){var n;return null==e&&(e=null),e?("string"!=typeof e&&(e=JSON.stringify(e)),n=t+"|"+e):n=t,this.dbg("->",n),this.ws.send(n)},t}(),Source=function(){function t(e){var n;this.wdb=e,t.__super__.constructor.call(this),this.$container=$(".source").on("mousedown",(n=this,function(t){if(2===t.which&&n.code_mirror.getOption("readOnly"))return n.code_mirror.setOption("readOnly","nocursor")})).on("mouseup",function(t){return function(e){if(2===e.which)return t.code_mirror.setOption("readOnly",!0),t.wdb.paste_target(e)}}(this)),this.code_mirror=CodeMirror(function(t){return function(e){return t.$code_mirror=$(e),t.$container.prepend(e)}}(this),{value:"No active file",theme:"material",readOnly:!0,gutters:["breaks","CodeMirror-linenumbers"],lineNumbers:!0,extraKeys:{Esc:this.stop_edition.bind(this),"Ctrl-S":this.save.bind(this)}}),this.code_mirror.on("gutterClick",this.gutter_click.bind(this)),$(window).on("resize",this.size.bind(this)),this.state={fn:null,file:null,fun:null,lno:0},this.fun_scope=null,this.footsteps={},this.breakpoints={}}return extend(t,Log),t.prototype.external=function(t){var e,n;return null==t&&(t=!0),e=this.code_mirror.getCursor(),n=""+this.state.fn,t&&(n=n+":"+(e.line+1)+":"+(e.ch+1)),this.wdb.ws.send("External",n)},t.prototype.save=function(){var t;if(!this.code_mirror.getOption("readOnly"))return t=this.code_mirror.getValue(),this.wdb.ws.send("Save",this.state.fn+"|"+t),this.state.file=t},t.prototype.gutter_click=function(t,e){return this.wdb.toggle_break(":"+(e+1))},t.prototype.clear_breakpoint=function(t){var e,n;if(null==(e=this.breakpoints)[n=t.fn]&&(e[n]=[]),indexOf.call(this.breakpoints[t.fn],t)>=0&&this.breakpoints[t.fn].splice(this.breakpoints[t.fn].indexOf(t)),t.lno)return this.remove_mark(t.lno),this.remove_class(t.lno,"ask-breakpoint"),this.remove_class(t.lno,"breakpoint")},t.prototype.ask_breakpoint=function(t){return this.add_class(t,"ask-breakpoint")},t.prototype.set_breakpoint=function(t){var e,n;return null==(e=this.breakpoints)[n=t.fn]&&(e[n]=[]),this.breakpoints[t.fn].push(t),this.mark_breakpoint(t)},t.prototype.mark_breakpoint=function(t){if(t.lno)return this.remove_class(t.lno,"ask-breakpoint"),this.add_class(t.lno,"breakpoint"),this.add_mark(t.lno,"breakpoint","breaks",t.temporary?"○":"●",this.brk_to_str(t))},t.prototype.brk_to_str=function(t){var e;return e=t.temporary?"Temporary ":"",e+="Breakpoint",t.fun&&(e+=" On "+t.fun),t.lno&&(e+=" At "+t.lno),t.cond&&(e+=" If "+t.cond),t.ignore&&(e+=" Ignoring "+t.ignore+" hits"),t.hit&&(e+=" On hit "+t.hit),t.sample&&(e+=" Sampling 1/"+t.sample),e},t.prototype.get_selection=function(){return this.code_mirror.getSelection().trim()},t.prototype.get_breakpoint=function(t){var e,n,r,s,o,i;for(null==(e=this.breakpoints)[o=this.state.fn]&&(e[o]=[]),r=0,s=(i=this.breakpoints[this.state.fn]).length;r<s;r++)if((n=i[r]).lno===t)return n},t.prototype.add_class=function(t,e){return this.code_mirror.addLineClass(t-1,"background",e)},t.prototype.remove_class=function(t,e){return this.code_mirror.removeLineClass(t-1,"background",e)},t.prototype.add_mark=function(t,e,n,r,s){return this.code_mirror.setGutterMarker(t-1,n,$("<div>",{class:e,title:s}).html(r).get(0))},t.prototype.remove_mark=function(t){return this.code_mirror.setGutterMarker(t-1,"breaks",null)},t.prototype.stop_edition=function(){if(!this.code_mirror.getOption("readOnly"))return this.toggle_edition()},t.prototype.toggle_edition=function(){var t;if(t=this.code_mirror.getOption("readOnly"),this.code_mirror.setOption("readOnly",!t),this.$code_mirror.toggleClass("rw","ro"),this.wdb.print({for:"Toggling edition",result:"Edit mode "+(t?"on":"off")}),!t)return this.code_mirror.setValue(this.state.file)},t.prototype.open=function(t,e){var n;return n={fn:t.name,file:t.file||e.code,fun:e.function,lno:e.lno,flno:e.flno,llno:e.llno},this.set_state(n)},t.prototype.set_state=function(t){var e,n,r,s,o,i,a,l,c,d,p,h,u,m,f,b,y,g;if(y=!0,this.state.fn!==t.fn||this.state.file!==t.file)for(this.code_mirror.setOption("mode",this.get_mode(t.fn)),this.code_mirror.setValue(t.file),r=0,i=(p=this.breakpoints[t.fn]||[]).length;r<i;r++)n=p[r],this.mark_breakpoint(n);else if(this.state.fun!==t.fun){if("<module>"!==this.state.fun){for(this.remove_class(this.state.flno,"ctx-top"),l=s=h=this.state.flno,u=this.state.llno;h<=u?s<=u:s>=u;l=h<=u?++s:--s)this.remove_class(l,"ctx");this.remove_class(this.state.llno,"ctx-bottom")}}else y=!1;for(this.state=t,this.code_mirror.clearGutter("CodeMirror-linenumbers"),o=0,a=(m=this.footsteps[this.state.fn]||[]).length;o<a;o++)g=m[o],this.remove_class(g,"highlighted"),this.add_class(g,"footstep");if(y&&"<module>"!==this.state.fun){for(this.add_class(this.state.flno,"ctx-top"),l=d=f=this.state.flno,b=this.state.llno;f<=b?d<=b:d>=b;l=f<=b?++d:--d)this.add_class(l,"ctx");this.add_class(this.state.llno,"ctx-bottom")}return this.add_class(this.state.lno,"highlighted"),this.add_mark(this.state.lno,"highlighted","CodeMirror-linenumbers","➤"),null==(e=this.footsteps)[c=this.state.fn]&&(e[c]=[]),this.footsteps[this.state.fn].push(this.state.lno),this.code_mirror.scrollIntoView({line:this.state.lno,ch:1},this.$code_mirror.height()/2),this.code_mirror.refresh()},t.prototype.get_mode=function(t){switch(t.split(".").splice(-1)[0]){case"py":default:return"python";case"jinja2":return"jinja2";case"diff":return"diff"}},t.prototype.focused=function(){return this.$code_mirror.hasClass("CodeMirror-focused")},t.prototype.size=function(){return this.$code_mirror.height(0),this.$code_mirror.height(this.$container.height()),this.code_mirror.refresh()},t}(),History=function(){function t(e){var n,r;this.prompt=e,t.__super__.constructor.call(this),this.index=-1,this.current="",this.currentPos=CodeMirror.Pos(0,0),this.oldIndex=null,this.originalIndex=null,this.overlay=null;try{this.history=JSON.parse(localStorage.history||"[]")}catch(r){n=r,this.fail(n),this.history=[]}this.sessionIndexStart=this.history.filter(function(t){return 0!==t.indexOf(".")}).length}return extend(t,Log),t.prototype.up=function(){return-1===this.index&&this.saveCurrent(),this.index=Math.min(this.history.length-1,this.index+1),this.sync()},t.prototype.down=function(){return this.index=Math.max(this.index-1,-1),this.sync()},t.prototype.saveCurrent=function(){return this.current=this.prompt.get(),this.currentPos=this.prompt.code_mirror.getCursor()},t.prototype.sync=function(){return-1===this.index?(this.prompt.set(this.current),this.prompt.code_mirror.setCursor(this.currentPos)):(this.prompt.set(this.history[this.index]),this.prompt.code_mirror.setCursor(this.prompt.code_mirror.lineCount(),0))},t.prototype.historize=function(t){var e;if(t){for(;-1!==(e=this.history.indexOf(t));)this.history.splice(e,1);return this.history.unshift(t),localStorage&&(localStorage.history=JSON.stringify(this.history))}},t.prototype.reset=function(){return this.index=-1,this.current="",this.currentPos=CodeMirror.Pos(0,0)},t.prototype.clear=function(){return this.history=[],this.sessionIndexStart=0,this.reset()},t.prototype.getOverlay=function(t){return{token:function(e){var n;if(t.lastIndex=e.pos,(n=t.exec(e.string))&&n.index===e.pos)return e.pos+=n[0].length||1,"searching";n?e.pos=n.index:e.skipToEnd()}}},t.prototype.searchPrev=function(t){return this.searchNext(t,-1)},t.prototype.searchNext=function(t,e){var n;for(null==e&&(e=1),null==this.oldIndex&&(this.oldIndex=this.index),null==this.originalIndex&&(this.originalIndex=this.index,-1===this.index&&this.saveCurrent());1===e&&this.index<this.history.length||-1===e&&this.index>-1;)if(this.index+=e,(n=new RegExp("("+t.replace(/[\-\[\]\/\{\}\(\)\*\+\?\.\\\^\$\|]/g,"\\$&")+")","gi")).test(this.history[this.index]))return this.lastResult=this.index,this.sync(),null!=this.overlay&&this.prompt.code_mirror.removeOverlay(this.overlay,!0),this.overlay=this.getOverlay(n),this.prompt.code_mirror.addOverlay(this.overlay),!0;return!1},t.prototype.commitSearch=function(){return this.oldIndex=null,this.originalIndex=null,this.index=this.lastResult,this.sync()},t.prototype.rollbackSearch=function(){return this.oldIndex=null,null!=this.originalIndex&&(this.index=this.originalIndex),this.originalIndex=null,null!=this.overlay&&this.prompt.code_mirror.removeOverlay(this.overlay,!0),this.overlay=null,this.sync()},t.prototype.resetSearch=function(){return null!=this.oldIndex&&(this.index=this.oldIndex),this.oldIndex=null},t.prototype.getSessionHistory=function(){return this.history.slice(0,this.history.length-this.sessionIndexStart)},t.prototype.getHistory=function(t){var e,n;return e=0,n=this.history.length-this.sessionIndexStart,"down"===t?n=this.index+1:"up"===t&&(e=this.index),this.history.slice(e,n)},t}(),Traceback=function(){function t(e){this.wdb=e,t.__super__.constructor.call(this),this.$traceback=$(".traceback"),this.$traceback.on("click",".trace-line",this.select.bind(this))}return extend(t,Log),t.prototype.select=function(t){var e;return e=$(t.currentTarget).attr("data-level"),this.wdb.select_trace(e),$(".mdl-layout__obfuscator").is(".is-visible")&&$(".mdl-layout").get(0).MaterialLayout.toggleDrawer(),!1},t.prototype.make_trace=function(t){var e,n,r,s,o,i,a,l,c,d,p;for(this.clear(),this.show(),p=[],i=0,l=t.length;i<l;i++){for(o=t[i],r=$("<a>",{class:"trace-line ellipsis mdl-list__item mdl-list__item--three-line trace-"+o.level}).attr("data-level",o.level).attr("title",'File "'+o.file+'", line '+o.lno+", in "+o.function+"\n    "+o.code),a=0,c=(d=this.wdb.source.breakpoints[o.file]||[]).length;a<c;a++)if(!((s=d[a]).cond||s.fun||s.lno)){r.addClass("breakpoint");break}o.current&&r.addClass("real-selected"),(e=$("<div>",{class:"mdl-list__item-primary-content"})).append($("<div>",{class:"ellipsis"}).text(o.function)),e.append($("<div>",{class:"mdl-list__item-text-body"}).append(n=$("<div>",{class:"ellipsis"})).append($("<div>",{class:"ellipsis"}).text(o.file.split("/").slice(-1)[0]+":"+o.lno).prepend($("<i>",{class:"material-icons"}).text(this.get_fn_icon(o.file))))),this.wdb.code(n,o.code,["ellipsis"]),r.append(e),p.push(this.$traceback.prepend(r))}return p},t.prototype.hide=function(){return this.$traceback.addClass("hidden")},t.prototype.show=function(){return this.$traceback.removeClass("hidden")},t.prototype.clear=function(){return this.$traceback.empty()},t.prototype.get_fn_icon=function(t){return~t.indexOf("site-packages")?"library_books":t.startsWith(this.wdb.cwd)||"/"!==t[0]?"star":t.startsWith("/home/")?"home":t.startsWith("/usr/lib")&&~t.indexOf("/python")?"lock":"cloud"},t}(),Interpreter=function(){function t(e){var n;this.wdb=e,t.__super__.constructor.call(this),this.$terminal=$(".terminal").on("click",(n=this,function(){if(!getSelection().toString())return n.focus()})).on("click","a.inspect",this.inspect.bind(this)),this.$scrollback=$(".scrollback").on("click",".short.close",this.short_open.bind(this)).on("click",".short.open",this.short_close.bind(this)).on("click",".toggle",this.toggle_visibility.bind(this))}return extend(t,Log),t.prototype.scroll=function(t){if(null==t&&(t=null),!t)return this.wdb.prompt.$container.get(0).scrollIntoView({behavior:"smooth"});this.$terminal.scrollTop(this.$terminal.scrollTop()+t*this.$terminal.height())},t.prototype.clear=function(){return this.$scrollback.empty()},t.prototype.write=function(t){return this.$scrollback.append(t)},t.prototype.inspect=function(t){return this.wdb.inspect($(t.currentTarget).attr("href"))},t.prototype.short_open=function(t){return $(t.currentTarget).addClass("open").removeClass("close").next(".long").show("fast")},t.prototype.short_close=function(t){return $(t.currentTarget).addClass("close").removeClass("open").next(".long").hide("fast")},t.prototype.toggle_visibility=function(t){return $(t.currentTarget).add($(t.currentTarget).next()).toggleClass("closed","shown")},t.prototype.focus=function(){var t;return t=this.$terminal.scrollTop(),this.wdb.prompt.focus(),this.$terminal.scrollTop(t)},t}(),Prompt=function(){function t(e){var n;this.wdb=e,t.__super__.constructor.call(this),this.$container=$(".prompt"),this.history=new History(this),this.code_mirror=CodeMirror((n=this,function(t){return n.$code_mirror=$(t),n.$container.prepend(t)}),{value:"",theme:"default",language:"python",viewportMargin:1/0,lineWrapping:!0,autofocus:!0,specialChars:/[\u0000-\u0019\u00a0\u00ad\u200b-\u200f\u2028\u2029\ufeff]/}),this.code_mirror.on("changes",this.changes.bind(this)),CodeMirror.registerHelper("hint","jedi",function(t){return function(e,n,r){var s,o,i,a,l,c;if(s=e.getCursor(),c=e.getTokenAt(s),!e.getValue().startsWith(".")||2!==e.getValue().length)if(o=CodeMirror.Pos(s.line,c.start),l=CodeMirror.Pos(s.line,c.end),"."!==e.getValue()){if(r.completeSingle||c.string.match(/[\w\.\(\[\{]/))return t.wdb.ws.send("Complete",{source:e.getValue(),pos:t.code_mirror.getRange({line:0,ch:0},s).length,line:s.line+1,column:s.ch,manual:r.completeSingle}),t.completion={cur:s,tok:c,from:o,to:l,callback:n}}else n({from:o,to:l,list:function(){var t,e;for(a in e=[],t={a:"History",b:"Break",c:"Continue",d:"Dump",e:"Edition",f:"Find",g:"Clear",h:"Help",i:"Display",j:"Jump",k:"Clear",l:"Breakpoints",m:"Restart",n:"Next",o:"Open",p:"Census",q:"Quit",r:"Return",s:"Step",t:"Tbreak",u:"Until",v:"Allocations",w:"Watch",x:"Diff",y:"Referrers",z:"Unbreak"})hasProp.call(t,a)&&(i=t[a],e.push({text:"."+a,displayText:"."+a+" <i>"+this.leftpad("("+i+")",14)+"</i>  ",render:function(t,e,n){return $(t).html(n.displayText)}}));return e}.call(t)})}}(this)),this.code_mirror.addKeyMap({Enter:this.newLineOrExecute.bind(this),Up:this.history.up.bind(this.history),Down:this.history.down.bind(this.history),"Ctrl-C":this.abort.bind(this),"Ctrl-D":function(t){return function(){if(!t.get())return t.wdb.die()}}(this),"Ctrl-F":function(){},"Ctrl-R":function(t){return function(){return t.searchBack()}}(this),"Ctrl-S":function(t){return function(){return t.searchBack(!1)}}(this),"Ctrl-K":"killLine","Ctrl-L":this.wdb.cls.bind(this.wdb),"Ctrl-Enter":"newlineAndIndent","Alt-Backspace":"delGroupBefore","Ctrl-Space":this.triggerAutocomplete.bind(this),"Ctrl-Up":function(t){return function(){return t.insertHistory("up")}}(this),"Ctrl-Down":function(t){return function(){return t.insertHistory("down")}}(this),PageUp:"goLineUp",PageDown:"goLineDown",PageDown:"goLineDown","Shift-PageUp":function(t){return function(){return t.wdb.interpreter.scroll(-1)}}(this),"Shift-PageDown":function(t){return function(){return t.wdb.interpreter.scroll(1)}}(this),Tab:function(t){return function(e,n){var r,s;return r=t.code_mirror.getCursor(),t.code_mirror.getRange({line:r.line,ch:0},r).trim()?t.triggerAutocomplete(e,n):(s=Array(t.code_mirror.getOption("indentUnit")+1).join(" "),t.code_mirror.replaceSelection(s))}}(this)}),this.code_mirror.on("keyup",function(t){return function(e,n){var r;if(e.getValue()&&!(8<(r=n.keyCode)&&r<42))return CodeMirror.commands.autocomplete(e,CodeMirror.hint.jedi,{async:!0,completeSingle:!1,extraKeys:{PageUp:"goPageUp",PageDown:"goPageDown",Home:"goLineStartSmart",Up:function(t,e){return e._dirty=!0,e.moveFocus(-1)},Down:function(t,e){return e._dirty=!0,e.moveFocus(1)},Enter:function(e,n){return n._dirty?n.pick():t.newLineOrExecute(e)},Right:function(t,e){return e._dirty?e.pick():CodeMirror.commands.goCharRight(t)},End:"goLineEnd"}})}}(this))}return extend(t,Log),t.prototype.complete=function(t){var e,n,r,s,o;return t.completions&&this.completion?(n=this.completion.cur,s=this.completion.tok,r={from:CodeMirror.Pos(n.line,s.start),to:CodeMirror.Pos(n.line,s.end),list:function(){var r,s,o,i;for(i=[],r=0,s=(o=t.completions).length;r<s;r++)e=o[r],i.push({text:e.base+e.complete,from:CodeMirror.Pos(n.line,n.ch-e.base.length),to:n,_completion:e,render:function(t,e,n){var r,s;return s="<b>"+(r=n._completion).base+"</b>"+r.complete,$(t).html(s)}});return i}()},CodeMirror.on(r,"shown",(o=this,function(){var t;return t=o.code_mirror.state.completionActive.options.completeSingle?"triggered":"auto",$(o.code_mirror.state.completionActive.widget.hints).addClass(t)})),void this.completion.callback(r)):t.imports?CodeMirror.commands.autocomplete(this.code_mirror,function(){var e;return{from:CodeMirror.Pos(0,0),to:CodeMirror.Pos(0,0),list:function(){var n,r,s,o;for(o=[],n=0,r=(s=t.imports).length;n<r;n++)e=s[n],o.push({text:e,from:CodeMirror.Pos(0,0),to:CodeMirror.Pos(0,0),render:function(t,e,n){var r;return r="<em>"+n.text+"</em>",$(t).html(r)}});return o}()}},{async:!1,completeSingle:!1}):void 0},t.prototype.triggerAutocomplete=function(t){return CodeMirror.commands.autocomplete(t,CodeMirror.hint.jedi,{async:!0,extraKeys:{Right:function(t,e){return e.pick()}}})},t.prototype.newLineOrExecute=function(t){var e;if(e=t.getValue().trim())return t.setOption("readOnly","nocursor"),this.$container.addClass("loading"),this.wdb.execute(e)},t.prototype.focus=function(){return this.code_mirror.focus()},t.prototype.focused=function(){return this.$code_mirror.hasClass("CodeMirror-focused")},t.prototype.abort=function(){return this.history.reset(),this.set("")},t.prototype.ready=function(t){var e;return null==t&&(t=!1),t?this.code_mirror.execCommand("newlineAndIndent"):(e=this.code_mirror.getValue().trim(),this.history.historize(e),this.history.reset(),this.set("")),this.unlock()},t.prototype.unlock=function(){return this.$container.removeClass("loading"),this.code_mirror.setOption("readOnly",!1),this.focus()},t.prototype.get=function(){return this.code_mirror.getValue()},t.prototype.set=function(t){return this.code_mirror.setValue(t)},t.prototype.leftpad=function(t,e,n){var r,s;for(null==n&&(n=" "),r=0,s=e-t.length;0<=s?r<=s:r>=s;0<=s?++r:--r)t=n+t;return t},t.prototype.searchBack=function(t){var e;return null==t&&(t=!0),this.$code_mirror.addClass("extra-dialog"),this.code_mirror.openDialog('<span class="search-dialog-title">\n  Search '+(t?"backward":"forward")+':\n</span>\n<input type="text" style="width: 10em" class="CodeMirror-search-field"/>',(e=this,function(){return e.history.commitSearch()}),{bottom:!0,onInput:function(t){return function(e,n,r){if(n)return t.history.resetSearch(),$(".CodeMirror-search-field").toggleClass("not-found",n&&!t.history[r.back?"searchNext":"searchPrev"](n))}}(this),onKeyDown:function(t){return function(e,n,r){return(82===e.keyCode&&e.ctrlKey||83===e.keyCode&&e.altKey)&&(r.back=!0,$(".search-dialog-title").text("Search backward:"),$(".CodeMirror-search-field").toggleClass("not-found",n&&!t.history.searchNext(n)),e.preventDefault(),e.stopPropagation()),(83===e.keyCode&&e.ctrlKey||82===e.keyCode&&e.altKey)&&(r.back=!1,$(".search-dialog-title").text("Search forward:"),$(".CodeMirror-search-field").toggleClass("not-found",n&&!t.history.searchPrev(n)),e.preventDefault(),e.stopPropagation()),67===e.keyCode&&e.ctrlKey&&r(),!1}}(this),onClose:function(t){return function(){return t.history.rollbackSearch(),t.$code_mirror.removeClass("extra-dialog")}}(this)}).back=t},t.prototype.insert=function(t){return this.code_mirror.replaceRange(t,this.code_mirror.getCursor())},t.prototype.changes=function(){return window.setTimeout((t=this,function(){return t.wdb.interpreter.scroll()}));var t},t.prototype.insertHistory=function(t){var e;return e=this.history.getHistory(t).reverse().join("\n"),this.history.reset(),this.set(e)},t}(),Watchers=function(){function t(e){this.wdb=e,t.__super__.constructor.call(this),this.$watchers=$(".watchers").on("click",".watching .name",this.unwatch.bind(this))}return extend(t,Log),t.prototype.unwatch=function(t){var e;return e=$(t.currentTarget).closest(".watching").attr("data-expr"),this.wdb.unwatch(e)},t.prototype.updateAll=function(t){var e,n;for(n in t)hasProp.call(t,n)&&(e=t[n],this.update(n,e));return this.$watchers.find(".watching:not(.updated)").remove(),this.$watchers.find(".watching").removeClass("updated")},t.prototype.update=function(t,e){var n,r,s;return(s=this.$watchers.find(".watching").filter(function(e){return $(e).attr("data-expr")===t})).length?(s.find(".value code").remove(),this.wdb.code(s.find(".value"),e.toString(),[],!0)):(n=$("<code>",{class:"name"}),r=$("<div>",{class:"value"}),this.$watchers.append(s=$("<div>",{class:"watching"}).attr("data-expr",t).append(n.text(t),$("<code>").text(": "),r)),this.wdb.code(r,e.toString(),[],!0)),s.addClass("updated")},t}(),Switch=function(){function t(e){var n;this.wdb=e,t.__super__.constructor.call(this),this.$trace=$(".trace"),this.$switches=$(".switch").click((n=this,function(t){return n.switch($(t.currentTarget))})),this.$command=$(".command").click(function(t){return function(e){return t.command($(e.currentTarget))}}(this)),this.$source=$(".source"),this.$interpreter=$(".interpreter")}return extend(t,Log),t.prototype.switch=function(t){if(t.is(".power")){if(t.is(".off"))return this.wdb.disable();if(t.is(".on"))return parent.postMessage("activate","*")}else if(t.is(".code")){if(t.is(".off"))return this.open_code();if(t.is(".on"))return this.close_code()}else if(t.is(".term")){if(t.is(".off"))return this.open_term();if(t.is(".on"))return this.close_term()}},t.prototype.open_trace=function(){return this.$trace.addClass("mdl-layout--fixed-drawer")},t.prototype.close_trace=function(){return this.$trace.removeClass("mdl-layout--fixed-drawer")},t.prototype.open_code=function(){return this.$switches.filter(".code").removeClass("off").addClass("on").removeClass("mdl-button--accent"),this.$source.removeClass("hidden"),this.wdb.source.size()},t.prototype.close_code=function(){return this.$switches.filter(".code").removeClass("on").addClass("off").addClass("mdl-button--accent"),this.$source.addClass("hidden"),this.wdb.source.size()},t.prototype.open_term=function(){return this.$switches.filter(".term").removeClass("off").addClass("on").removeClass("mdl-button--accent"),this.$interpreter.removeClass("hidden"),this.wdb.source.size()},t.prototype.close_term=function(){return this.$switches.filter(".term").removeClass("on").addClass("off").addClass("mdl-button--accent"),this.$interpreter.addClass("hidden"),this.wdb.source.size()},t.prototype.command=function(t){return this.wdb.execute("."+t.attr("data-command"))},t}(),help='<div class="mdl-tabs mdl-js-tabs mdl-js-ripple-effect">\n  <div class="mdl-tabs__tab-bar">\n      <a href="#help-stepping" class="mdl-tabs__tab is-active">Stepping</a>\n      <a href="#help-breakpoints" class="mdl-tabs__tab">Breakpoints</a>\n      <a href="#help-inspecting" class="mdl-tabs__tab">Inspecting</a>\n      <a href="#help-prompt" class="mdl-tabs__tab">Prompt</a>\n      <a href="#help-misc" class="mdl-tabs__tab">Misc</a>\n  </div>\n\n  <div class="mdl-tabs__panel is-active" id="help-stepping">\n    <table class="mdl-data-table mdl-js-data-table mdl-shadow--2dp">\n      <tr>\n        <td class="cmd">\n          <samp>.s</samp> or <kbd>Alt</kbd> + <kbd>↓</kbd> or <kbd>F11</kbd>\n        </td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          Step into\n        </td>\n      </tr>\n      <tr>\n        <td class="cmd">\n          <samp>.n</samp> or <kbd>Alt</kbd> + <kbd>→</kbd> or <kbd>F10</kbd>\n        </td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          Step over (Next)\n        </td>\n      </tr>\n      <tr>\n        <td class="cmd">\n          <samp>.u</samp> or <kbd>Alt</kbd> + <kbd>←</kbd> or <kbd>F7</kbd>\n        </td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          Until (Next over loops)\n        </td>\n      </tr>\n      <tr>\n        <td class="cmd">\n          <samp>.r</samp> or <kbd>Alt</kbd> + <kbd>↑</kbd> or <kbd>F9</kbd>\n        </td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          Step out (Return)\n        </td>\n      </tr>\n      <tr>\n        <td class="cmd">\n          <samp>.c</samp> or <kbd>Alt</kbd> + <kbd>Enter</kbd> or <kbd>F8</kbd>\n        </td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          Continue\n        </td>\n      </tr>\n      <tr>\n        <td class="cmd"><samp>.j</samp> lineno</td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          Jump to lineno (Must be at bottom frame and in the same function)\n        </td>\n      </tr>\n      <tr>\n        <td class="cmd"><samp>.q</samp></td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          Quit\n        </td>\n      </tr>\n    </table>\n    <aside class="note">\n      All commands are prefixed with a dot and can be\n      executed with <kbd>Alt</kbd> + <kbd>the-command-letter</kbd>,\n      i.e.: <kbd>Alt</kbd> + <kbd>h</kbd>\n    </aside>\n  </div>\n  <div class="mdl-tabs__panel" id="help-breakpoints">\n    <table class="mdl-data-table mdl-js-data-table mdl-shadow--2dp">\n      <tr>\n        <td class="cmd"><samp>.b</samp> arg</td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          Set a session breakpoint\n        </td>\n      </tr>\n      <tr>\n        <td class="cmd"><samp>.t</samp> arg</td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          Set a temporary breakpoint\n        </td>\n      </tr>\n      <tr>\n        <td class="cmd"><samp>.z</samp> arg</td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          Delete existing breakpoint\n        </td>\n      </tr>\n      <tr>\n        <td class="cmd"><samp>.l</samp></td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          List active breakpoints\n        </td>\n      </tr>\n      <tr>\n        <td class="cmd">Breakpoint argument format</td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          <code>[file/module][:lineno][#function][,condition]</code>\n        </td>\n      </tr>\n      <tr>\n        <td class="cmd"><code>[file]</code></td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          Break if any line of <code>file</code> is executed</td>\n      </tr>\n      <tr>\n        <td class="cmd"><code>[file]:lineno</code></td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          Break on <code>file</code> at <code>lineno</code></td>\n      </tr>\n      <tr>\n        <td class="cmd"><code>[file][:lineno],condition</code></td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n            Break on <code>file</code> at <code>lineno</code> if\n            <code>condition</code> is <code>True</code>\n            (ie: <code>i == 10)</code></td>\n      </tr>\n      <tr>\n        <td class="cmd"><code>[file]#function</code></td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          Break when inside <code>function</code> function</td>\n      </tr>\n      <tr>\n        <td class="cmd"><code>arg [ignore=n,hit=n,sample=n]</code></td>\n        <td class="mdl-data-table__cell--non-numeric dfn">\n          Don\'t break on the first <code>ignore</code> hits, break only on\n          the <code>hit</code>th hit or randomly on one hit in\n          <code>sample</code></td>\n      </tr>\n    </table>\n    <aside class="note">\n      File is always current file by default and you can also\n      specify a module like <code>logging.config</code>.\n    </aside>\n  </div>\n  <div class="mdl-tabs__panel" id="help-inspecting">\n    <table class="mdl-data-table mdl-js-data-table mdl-shadow--2dp">\n    <tr>\n      <td class="cmd"><samp>.a</samp></td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Echo all typed commands in the current debugging session\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><samp>.d</samp> expression</td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Dump the result of expression in a table\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><samp>.w</samp> expression</td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Watch expression in current file (Click on the name to remove)\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><samp>.i</samp> [mime/type;]expression</td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Display the result in an embed, mime type defaults to "text/html"\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><samp>.x</samp> left ? right</td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Display the difference between the pretty print of \'left\' and \'right\'\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><samp>.x</samp> left <> right</td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Display the difference between the repr of \'left\' and \'right\'\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><samp>.f</samp> key in expression</td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Search recursively the presence of key in expression object tree\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><samp>.f</samp> test of expression</td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Search recursively values that match test in expression inner tree.\n        i.e.: .f type(x) == int of sys\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><samp>.p</samp> [size|deep|count] [type]</td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Count the objects in memory by type, optionally only the types\n        whose name contains type\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><samp>.y</samp> expression</td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Display the shortest paths from modules or running frames keeping\n        the result of expression alive\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><samp>.v</samp> start [frames] | stop</td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Start or stop tracing memory allocations with tracemalloc,\n        without argument display the tracing status\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><samp>.v</samp> snapshot [name]</td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Take a snapshot of the traced allocations, the last 5 are kept\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><samp>.v</samp> top [name] [lineno|filename|traceback] [n]</td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Display the n biggest allocations of the last or named snapshot\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><samp>.v</samp> diff first second [lineno|filename|traceback] [n]</td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Display the n biggest allocation differences between two snapshots\n      </td>\n    </tr>\n  </table>\n</div>\n<div class="mdl-tabs__panel" id="help-prompt">\n  <table class="mdl-data-table mdl-js-data-table mdl-shadow--2dp">\n    <tr>\n      <td class="cmd">iterable!sthg</td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        If <a href="https://github.com/paradoxxxzero/cutter">\n          cutter\n        </a> is installed, executes cut(iterable).sthg\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd">expr >! file</td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Write the result of expr in file\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd">!< file</td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Eval the content of file\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><kbd>Enter</kbd></td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Eval the current selected text in page,\n        useful to eval code in the source\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><kbd>Shift</kbd> + <kbd>Enter</kbd></td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Insert the current selected text in page in the prompt\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><kbd>Ctrl</kbd> + <kbd>Enter</kbd></td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Force multiline prompt\n      </td>\n    </tr>\n  </table>\n</div>\n<div class="mdl-tabs__panel" id="help-misc">\n  <table class="mdl-data-table mdl-js-data-table mdl-shadow--2dp">\n    <tr>\n      <td class="cmd"><samp>.h</samp></td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Get some help\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><samp>.m</samp></td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Restart program\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><samp>.e</samp></td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Toggle file edition mode\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><samp>.o</samp></td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Try to open file in external ($EDITOR / $VISUAL / xdg-open) editor.\n        <br>\n        Add an argument (or hold shift with alt+o) if your editor does not\n        support the file:lno:col syntax.\n      </td>\n    </tr>\n    <tr>\n      <td class="cmd"><samp>.g</samp></td>\n      <td class="mdl-data-table__cell--non-numeric dfn">\n        Clear scrollback\n      </td>\n    </tr>\n  </table>\n</div>',Wdb=function(){function t(){t.__super__.constructor.call(this),this.started=!1,this.cwd=null,this.file_cache={},this.last_cmd=null,this.evalTime=null,this.ws=new Websocket(this,$("[data-uuid]").attr("data-uuid")),this.traceback=new Traceback(this),this.source=new Source(this),this.interpreter=new Interpreter(this),this.prompt=new Prompt(this),this.switch=new Switch(this),this.watchers=new Watchers(this),this.$patience=$(".patience"),$(window).on("beforeunload",this.unload.bind(this))}return extend(t,Log),t.prototype.__version__="3.3.1",t.prototype.opening=function(){return this.started||($(window).on("keydown",this.global_key.bind(this)),this.started=!0),this.ws.send("Start"),this.switch.open_term()},t.prototype.working=function(){return $("body,.activity").addClass("is-active")},t.prototype.chilling=function(){return $("body,.activity").removeClass("is-active")},t.prototype.done=function(){return this.interpreter.scroll(),this.prompt.ready(),this.chilling()},t.prototype.init=function(t){var e,n,r,s,o,i,a;for(t.version!==this.constructor.prototype.__version__&&this.print({for:"Client Server version mismatch !",result:"Server is "+this.constructor.prototype.__version__+" and Client is "+(t.version||"<= 2.0")}),this.cwd=t.cwd,a=[],s=0,o=(r=t.breaks).length;s<o;s++)n=r[s],null==(e=this.source.breakpoints)[i=n.fn]&&(e[i]=[]),a.push(this.source.breakpoints[n.fn].push(n));return a},t.prototype.title=function(t){return $(".title").text(t.title).attr("title",t.title),$(".subtitle").text(t.subtitle).attr("title",t.subtitle)},t.prototype.trace=function(t){return this.switch.open_trace(),this.traceback.make_trace(t.trace)},t.prototype.select_trace=function(t){return this.ws.send("Select",t)},t.prototype.selectcheck=function(t){return t.name in this.file_cache?(t.file=this.file_cache[t.name],this.select(t)):this.ws.send("File",t.name)},t.prototype.select=function(t){var e;return e=t.frame,this.switch.open_code(),$(".trace-line").removeClass("selected"),$(".trace-"+e.level).addClass("selected"),this.file_cache[t.name]=t.file,this.source.open(t,e),this.done()},t.prototype.ellipsize=function(t){return t.find("span.cm-string").each(function(){var t;if((t=$(this).text()).length>128)return $(this).text(""),$(this).append($('<span class="short close">').text(t.substr(0,128))),$(this).append($('<span class="long">').text(t.substr(128)))})},t.prototype.code=function(t,e,n,r,s,o){var i,a,l,c,d,p;if(null==n&&(n=[]),null==r&&(r=!1),null==s&&(s=null),null==o&&(o="python"),r)a="<"!==e[0]||">"!==e.slice(-1)?$("<div>",{class:"out"}).html(e):$(e),t.append(a),a.add(a.find("*")).contents().filter(function(){return 3===this.nodeType&&this.nodeValue.length>0&&!$(this.parentElement).closest("thead").length}).wrap("<code>").parent().each((p=this,function(t,e){var r,i,a,l;for((r=$(e)).addClass("waiting_for_hl").addClass("cm-s-default"),a=0,l=n.length;a<l;a++)i=n[a],r.addClass(i);return s&&r.attr("title",s),setTimeout(function(){return CodeMirror.runMode(r.text(),o,r.get(0)),r.removeClass("waiting_for_hl"),p.ellipsize(r)},50)}));else{for(i=$("<code>",{class:"cm-s-default"}),c=0,d=n.length;c<d;c++)l=n[c],i.addClass(l);s&&i.attr("title",s),t.append(i),CodeMirror.runMode(e,o,i.get(0)),this.ellipsize(i)}return i},t.prototype.execute=function(t){var e,n,r,s,o,i;if(i=this,e=function(){return i.ws.send.apply(i.ws,arguments),i.last_cmd=arguments,i.working()},0===t.indexOf("."))return(o=t.indexOf(" "))>-1?(r=t.substr(1,o-1),n=t.substr(o+1)):(r=t.substr(1),n=""),void(function(){switch(r){case"a":return this.printHistory();case"b":return this.toggle_break(n);case"c":return e("Continue");case"d":if(n)return e("Dump",n);break;case"e":return this.source.toggle_edition();case"f":if(n)return e("Find",n);break;case"g":return this.cls();case"h":return this.printHelp();case"i":if(n)return e("Display",n);break;case"j":if(n)return e("Jump",n);break;case"k":return this.clearHistory();case"l":return e("Breakpoints");case"m":return e("Restart");case"n":return e("Next");case"o":return this.source.external(!n);case"p":return e("Census",n);case"q":return e("Quit");case"r":return e("Return");case"s":return e("Step");case"t":return this.toggle_break(n,!0);case"u":return e("Until");case"v":return e("Allocations",n);case"w":if(n)return e("Watch",n);break;case"x":if(n)return e("Diff",n);break;case"y":if(n)return e("Referrers",n);break;case"z":return this.toggle_break(n,!1,!0)}}.call(this)||this.prompt.unlock());if(0!==t.indexOf("?")){if(""!==t||!this.last_cmd)return t?(this.working(),this.ws.send("Eval",t),this.evalTime="undefined"!=typeof performance&&null!==performance?performance.now():void 0,this.$patience.text(this.pretty_time(0)),s=function(t){return function(){var e;if(t.evalTime)return e=parseInt(1e3*(performance.now()-t.evalTime)),t.$patience.text(t.pretty_time(e)),requestAnimationFrame(s);t.$patience.text("")}}(this),requestAnimationFrame(s)):void 0;e.apply(this,this.last_cmd)}else e("Dump",t.slice(1).trim())},t.prototype.cls=function(){return this.interpreter.clear(),this.done()},t.prototype.printHistory=function(){return this.print({for:"History",result:this.prompt.history.getSessionHistory().reverse().filter(function(t){return 0!==t.indexOf(".")}).join("\n")})},t.prototype.clearHistory=function(){return this.prompt.history.clear()},t.prototype.printHelp=function(){return this.dialog("Help",help),this.done()},t.prototype.print=function(t){var e,n,r,s,o,i;return this.evalTime&&(s=parseInt(1e3*(performance.now()-this.evalTime)),i=performance.now(),this.evalTime=null),e=$("<div>",{class:"printed scroll-line"}),this.interpreter.write(e),e.append(r=$("<div>")),this.code(e,t.for,["for prompted"]),n=$("<div>",{class:"result"}),e.append(n),this.code(n,t.result||" ",["val"],!0),o=parseInt(1e3*(performance.now()-i)),t.duration&&this.code(r,this.pretty_time(t.duration),["duration"],!1,"Total "+this.pretty_time(s)+" + "+this.pretty_time(o)+" of rendering"),this.done()},t.prototype.echo=function(t){var e,n;return e=$("<div>",{class:"echoed scroll-line"}),this.interpreter.write(e),this.code(e,t.for,["for prompted"]),n=$("<div>",{class:"result"}),e.append(n),this.code(n,t.val||"",["val"],!0,null,t.mode),this.done()},t.prototype.rawhtml=function(t){var e;return e=$("<div>",{class:"rawhtml scroll-line"}),this.interpreter.write(e),this.code(e,t.for,["for prompted"]),this.interpreter.write(t.val),this.done()},t.prototype.dump=function(t){var e,n,r,s,o,i,a,l,c,d,p,h,u;for(p in i=$("<div>",{class:"dump scroll-line"}),this.interpreter.write(i),t.size&&this.code(i,t.size,["duration"],!1,"Deep size"),this.code(i,t.for,["for prompted"]),r=$("<div>"),c=$("<table>",{class:"mdl-data-table mdl-js-data-table mdl-shadow--2dp object"}).appendTo(r),s=$("<thead>",{class:"toggle closed"}).append($("<tr>").append($("<th>",{class:"core",colspan:2}).text("Core Members"))).appendTo(c),o=$("<tbody>",{class:"core closed"}).appendTo(c),a=$("<thead>",{class:"toggle closed"}).append($("<tr>").append($("<th>",{class:"method",colspan:2}).text("Methods"))).appendTo(c),l=$("<tbody>",{class:"method closed"}).appendTo(c),e=$("<thead>",{class:"toggle closed"}).append($("<tr>").append($("<th>",{class:"attr",colspan:2}).text("Attributes"))).appendTo(c),n=$("<tbody>",{class:"attr closed"}).appendTo(c),h=t.val)u=h[p],d=n,0===p.indexOf("__")&&-1!==p.indexOf("__",p.length-2)?d=o:-1!==u.type.indexOf("method")&&(d=l),d.append($("<tr>").append($("<td>",{class:"key"}).text(p)).append($("<td>",{class:"mdl-data-table__cell--non-numeric val"}).html(u.val)));return 0===o.find("tr").length&&(s.remove(),o.remove()),0===n.find("tr").length&&(e.remove(),n.remove()),0===l.find("tr").length&&(a.remove(),l.remove()),t.doc&&(c.append($("<thead>",{class:"toggle closed"}).append($("<tr>").append($("<th>",{class:"doc",colspan:2}).text("Documentation")))),$("<tbody>",{class:"doc closed"}).append($("<tr>").append($("<td>",{class:"mdl-data-table__cell--non-numeric doc",colspan:2}).text(t.doc))).appendTo(c)),t.source&&(c.append($("<thead>",{class:"toggle closed"}).append($("<tr>").append($("<th>",{class:"source",colspan:2}).text("Source")))),$("<tbody>",{class:"source closed"}).append($("<tr>").append($("<td>",{class:"mdl-data-table__cell--non-numeric source",colspan:2}).text(t.source))).appendTo(c)),componentHandler.upgradeElement(c.get(0)),this.code(i,r.html(),[],!0),this.done()},t.prototype.breakset=function(t){var e;return this.source.set_breakpoint(t),"."!==this.prompt.get()[0]||"b"!==(e=this.prompt.get()[1])&&"t"!==e?this.chilling():this.done()},t.prototype.breakunset=function(t){var e;return this.source.clear_breakpoint(t),"."!==this.prompt.get()[0]||"b"!==(e=this.prompt.get()[1])&&"t"!==e&&"z"!==e?this.chilling():this.done()},t.prototype.split=function(t,e){var n;return indexOf.call(t,e)>=0?[(n=t.split(e))[0],n.slice(1).join(e).trim()]:[t,null]},t.prototype.break_options=function(t){var e,n,r,s,o,i,a,l,c;if(i={},!(s=t.match(/\s*\[((\s*(ignore|hit|sample)\s*=\s*\d+\s*,?)+)\]\s*$/)))return[t,i];for(e=0,r=(a=s[1].split(",")).length;e<r;e++)(o=a[e]).trim()&&(n=(l=o.split("="))[0],c=l[1],i[n.trim()]=parseInt(c));return[t.slice(0,s.index),i]},t.prototype.toggle_break=function(t,e,n){var r,s,o,i,a,l,c,d,p,h,u,m,f,b,y,g;for(d in null==e&&(e=!1),null==n&&(n=!1),r={lno:null,cond:null,fun:null,fn:null,temporary:e,ignore:null,hit:null,sample:null},y=(h=this.break_options(t))[0],p=h[1])g=p[d],r[d]=g;for(y=(u=this.split(y,","))[0],r.cond=u[1],y=(m=this.split(y,"#"))[0],r.fun=m[1],y=(f=this.split(y,":"))[0],r.lno=f[1],r.fn=y||this.source.state.fn,r.lno=parseInt(r.lno)||null,i=null,a=0,c=(b=this.source.breakpoints[r.fn]||[]).length;a<c;a++)if((o=b[a]).fn===r.fn&&o.lno===r.lno&&o.cond===r.cond&&o.fun===r.fun&&(o.temporary===r.temporary||n)){i=o;break}return i&&!n&&function(){var t;for(l in t=[],p)g=p[l],i[l]!==g&&t.push(l);return t}().length&&(this.source.clear_breakpoint(i),i=null),i||n?(i&&(r=i),this.source.clear_breakpoint(r),s="Unbreak",r.temporary||(s="Broadcast|"+s),this.ws.send(s,r),void this.working()):(r.lno&&this.source.ask_breakpoint(r.lno),s="Break",e||(s="Broadcast|"+s),this.ws.send(s,r),this.working())},t.prototype.watched=function(t){return this.watchers.updateAll(t)},t.prototype.ack=function(){return this.done()},t.prototype.display=function(t){var e,n;return e=$("<div>",{class:"display scroll-line"}),this.interpreter.write(e),this.code(e,t.for,["for prompted"]),(n=t.type.indexOf("image")>=0?$("<img>"):t.type.indexOf("audio")>=0?$("<audio>",{controls:"controls",autoplay:"autoplay"}):t.type.indexOf("video")>=0||t.type.indexOf("/ogg")>=0?$("<video>",{controls:"controls",autoplay:"autoplay"}):$("<iframe>")).addClass("display"),n.attr("src","data:"+t.type+";charset=UTF-8;base64,"+t.val),e.append(n),this.done()},t.prototype.suggest=function(t){if(t)return this.prompt.complete(t)},t.prototype.die=function(){if(this.title({title:"Dead",subtitle:"Program has exited"}),this.ws.ws.close(),$("body").addClass("is-dead"),!$("body").attr("data-debug"))return setTimeout(function(){return window.close()},10)},t.prototype.global_key=function(t){var e,n,r,s,o,i;if(this.source.rw)return!0;if(i=this.source.focused()&&this.source.code_mirror.getSelection(),t.altKey&&(65<=(r=t.keyCode)&&r<=90||37<=(s=t.keyCode)&&s<=40||13===t.keyCode)||118<=(o=t.keyCode)&&o<=122)return n="","b"!==(e=(e=function(){switch(t.keyCode){case 37:case 118:return"u";case 13:case 119:return"c";case 38:case 120:return"r";case 39:case 121:return"n";case 40:case 122:return"s";default:return String.fromCharCode(t.keyCode)}}()).toLowerCase())&&"t"!==e&&"z"!==e||(n+=" :"+this.source.state.lno),"i"===e&&(n=" "+i),"o"===e&&t.shiftKey&&(n=" !"),this.execute("."+e+n),!1;if(13===t.keyCode){if(this.prompt.focused())return;if(!i)return;return t.shiftKey?(this.prompt.insert(i),this.prompt.focus()):t.ctrlKey?this.ws.send("Watch",i):(this.prompt.history.historize(i),this.execute(i)),!1}},t.prototype.newline=function(){return this.prompt.ready(!0),this.chilling()},t.prototype.inspect=function(t){return this.ws.send("Inspect",t),this.working(),!1},t.prototype.unwatch=function(t){return this.ws.send("Unwatch",t),this.working()},t.prototype.paste_target=function(t){var e;if(""===(e=$(t.target).text().trim()))return!0;if(t.shiftKey)this.prompt.insert(e);else{if(!t.ctrlKey)return this.prompt.history.historize(e),this.ws.send("Dump",e),this.working(),!1;this.ws.send("Watch",e)}},t.prototype.disable=function(){return this.ws.send("Disable")},t.prototype.shell=function(){return this.switch.close_trace(),this.switch.close_code(),this.switch.open_term(),this.done()},t.prototype.dialog=function(t,e){var n,r,s;return $(".modals").append(n=$('<dialog class="mdl-dialog">\n  <h3 class="mdl-dialog__title">'+t+'</h3>\n  <div class="mdl-dialog__content">\n    '+e+'\n  </div>\n  <div class="mdl-dialog__actions">\n    <button type="button" class="mdl-button dialog-close">Close</button>\n  </div>\n</dialog>')),n.find(".dialog-close").on("click",function(){return n.get(0).close(),n.remove()}),n.find(".mdl-tabs,.mdl-data-table").each(function(){return componentHandler.upgradeElement(this)}),n.on("close",(s=this,function(){return s.prompt.ready()})),r=n.get(0),"undefined"!=typeof dialogPolyfill&&null!==dialogPolyfill&&dialogPolyfill.registerDialog(r),r.showModal()},t.prototype.pretty_time=function(t){var e,n,r,s;return t<1e3?t+"μs":(t/=1e3)<10?t.toFixed(2)+"ms":t<100?t.toFixed(1)+"ms":t<1e3?t.toFixed(0)+"ms":(t/=1e3)<10?t.toFixed(2)+"s":t<60?t.toFixed(1)+"s":(s=function(t){return 1===(t=t.toString()).length?"0"+t:t},r=(t-60*(n=Math.floor(t/60))).toFixed(0),n<60?n+"m"+s(r)+"s":(e=Math.floor(n/60))+"h"+s(n=(n-60*e).toFixed(0))+"m"+s(r)+"s")},t.prototype.unload=function(){return this.ws.ws.close()},t}(),$(function(){return window.wdb=new Wdb});
\ No newline at end of file
@@ -22,9 +22,10 @@ from struct import unpack
 
 from tornado.iostream import IOStream, StreamClosedError
 from tornado.options import options
-from wdb_server.state import breakpoints, sockets, websockets
+from wdb_server.state import Channel, breakpoints, sockets, websockets
 
 log = getLogger('wdb_server')
+MULTIPLEX = b'MULTIPLEX'
 log.setLevel(10 if options.debug else 30)
 
 
@@ -35,9 +36,13 @@ async def handle_connection(connection, address):
     try:
         raw_length = await stream.read_bytes(4)
         uuid_length, = unpack("!i", raw_length)
-        assert uuid_length == 36, 'Wrong uuid length'
+        assert uuid_length in (36, len(MULTIPLEX)), 'Wrong uuid length'
 
         uuid_bytes = await stream.read_bytes(uuid_length)
+        if uuid_bytes == MULTIPLEX:
+            await multiplexed_read_loop(stream, address)
+            return
+
         uuid = uuid_bytes.decode("utf-8")
         log.debug('Assigning stream to %s' % uuid)
 
@@ -71,10 +76,43 @@ async def read_loop(stream, uuid):
         log.warning('Closed stream for %s' % uuid)
 
 
+async def multiplexed_read_loop(stream, address):
+    log.debug('Multiplexing stream of %s' % str(address))
+    channels = {}
+    # Channel 0 is used to push breakpoint changes
+    sockets.add_process(stream)
+    try:
+        while True:
+            raw_length = await stream.read_bytes(4)
+            length, = unpack("!i", raw_length)
+            frame = await stream.read_bytes(length)
+            channel, = unpack("!i", frame[:4])
+            frame = frame[4:]
+            uuid = channels.get(channel)
+            if uuid is None:
+                # First channel frame is the uuid
+                uuid = channels[channel] = frame.decode('utf-8')
+                log.debug('Assigning channel %d to %s' % (channel, uuid))
+                sockets.add(uuid, Channel(stream, channel))
+            elif not frame:
+                del channels[channel]
+                on_close(uuid)
+            else:
+                await handle_frame(uuid, stream, frame)
+    except StreamClosedError:
+        log.warning('Closed multiplexed stream for %s' % str(address))
+    sockets.remove_process(stream)
+    for uuid in channels.values():
+        on_close(uuid)
+
+
 async def handle_frame(uuid, stream, frame):
     decoded = frame.decode('utf-8')
     if decoded == 'ServerBreaks':
         sockets.send(uuid, json.dumps(breakpoints.get()))
+    elif decoded.startswith('ServerBreaks|'):
+        known = json.loads(decoded.split('|', 1)[1])
+        sockets.send(uuid, json.dumps(breakpoints.snapshot(known)))
     elif decoded == 'PING':
         log.info('%s PONG' % uuid)
     elif decoded.startswith('UPDATE_FILENAME'):
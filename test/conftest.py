@@ -25,7 +25,8 @@ LOCALS = locals()
 
 
 class Slave(Process):
-    def __init__(self, use, host='localhost', port=19999):
+    def __init__(self, use, host='localhost', port=19999, listener=None):
+        self.listener = listener
         self.argv = None
         self.file = os.path.join(
             os.path.dirname(__file__), 'scripts', use.file
@@ -37,6 +38,7 @@ class Slave(Process):
                 os.path.dirname(__file__), '..', 'client', 'wdb', '__main__.py'
             )
 
+        self.monitoring = use.monitoring
         self.host = host
         self.port = port
         super(Slave, self).__init__()
@@ -44,9 +46,15 @@ class Slave(Process):
     def run(self):
         import wdb
 
+        if self.listener:
+            # Don't keep the test server listening in forks
+            self.listener.close()
+
         wdb.SOCKET_SERVER = self.host
         wdb.SOCKET_PORT = self.port
         wdb.WDB_NO_BROWSER_AUTO_OPEN = True
+        if self.monitoring:
+            wdb.WDB_MONITORING = True
         sys.argv = self.argv
 
         with open(self.file, 'rb') as file:
@@ -80,13 +88,14 @@ class Message(object):
 
 class Socket(object):
     def __init__(self, testfile, host='localhost', port=19999):
-        self.slave = Slave(testfile, host, port)
+        # Listen first, a non blocking connection fails fast
+        self.listener = Listener((host, port))
+        self.slave = Slave(testfile, host, port, self.listener)
         self.slave.start()
         self.started = False
         self.host = host
         self.port = port
         self.connections = {}
-        self.listener = None
 
     def connection(self, uuid):
         if uuid is None and len(self.connections) == 1:
@@ -182,7 +191,10 @@ class Socket(object):
 
             if call:
                 assert echomsg.data['for'] == '__call__'
-                assert call in echomsg.data.val
+                if hasattr(call, 'search'):
+                    assert call.search(echomsg.data.val)
+                else:
+                    assert call in echomsg.data.val
 
             if return_:
                 assert echomsg.data['for'] == '__return__'
@@ -209,21 +221,23 @@ class Socket(object):
         slave_was_alive = False
         if self.slave.is_alive():
             self.slave.terminate()
+            self.slave.join()
             slave_was_alive = True
 
         if self.started:
             for connection in self.connections.values():
                 connection.close()
-            self.listener.close()
+        self.listener.close()
 
         if slave_was_alive and not failed:
             raise Exception('Tests must join the subprocess')
 
 
 class use(object):
-    def __init__(self, file, with_main=False):
+    def __init__(self, file, with_main=False, monitoring=False):
         self.file = file
         self.with_main = with_main
+        self.monitoring = monitoring
 
     def __call__(self, fun):
         fun._wdb_use = self
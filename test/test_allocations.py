@@ -0,0 +1,59 @@
+# *-* coding: utf-8 *-*
+import pytest
+
+from wdb.allocations import Snapshots
+
+tracemalloc = pytest.importorskip('tracemalloc')
+
+
+@pytest.fixture
+def snapshots():
+    snapshots = Snapshots(size=2)
+    assert snapshots.start()
+    yield snapshots
+    snapshots.clear()
+
+
+def test_snapshots(snapshots):
+    assert snapshots.take() == '#1'
+    allocated = [str(i) * 100 for i in range(1000)]
+    assert snapshots.take('after') == 'after'
+    assert snapshots.names() == ['#1', 'after']
+
+    diff = snapshots.get('after')[1].compare_to(
+        snapshots.get('#1')[1], 'lineno'
+    )
+    assert diff[0].traceback[0].filename == __file__
+    assert diff[0].size_diff > 100 * 1000
+    assert len(allocated) == 1000
+
+
+def test_snapshots_bounded(snapshots):
+    for name in 'abc':
+        snapshots.take(name)
+    assert snapshots.names() == ['b', 'c']
+    assert snapshots.get()[0] == 'c'
+    with pytest.raises(KeyError):
+        snapshots.get('a')
+
+
+def test_snapshots_clear(snapshots):
+    assert not snapshots.start()
+    snapshots.take()
+    snapshots.clear()
+    assert len(snapshots) == 0
+    assert not tracemalloc.is_tracing()
+    with pytest.raises(KeyError):
+        snapshots.get()
+
+
+def test_snapshots_not_started():
+    tracemalloc.start()
+    try:
+        snapshots = Snapshots()
+        assert not snapshots.start()
+        snapshots.clear()
+        # Not started by wdb
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
@@ -0,0 +1,176 @@
+# *-* coding: utf-8 *-*
+import sys
+
+from wdb.breakpoint import (
+    Breakpoint,
+    Breakpoints,
+    ConditionalBreakpoint,
+    FunctionBreakpoint,
+    LineBreakpoint,
+    from_server,
+)
+
+
+def returned_frame():
+    # A returned frame keeps its last line number
+    return sys._getframe()
+
+
+def test_registry_line_lookup():
+    breakpoints = Breakpoints()
+    frame = returned_frame()
+    brk = LineBreakpoint(__file__, frame.f_lineno)
+    other = LineBreakpoint(__file__, frame.f_lineno + 1)
+    breakpoints.add(brk)
+    breakpoints.add(other)
+    assert breakpoints.candidates(frame) == (brk,)
+    assert sorted(breakpoints.get_breaks_lno(__file__)) == [
+        brk.line,
+        other.line,
+    ]
+    assert len(breakpoints.get_file_breaks(__file__)) == 2
+    assert breakpoints.get_file_breaks('/nowhere.py') == []
+
+
+def test_registry_buckets():
+    breakpoints = Breakpoints()
+    frame = returned_frame()
+    function = FunctionBreakpoint(__file__, 'returned_frame')
+    file = Breakpoint(__file__)
+    cond = ConditionalBreakpoint(__file__, None, 'True')
+    for brk in (function, file, cond):
+        breakpoints.add(brk)
+    assert set(breakpoints.candidates(frame)) == set((function, file, cond))
+    assert all(brk.breaks(frame) for brk in breakpoints.candidates(frame))
+
+
+def test_registry_add_remove():
+    breakpoints = Breakpoints()
+    breakpoints.add(LineBreakpoint(__file__, 12))
+    breakpoints.add(LineBreakpoint(__file__, 12))
+    assert len(breakpoints) == 1
+    assert LineBreakpoint(__file__, 12) in breakpoints
+    assert LineBreakpoint(__file__, 12, temporary=True) not in breakpoints
+
+    breakpoints.remove(LineBreakpoint(__file__, 12))
+    assert len(breakpoints) == 0
+    assert breakpoints.get_file_breaks(__file__) == []
+    breakpoints.discard(LineBreakpoint(__file__, 12))
+
+
+def test_registry_version():
+    breakpoints = Breakpoints()
+    version = breakpoints.version
+    breakpoints.add(LineBreakpoint(__file__, 12))
+    assert breakpoints.version > version
+    version = breakpoints.version
+    breakpoints.add(LineBreakpoint(__file__, 12))
+    assert breakpoints.version == version
+    breakpoints.discard(LineBreakpoint(__file__, 12))
+    assert breakpoints.version > version
+
+
+def test_breakpoint_equality():
+    assert LineBreakpoint(__file__, 1) != Breakpoint(__file__)
+    assert hash(LineBreakpoint(__file__, 1)) == hash(
+        LineBreakpoint(__file__, 1)
+    )
+    assert FunctionBreakpoint(__file__, 'a') != FunctionBreakpoint(
+        __file__, 'b'
+    )
+
+
+def test_breakpoint_ignore_hit():
+    ignore = LineBreakpoint(__file__, 1, ignore=2)
+    assert [ignore.count() for i in range(4)] == [False, False, True, True]
+    hit = LineBreakpoint(__file__, 1, hit=3)
+    assert [hit.count() for i in range(4)] == [False, False, True, False]
+    assert LineBreakpoint(__file__, 1, sample=1).count()
+
+
+def test_breakpoint_options_dict():
+    brk = FunctionBreakpoint(__file__, 'a', ignore=1, sample=10)
+    assert brk.to_dict()['ignore'] == 1
+    assert brk.to_dict()['hit'] is None
+    assert brk.to_dict()['sample'] == 10
+
+
+def test_conditional_compiled_once():
+    frame = returned_frame()
+    brk = ConditionalBreakpoint(__file__, None, 'frame is not None')
+    code = brk.code
+    assert brk.matches(frame)
+    assert brk.code is code
+    assert not ConditionalBreakpoint(__file__, None, 'False').matches(frame)
+
+
+def test_registry_server_sync():
+    breakpoints = Breakpoints()
+    stale = LineBreakpoint(__file__, 1)
+    temporary = LineBreakpoint(__file__, 2, temporary=True)
+    kept = LineBreakpoint(__file__, 3, hit=2)
+    local = LineBreakpoint('/tmp/x.py', 3)
+    breakpoints.sync([stale, LineBreakpoint(__file__, 3)], 1)
+    breakpoints.add(temporary)
+    breakpoints.add(local)
+    breakpoints.sync([kept], 4)
+    assert set(breakpoints) == set((temporary, local, kept))
+    assert [brk for brk in breakpoints if brk == kept][0].hit == 2
+    assert breakpoints.server_version == 4
+
+    # Removed from the server after being pushed
+    pushed = LineBreakpoint(__file__, 7)
+    assert breakpoints.apply(5, add=pushed)
+    breakpoints.sync([kept], 6)
+    assert set(breakpoints) == set((temporary, local, kept))
+
+
+def test_registry_server_apply():
+    breakpoints = Breakpoints()
+    breakpoints.sync([], 1)
+    brk = from_server(
+        {'fn': __file__, 'lno': 5, 'cond': None, 'fun': None, 'hit': 3}
+    )
+    assert isinstance(brk, LineBreakpoint)
+    assert breakpoints.apply(2, add=brk)
+    assert brk in breakpoints
+    # Already applied
+    assert breakpoints.apply(2, remove=brk)
+    assert brk in breakpoints
+    assert breakpoints.apply(3, remove=brk)
+    assert brk not in breakpoints
+    # Missed version 4
+    assert not breakpoints.apply(5, add=brk)
+    assert brk in breakpoints
+    assert breakpoints.server_version is None
+
+
+def test_registry_server_epoch():
+    breakpoints = Breakpoints()
+    brk = LineBreakpoint(__file__, 5)
+    breakpoints.sync([], 3, 'first')
+    assert breakpoints.apply(4, add=brk, epoch='first')
+    # Restarted server with the same version
+    assert not breakpoints.apply(4, remove=brk, epoch='second')
+    assert breakpoints.server_version is None
+    assert breakpoints.sync([], 4, 'second')
+    assert breakpoints.server_epoch == 'second'
+    assert breakpoints.server_version == 4
+
+
+def test_registry_server_sync_replay():
+    breakpoints = Breakpoints()
+    brk = LineBreakpoint(__file__, 5)
+    other = LineBreakpoint(__file__, 6)
+    # Pushed before the snapshot is received
+    assert not breakpoints.apply(2, add=brk, epoch='epoch')
+    assert not breakpoints.apply(3, add=other, epoch='epoch')
+    assert breakpoints.sync([brk], 2, 'epoch')
+    assert set(breakpoints) == set((brk, other))
+    assert breakpoints.server_version == 3
+
+    breakpoints = Breakpoints()
+    assert not breakpoints.apply(4, add=other, epoch='epoch')
+    # Version 3 is missing
+    assert not breakpoints.sync([brk], 2, 'epoch')
+    assert breakpoints.server_version is None
@@ -36,6 +36,29 @@ def test_simple_break(socket):
     socket.join()
 
 
+@use('movement.py')
+def test_next_over_break(socket):
+    socket.start()
+    socket.assert_init()
+    socket.send('Break', make_break('movement.py', 7))
+    msg = socket.receive()
+    assert msg.command == 'BreakSet'
+    for line in (12, 13, 14):
+        socket.send('Next')
+        socket.assert_position(line=line)
+    socket.send('Next')
+    socket.assert_position(line=7)
+    socket.send('Next')
+    socket.assert_position(line=8)
+    socket.send('Next')
+    socket.assert_position(line=8, return_='12</a>')
+    socket.send('Next')
+    socket.assert_position(line=16)
+
+    socket.send('Continue')
+    socket.join()
+
+
 @use('movement.py')
 def test_function_break(socket):
     socket.start()
@@ -79,3 +102,21 @@ def test_conditional_break(socket):
 
     socket.send('Continue')
     socket.join()
+
+
+@use('movement.py')
+def test_continue_to_running_frame(socket):
+    socket.start()
+    socket.assert_init()
+
+    socket.send('Break', make_break('movement.py', 20))
+    msg = socket.receive()
+    assert msg.command == 'BreakSet'
+    for i in range(3):
+        socket.send('Continue')
+        socket.assert_position(line=20)
+    socket.send('Next')
+    socket.assert_position(line=16)
+
+    socket.send('Continue')
+    socket.join()
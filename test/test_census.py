@@ -0,0 +1,39 @@
+# *-* coding: utf-8 *-*
+from wdb.census import CENSUS_PAGE, Census
+
+
+class Leak(object):
+    def __init__(self, i):
+        self.data = 'leak %d' % i
+
+
+def test_census():
+    leaks = [Leak(i) for i in range(100)]
+    census = Census('count', '%s.Leak' % __name__).take()
+    assert not census.partial
+    assert census.counted == census.total
+    (row,) = census.rows
+    assert row.type is Leak
+    assert row.count == 100
+    assert len(row.samples) == 5
+    assert all(sample in leaks for sample in row.samples)
+    assert row.size > 0
+    # The data strings are not tracked by the gc
+    assert row.deep > row.size
+
+
+def test_census_sort():
+    census = Census('count').take()
+    counts = [row.count for row in census.rows]
+    assert counts == sorted(counts, reverse=True)
+    assert len(census.page(0)) == CENSUS_PAGE
+    assert census.page(CENSUS_PAGE)[0] is census.rows[CENSUS_PAGE]
+
+
+def test_census_timeout():
+    census = Census()
+    census.timeout = -1
+    census.take()
+    assert census.partial
+    assert census.counted == 0
+    assert census.rows == []
@@ -0,0 +1,144 @@
+# *-* coding: utf-8 *-*
+import json
+import socket
+import sys
+import time
+from multiprocessing import Pipe
+from threading import Thread
+
+from wdb import Wdb
+from wdb.breakpoint import LineBreakpoint
+from wdb.circuit import (
+    BACKOFF_BASE,
+    BACKOFF_CAP,
+    Circuit,
+    backoff,
+    get_circuit,
+)
+from wdb.state import Running
+
+
+def test_lazy_connection():
+    wdb = Wdb.get(port=19998)
+    try:
+        assert wdb._socket is None
+        assert Wdb.get() is wdb
+        assert wdb._socket is None
+    finally:
+        Wdb.pop()
+
+
+def test_backoff():
+    for tries in range(10):
+        delay = backoff(tries)
+        assert delay <= BACKOFF_BASE * 2 ** tries
+        assert delay >= min(BACKOFF_CAP, BACKOFF_BASE * 2 ** tries) / 2
+    assert backoff(100) <= BACKOFF_CAP
+
+
+def test_circuit():
+    server = socket.socket()
+    server.bind(('localhost', 0))
+    circuit = Circuit(server.getsockname())
+    assert circuit.allows()
+
+    circuit.failure()
+    assert circuit.to_dict()['state'] in ('open', 'half-open')
+    assert not circuit.allows()
+
+    server.listen(1)
+    for i in range(50):
+        if circuit.allows():
+            break
+        time.sleep(0.05)
+    server.close()
+    assert circuit.to_dict() == {
+        'state': 'closed',
+        'failures': 0,
+        'retry_at': None,
+    }
+
+
+def test_interaction_without_server(monkeypatch):
+    monkeypatch.setattr('wdb.backoff', lambda tries, cap: 0)
+    # Bound but not listening
+    server = socket.socket()
+    server.bind(('localhost', 0))
+    port = server.getsockname()[1]
+    circuit = get_circuit('localhost', port)
+    wdb = object.__new__(Wdb)
+    Wdb.__init__(wdb, server='localhost', port=port)
+    try:
+        wdb.set_trace()
+        assert wdb._socket is None
+        assert not wdb.stepping
+        assert isinstance(wdb.state, Running)
+        assert sys.gettrace() is None
+
+        # The circuit is now open
+        assert not circuit.allows()
+        start = time.time()
+        wdb.set_trace()
+        assert time.time() - start < 1
+        assert sys.gettrace() is None
+    finally:
+        # Let the probe close the circuit
+        server.listen(1)
+        for i in range(50):
+            if circuit.allows():
+                break
+            time.sleep(0.05)
+        server.close()
+
+
+def test_dedicated_pushes(monkeypatch):
+    monkeypatch.setattr('wdb.WDB_MULTIPLEX', False)
+    server, client = Pipe()
+    wdb = object.__new__(Wdb)
+    Wdb.__init__(wdb)
+    wdb._socket = client
+    brk = LineBreakpoint('/tmp/pushed.py', 1)
+
+    def delta(version, **change):
+        change.update(epoch='epoch', version=version)
+        return ('BreaksDelta|%s' % json.dumps(change)).encode('utf-8')
+
+    try:
+        server.send_bytes(delta(2, add=brk.to_dict()))
+        wdb.receive_pushes()
+        assert brk in Wdb.breakpoints
+        # Without a snapshot the version is unknown
+        assert wdb.breaks_missed
+
+        requests = []
+
+        def answer():
+            requests.append(server.recv_bytes())
+            server.send_bytes(
+                json.dumps(
+                    {
+                        'epoch': 'epoch',
+                        'version': 2,
+                        'breakpoints': [brk.to_dict()],
+                    }
+                ).encode('utf-8')
+            )
+
+        responder = Thread(target=answer)
+        responder.start()
+        wdb.sync_breakpoints()
+        responder.join()
+        assert requests[0].startswith(b'ServerBreaks|')
+        assert not wdb.breaks_missed
+        assert Wdb.breakpoints.server_version == 2
+
+        # Pushed changes are applied by interactions too
+        server.send_bytes(delta(3, remove=brk.to_dict()))
+        server.send_bytes(b'Next')
+        assert wdb.receive() == 'Next'
+        assert brk not in Wdb.breakpoints
+        assert not wdb.breaks_missed
+    finally:
+        Wdb.breakpoints.discard(brk)
+        Wdb.breakpoints.server_version = None
+        Wdb.breakpoints.server_epoch = None
@@ -0,0 +1,84 @@
+# *-* coding: utf-8 *-*
+import gc
+
+from wdb import handles
+from wdb.handles import RELEASED, Handles
+
+
+class Weakrefable(object):
+    pass
+
+
+def test_handles():
+    registry = Handles()
+    obj = Weakrefable()
+    handle = registry.add(obj)
+    assert registry.add(obj) == handle
+    assert registry.get(handle) is obj
+    other = registry.add([obj])
+    assert other > handle
+    assert registry.get(other) == [obj]
+    assert registry.get(other + 1, RELEASED) is RELEASED
+    # Falsy objects are valid ones
+    assert registry.get(registry.add(None), RELEASED) is None
+
+
+def test_handles_are_not_reused():
+    registry = Handles()
+    seen = set()
+    for i in range(10):
+        # Same id for each temporary object
+        handle = registry.add(Weakrefable())
+        assert handle not in seen
+        seen.add(handle)
+        registry.release(registry.begin())
+
+
+def test_handles_lru(monkeypatch):
+    monkeypatch.setattr(handles, 'HANDLES_SIZE', 2)
+    registry = Handles()
+    first = registry.add(Weakrefable())
+    second = registry.add([1])
+    assert registry.get(first) is not None
+    registry.add([2])
+    # Least recently used is weakly kept, or released if it can't be
+    assert len(registry.strong) == 2
+    assert registry.get(second, RELEASED) is RELEASED
+    registry.add([3])
+    gc.collect()
+    assert registry.get(first, RELEASED) is RELEASED
+
+    kept = Weakrefable()
+    handle = registry.add(kept)
+    registry.add([4])
+    registry.add([5])
+    assert handle in registry.weak
+    assert registry.get(handle) is kept
+
+
+def test_handles_budget(monkeypatch):
+    monkeypatch.setattr(handles, 'HANDLES_BUDGET', 1000)
+    registry = Handles()
+    small = registry.add([])
+    big = registry.add(list(range(1000)))
+    assert registry.get(small, RELEASED) is RELEASED
+    # The last one is kept whatever its size
+    assert registry.get(big) == list(range(1000))
+    assert registry.size == handles.sizeof(registry.get(big))
+
+
+def test_handles_generations():
+    registry = Handles()
+    before = registry.add([0])
+    outer = registry.begin()
+    during = registry.add([1])
+    inner = registry.begin()
+    nested = registry.add([2])
+    registry.release(inner)
+    assert registry.get(nested, RELEASED) is RELEASED
+    assert registry.get(during) == [1]
+    registry.release(outer)
+    assert registry.get(during, RELEASED) is RELEASED
+    assert registry.get(before, RELEASED) is RELEASED
+    assert len(registry) == 0
+    assert registry.size == 0
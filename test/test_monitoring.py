@@ -0,0 +1,76 @@
+# *-* coding: utf-8 *-*
+import sys
+
+from pytest import mark
+
+from .conftest import use
+from .test_breaks import make_break
+
+pytestmark = mark.skipif(
+    not hasattr(sys, 'monitoring'), reason='sys.monitoring is python 3.12+'
+)
+
+
+@use('movement.py', monitoring=True)
+def test_monitoring_next(socket):
+    socket.start()
+    socket.assert_init()
+
+    def next(code):
+        socket.send('Next')
+        socket.assert_position(code=code)
+
+    next('l.append(3)')
+    next('l += [8, 12]')
+    next('l = modify_list(l)')
+    next('for i, e in enumerate(l[:]):')
+
+    socket.send('Continue')
+    socket.join()
+
+
+@use('movement.py', monitoring=True)
+def test_monitoring_break(socket):
+    socket.start()
+    socket.assert_init()
+    socket.send('Break', make_break('movement.py', 7))
+    msg = socket.receive()
+    assert msg.command == 'BreakSet'
+    socket.send('Continue')
+    socket.assert_position(line=7)
+    socket.send('Next')
+    socket.assert_position(line=8)
+
+    socket.send('Continue')
+    socket.join()
+
+
+@use('error_in_with_advanced.py', monitoring=True)
+def test_monitoring_exception(socket):
+    socket.start()
+    msg = socket.receive()
+    assert msg.command == 'Init'
+
+    for i in range(2):
+        socket.assert_position(
+            title='ZeroDivisionError',
+            code='return i / 0',
+            exception="ZeroDivisionError",
+        )
+        socket.send('Next')
+        socket.assert_position(
+            code='return i / 0',
+            return_='None',
+            subtitle='Returning from make_error with value None',
+        )
+        socket.send('Next')
+        socket.assert_position(
+            title='ZeroDivisionError',
+            code='return i / 0',
+            bottom_code='parent()' if not i else 'grandparent()',
+            exception="ZeroDivisionError",
+        )
+        socket.send('Next')
+        socket.assert_position(code='except ZeroDivisionError:')
+        socket.send('Continue')
+    socket.join()
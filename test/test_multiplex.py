@@ -0,0 +1,99 @@
+# *-* coding: utf-8 *-*
+from multiprocessing.connection import Listener
+from struct import pack, unpack
+from threading import Thread
+
+from pytest import raises
+
+from wdb.multiplex import MULTIPLEX, Multiplexer, after_fork, get_multiplexer
+
+
+def test_multiplexed_channels():
+    listener = Listener(('localhost', 0))
+    connections = []
+    accept = Thread(target=lambda: connections.append(listener.accept()))
+    accept.start()
+    multiplexer = Multiplexer(listener.address)
+    accept.join()
+    server, = connections
+
+    def receive():
+        frame = server.recv_bytes()
+        return unpack('!i', frame[:4])[0], frame[4:]
+
+    try:
+        assert server.recv_bytes() == MULTIPLEX
+        first, second = multiplexer.open(), multiplexer.open()
+        first.send_bytes(b'uuid1')
+        second.send_bytes(b'uuid2')
+        assert receive() == (first.id, b'uuid1')
+        assert receive() == (second.id, b'uuid2')
+
+        server.send_bytes(pack('!i', second.id) + b'to second')
+        server.send_bytes(pack('!i', first.id) + b'to first')
+        assert first.recv_bytes() == b'to first'
+        assert second.poll(1)
+        assert second.recv_bytes() == b'to second'
+
+        server.send_bytes(pack('!i', first.id))
+        with raises(EOFError):
+            first.recv_bytes()
+
+        pushed = []
+        multiplexer.on_push = lambda multiplexer, message: pushed.append(
+            message
+        )
+        server.send_bytes(pack('!i', 0) + b'BreaksDelta|{}')
+        server.send_bytes(pack('!i', second.id) + b'after push')
+        assert second.recv_bytes() == b'after push'
+        assert pushed == ['BreaksDelta|{}']
+
+        second.close()
+        assert receive() == (second.id, b'')
+    finally:
+        server.close()
+        listener.close()
+
+
+def test_multiplexer_broken_stream():
+    listener = Listener(('localhost', 0))
+    connections = []
+    accept = Thread(target=lambda: connections.append(listener.accept()))
+    accept.start()
+    multiplexer = Multiplexer(listener.address)
+    accept.join()
+    server, = connections
+
+    try:
+        assert server.recv_bytes() == MULTIPLEX
+        channel = multiplexer.open()
+        # Not even a channel id
+        server.send_bytes(b'?')
+        with raises(EOFError):
+            channel.recv_bytes()
+        assert channel.closed
+        assert multiplexer.closed
+        assert multiplexer.connection.closed
+    finally:
+        server.close()
+        listener.close()
+
+
+def test_multiplexer_after_fork():
+    listener = Listener(('localhost', 0))
+    connections = []
+    accept = Thread(target=lambda: connections.append(listener.accept()))
+    accept.start()
+    multiplexer = get_multiplexer(*listener.address)
+    accept.join()
+    server, = connections
+
+    try:
+        after_fork()
+        assert multiplexer.closed
+        assert multiplexer.connection.closed
+        assert get_multiplexer(*listener.address) is not multiplexer
+    finally:
+        after_fork()
+        server.close()
+        listener.close()
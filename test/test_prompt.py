@@ -56,6 +56,61 @@ def test_eval_dump(socket):
     assert print_msg.command == 'Dump'
     assert print_msg.data['for'] == u('l ⟶ [3] ')
     assert print_msg.data.val
+    assert print_msg.data.size.endswith(' B')
+    # Values are got on demand
+    append = print_msg.data.val['append']
+    assert append.type == 'builtin_function_or_method'
+    link = append.val.split('href="')[1].split('"')[0]
+    assert link.endswith('/append')
+
+    socket.send('Inspect', link)
+    print_msg = socket.receive()
+    assert print_msg.command == 'Print'
+    assert print_msg.data['for'] == 'list.append'
+    assert 'built-in method append' in print_msg.data.result
+
+    socket.send('Continue')
+    socket.join()
+
+
+@use('movement.py')
+def test_eval_page(socket):
+    socket.start()
+    socket.assert_init()
+    socket.send('Next')
+    socket.assert_position(line=12)
+
+    socket.send('Eval', 'list(range(200))')
+    print_msg = socket.receive()
+    assert print_msg.command == 'Print'
+    assert '[185 more…]' in print_msg.data.result
+    link = print_msg.data.result.split('<a href="page/')[-1].split('"')[0]
+    assert link.endswith('/10/185')
+    watched_msg = socket.receive()
+    assert watched_msg.command == 'Watched'
+
+    socket.send('Inspect', 'page/' + link)
+    print_msg = socket.receive()
+    assert print_msg.command == 'Print'
+    assert print_msg.data['for'] == 'list[10:195]'
+    assert 'class="inspect">109</a>' in print_msg.data.result
+    assert 'class="inspect">110</a>' not in print_msg.data.result
+    assert '/110/85" class="inspect">[85 more…]' in print_msg.data.result
+
+    socket.send('Continue')
+    socket.join()
+
+
+@use('movement.py')
+def test_dump_timeout(socket):
+    socket.start()
+    socket.assert_init()
+
+    socket.send('Dump', 'all(i >= 0 for i in range(10 ** 12))')
+    echo_msg = socket.receive()
+    assert echo_msg.command == 'Echo'
+    assert 'Timed out, retry…' in echo_msg.data.val
+    assert echo_msg.data.val.startswith('<a href="retry/')
 
     socket.send('Continue')
     socket.join()
@@ -85,3 +140,111 @@ def test_eval_new_line(socket):
 
     socket.send('Continue')
     socket.join()
+
+
+@use('movement.py')
+def test_find(socket):
+    socket.start()
+    socket.assert_init()
+    socket.send('Next')
+    socket.assert_position(line=12)
+
+    socket.send('Find', 'nothing in l')
+    print_msg = socket.receive()
+    assert print_msg.command == 'Print'
+    assert print_msg.data.result == 'Not found'
+
+    socket.send('Find', 'x == 3 of {"a": [1, {"b": 3}]}')
+    print_msg = socket.receive()
+    assert print_msg.command == 'Print'
+    assert print_msg.data.result.startswith(
+        'Found:\n{&quot;a&quot;: [1, {&quot;b&quot;: 3}]}'
+        "['a'][1]['b']: -> <a href="
+    )
+
+    socket.send('Continue')
+    socket.join()
+
+
+@use('movement.py')
+def test_census(socket):
+    socket.start()
+    socket.assert_init()
+
+    socket.send('Census', 'count')
+    print_msg = socket.receive()
+    assert print_msg.command == 'Print'
+    assert print_msg.data['for'] == 'Census by count'
+    assert '<th>Deep size</th>' in print_msg.data.result
+    assert '>dict</a></td>' in print_msg.data.result
+    link = print_msg.data.result.split('<a href="census/')[-1].split('"')[0]
+
+    socket.send('Inspect', 'census/' + link)
+    print_msg = socket.receive()
+    assert print_msg.command == 'Print'
+    assert print_msg.data['for'] == 'Census by count from 50'
+
+    socket.send('Census', 'count nothing such')
+    echo_msg = socket.receive()
+    assert echo_msg.command == 'Echo'
+    assert 'Census error' in echo_msg.data['for']
+
+    socket.send('Continue')
+    socket.join()
+
+
+@use('movement.py')
+def test_referrers(socket):
+    socket.start()
+    socket.assert_init()
+    socket.send('Next')
+    socket.assert_position(line=12)
+
+    socket.send('Referrers', 'l')
+    print_msg = socket.receive()
+    assert print_msg.command == 'Print'
+    assert print_msg.data['for'] == 'Referrers of l'
+    assert print_msg.data.result.startswith('<a href="')
+    assert '>frame</a> local l → <a href="' in print_msg.data.result
+
+    socket.send('Continue')
+    socket.join()
+
+
+@use('movement.py')
+def test_allocations(socket):
+    socket.start()
+    socket.assert_init()
+
+    socket.send('Allocations', 'start')
+    print_msg = socket.receive()
+    assert print_msg.command == 'Print'
+    assert print_msg.data.result == 'Tracing allocations'
+
+    socket.send('Allocations', 'snapshot before')
+    assert socket.receive().data.result == 'Snapshot before taken'
+    socket.send('Eval', 'big = [str(i) * 100 for i in range(1000)]')
+    assert socket.receive().command == 'Print'
+    assert socket.receive().command == 'Watched'
+    socket.send('Allocations', 'snapshot')
+    assert socket.receive().data.result == 'Snapshot #1 taken'
+
+    socket.send('Allocations', 'diff before #1 3')
+    print_msg = socket.receive()
+    assert print_msg.command == 'Print'
+    assert print_msg.data['for'] == 'Allocations from before to #1 by lineno'
+    assert print_msg.data.result.count('<tr>') == 4
+    assert '<th>Diff</th>' in print_msg.data.result
+
+    socket.send('Allocations', 'top nothing')
+    echo_msg = socket.receive()
+    assert echo_msg.command == 'Echo'
+    assert echo_msg.data.val == 'No snapshot nothing'
+
+    socket.send('Allocations')
+    print_msg = socket.receive()
+    assert print_msg.data.result.startswith('Tracing, ')
+    assert print_msg.data.result.endswith('snapshots: before, #1')
+
+    socket.send('Continue')
+    socket.join()
@@ -0,0 +1,76 @@
+# *-* coding: utf-8 *-*
+import sys
+import threading
+
+from wdb.referrers import Retention, edge
+
+
+class Leak(object):
+    pass
+
+
+class Holder(object):
+    def __init__(self):
+        self.items = {'leak': [Leak()]}
+
+
+holder = Holder()
+
+
+def test_edge():
+    leak = Leak()
+    assert edge({'a': leak}, leak) == "['a']"
+    assert edge([1, leak], leak) == '[1]'
+    assert edge(Holder(), leak) == ''
+    assert edge(sys._getframe(), leak) == 'local leak'
+
+
+def test_module_path():
+    leak = holder.items['leak'][0]
+    retention = Retention(leak).find()
+    assert retention.stopped is None
+    paths = [
+        [(type(obj), edge) for obj, edge in path] for path in retention.paths
+    ]
+    assert [
+        (type(sys), '__dict__'),
+        (dict, "['holder']"),
+        (Holder, '.items'),
+        (dict, "['leak']"),
+        (list, '[0]'),
+        (Leak, ''),
+    ] in paths
+    # The frame of this test
+    assert [(type(sys._getframe()), 'local leak'), (Leak, '')] in paths
+
+
+def test_thread_path():
+    leak = Leak()
+    event = threading.Event()
+
+    def wait(leaked):
+        event.wait()
+
+    thread = threading.Thread(target=wait, args=(leak,))
+    thread.start()
+    del leak
+    try:
+        retention = Retention(thread._args[0]).find()
+    finally:
+        event.set()
+        thread.join()
+    edges = [[edge for obj, edge in path] for path in retention.paths]
+    assert ['local leaked', ''] in edges
+
+
+def test_unreachable():
+    retention = Retention(Leak()).find()
+    assert retention.paths == []
+    assert retention.visited == 0
+
+
+def test_bounded():
+    retention = Retention(holder.items['leak'][0])
+    retention.nodes = 2
+    retention.find()
+    assert retention.stopped == '2 referrers visited'
@@ -0,0 +1,81 @@
+# *-* coding: utf-8 *-*
+from wdb import render
+from wdb._compat import OrderedDict
+from wdb.handles import Handles
+from wdb.render import Renderer
+
+
+class FakeWdb(object):
+    def __init__(self):
+        self.handles = Handles()
+
+    def safe_repr(self, obj):
+        return repr(obj)
+
+
+def text(obj, **kwargs):
+    return Renderer(FakeWdb(), html=False, **kwargs).repr(obj)
+
+
+def test_render():
+    assert text([1, (2, 3)]) == '[1, (2, 3)]'
+    assert text({'b': 1, 'a': {2}}) == "{'a': {2}, 'b': 1}"
+    assert text(OrderedDict([('b', 1), ('a', 2)])) == (
+        "OrderedDict({'b': 1, 'a': 2})"
+    )
+    recursive = [1]
+    recursive.append(recursive)
+    assert text(recursive) == '[1, Recursion of [1, [...]]]'
+    # Siblings are not recursions
+    assert text([recursive[:1]] * 2) == '[[1], [1]]'
+
+
+def test_render_abbreviated():
+    assert text(list(range(200))) == (
+        '[%s, [185 more…], %s]'
+        % (
+            ', '.join(map(str, range(10))),
+            ', '.join(map(str, range(195, 200))),
+        )
+    )
+    rendered = text(dict((i, i) for i in reversed(range(200))))
+    lines = rendered.splitlines()
+    assert lines[1:11] == ['  %d: %d' % (i, i) for i in range(10)]
+    assert lines[11] == '  [185 more…]'
+    assert lines[12:17] == ['  %d: %d' % (i, i) for i in range(195, 200)]
+    assert len(text(list(range(200)), full=True).split(', ')) == 200
+
+
+def test_render_budget(monkeypatch):
+    monkeypatch.setattr(render, 'REPR_BUDGET', 20)
+    db = FakeWdb()
+    obj = [list(range(5))] * 5
+    rendered = Renderer(db, html=True).repr(obj)
+    assert rendered.count('more…') == 2
+    handle, offset, limit = map(
+        int, rendered.split('href="page/')[-1].split('"')[0].split('/')
+    )
+    assert db.handles.get(handle) is obj
+    assert (offset, limit) == (1, 4)
+    assert text(obj).endswith('[3 more…]]')
+
+
+def test_render_page(monkeypatch):
+    monkeypatch.setattr(render, 'PAGE_SIZE', 10)
+    db = FakeWdb()
+    obj = list(range(200))
+    rendered = Renderer(db).repr(obj)
+    handle = db.handles.add(obj)
+    assert '<a href="page/%d/10/185" class="inspect">' % handle in rendered
+
+    page = Renderer(db, html=False).page_repr(obj, 10, 185)
+    assert page == '[%s, [175 more…]]' % ', '.join(map(str, range(10, 20)))
+    page = Renderer(db).page_repr(obj, 20, 175)
+    assert '<a href="page/%d/30/165" class="inspect">' % handle in page
+
+    unordered = dict((i, i) for i in reversed(range(200)))
+    page = Renderer(db, html=False).page_repr(unordered, 10, 5)
+    assert page.splitlines()[1:6] == [
+        '  %d: %d' % (i, i) for i in range(10, 15)
+    ]
+    assert Renderer(db, html=False).page_repr({1, 2, 3}, 1, 2) == '{2, 3}'
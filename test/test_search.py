@@ -0,0 +1,74 @@
+# *-* coding: utf-8 *-*
+from wdb.search import Search, key_matcher, value_matcher
+
+
+class Node(object):
+    def __init__(self, value, child=None):
+        self.value = value
+        self.child = child
+
+    @property
+    def expensive(self):
+        raise AssertionError('Properties must not be run')
+
+
+def test_search_key():
+    obj = {'alpha': 1, 'beta': {'alphabet': [2, {'alpha': 3}]}}
+    matches = list(Search(key_matcher('alpha'), obj, 'obj'))
+    assert matches == [
+        ("obj['<mark>alpha</mark>']", 1),
+        ("obj['beta']['<mark>alpha</mark>bet']", [2, {'alpha': 3}]),
+        ("obj['beta']['alphabet'][1]['<mark>alpha</mark>']", 3),
+    ]
+
+
+def test_search_value():
+    obj = Node(1, Node(2, Node(3)))
+    search = Search(value_matcher('x == 3'), obj, 'obj')
+    assert list(search) == [('obj.child.child.value', 3)]
+    assert search.stopped is None
+
+
+def test_search_cycles():
+    a = Node(1)
+    b = Node(2, a)
+    a.child = b
+    matches = list(Search(value_matcher('x == 2'), [a, b], 'l'))
+    # b is walked once, from its shortest path
+    assert [path for path, value in matches] == ['l[1].value']
+
+
+def test_search_deep():
+    obj = node = Node(0)
+    for i in range(1, 10000):
+        node.child = Node(i)
+        node = node.child
+
+    search = Search(value_matcher('x == 9999'), obj, 'obj')
+    assert list(search) == []
+    assert search.stopped == 'depth 10 reached'
+
+    search = Search(value_matcher('x == 9999'), obj, 'obj')
+    search.depth = 20000
+    assert list(search) == [('obj' + '.child' * 9999 + '.value', 9999)]
+
+
+def test_search_budgets():
+    obj = {'key%d' % i: [i] for i in range(100)}
+    search = Search(key_matcher('key'), obj, 'obj')
+    search.results = 10
+    assert len(list(search)) == 10
+    assert search.stopped == '10 matches found'
+
+    search = Search(key_matcher('nope'), obj, 'obj')
+    search.nodes = 5
+    assert list(search) == []
+    assert search.stopped == '5 objects visited'
+
+
+def test_search_cancelled():
+    obj = [[i] for i in range(5000)]
+    search = Search(value_matcher('x == -1'), obj, 'obj', lambda: True)
+    assert list(search) == []
+    assert search.stopped == 'cancelled'
+    assert search.visited == 1000
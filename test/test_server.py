@@ -0,0 +1,146 @@
+# *-* coding: utf-8 *-*
+import asyncio
+import json
+import sys
+from struct import pack, unpack
+
+import pytest
+
+StreamClosedError = pytest.importorskip('tornado.iostream').StreamClosedError
+# The server parses the command line when imported
+argv, sys.argv = sys.argv, sys.argv[:1]
+try:
+    state = pytest.importorskip('wdb_server.state')
+    streams = pytest.importorskip('wdb_server.streams')
+finally:
+    sys.argv = argv
+
+UUID = '00000000-0000-0000-0000-000000000000'
+
+
+def breakpoint(lno, **options):
+    brk = {'fn': '/test.py', 'lno': lno, 'cond': None, 'fun': None}
+    brk.update(options)
+    return brk
+
+
+class Stream(object):
+    """Stream reading the given frames then closed"""
+
+    def __init__(self, *frames):
+        self.data = b''.join(
+            pack('!i', len(frame)) + frame for frame in frames
+        )
+        self.written = b''
+
+    async def read_bytes(self, length):
+        if not self.data:
+            raise StreamClosedError()
+        data, self.data = self.data[:length], self.data[length:]
+        return data
+
+    def write(self, data):
+        self.written += data
+
+    def frames(self):
+        """The (channel, data) written"""
+        frames, data = [], self.written
+        while data:
+            length, channel = unpack('!ii', data[:8])
+            frames.append((channel, data[8 : length + 4]))
+            data = data[length + 4 :]
+        return frames
+
+
+def test_breakpoints_snapshot():
+    breakpoints = state.Breakpoints()
+    breakpoints.add(breakpoint(1))
+    snapshot = breakpoints.snapshot()
+    assert snapshot == {
+        'epoch': breakpoints.epoch,
+        'version': 1,
+        'breakpoints': [breakpoint(1)],
+    }
+    known = {'epoch': breakpoints.epoch, 'version': 1}
+    assert breakpoints.snapshot(known) == known
+    # Old clients only send their version
+    assert 'breakpoints' in breakpoints.snapshot(1)
+    # Same version of a restarted server
+    restarted = state.Breakpoints()
+    restarted.add(breakpoint(2))
+    assert restarted.epoch != breakpoints.epoch
+    assert restarted.snapshot(known)['breakpoints'] == [breakpoint(2)]
+
+
+def test_breakpoints_delta():
+    breakpoints = state.Breakpoints()
+    stream = Stream()
+    state.sockets.add_process(stream)
+    try:
+        breakpoints.add(breakpoint(1))
+        breakpoints.add(breakpoint(1))
+        breakpoints.add(breakpoint(1, hit=2))
+        breakpoints.remove(breakpoint(1))
+        breakpoints.remove(breakpoint(1))
+    finally:
+        state.sockets.remove_process(stream)
+
+    deltas = []
+    for channel, data in stream.frames():
+        assert channel == 0
+        cmd, delta = data.decode('utf-8').split('|', 1)
+        assert cmd == 'BreaksDelta'
+        deltas.append(json.loads(delta))
+    epoch = breakpoints.epoch
+    assert deltas == [
+        {'epoch': epoch, 'version': 1, 'add': breakpoint(1)},
+        {'epoch': epoch, 'version': 2, 'add': breakpoint(1, hit=2)},
+        {'epoch': epoch, 'version': 3, 'remove': breakpoint(1, hit=2)},
+    ]
+    assert breakpoints.get() == []
+
+
+def test_breakpoints_delta_dedicated():
+    breakpoints = state.Breakpoints()
+    dedicated, process = Stream(), Stream()
+    channel = UUID.replace('0', '1')
+    state.sockets.add(UUID, dedicated)
+    state.sockets.add(channel, state.Channel(process, 1))
+    try:
+        breakpoints.add(breakpoint(1))
+    finally:
+        state.sockets.remove(UUID)
+        state.sockets.remove(channel)
+
+    length, = unpack('!i', dedicated.written[:4])
+    data = dedicated.written[4 : length + 4].decode('utf-8')
+    cmd, delta = data.split('|', 1)
+    assert cmd == 'BreaksDelta'
+    assert json.loads(delta) == {
+        'epoch': breakpoints.epoch,
+        'version': 1,
+        'add': breakpoint(1),
+    }
+    # Channels get it on their process channel
+    assert process.written == b''
+
+
+def test_multiplexed_read_loop():
+    known = json.dumps({'epoch': None, 'version': None}).encode('utf-8')
+    stream = Stream(
+        pack('!i', 1) + UUID.encode('utf-8'),
+        pack('!i', 1) + b'ServerBreaks|' + known,
+        pack('!i', 1),
+        pack('!i', 2) + UUID.replace('0', '2').encode('utf-8'),
+    )
+    asyncio.run(streams.multiplexed_read_loop(stream, 'test'))
+
+    (channel, snapshot), = stream.frames()
+    assert channel == 1
+    assert json.loads(snapshot.decode('utf-8')) == json.loads(
+        json.dumps(state.breakpoints.snapshot())
+    )
+    # Closed channels and stream
+    assert UUID not in state.sockets.uuids
+    assert UUID.replace('0', '2') not in state.sockets.uuids
+    assert stream not in state.sockets._processes
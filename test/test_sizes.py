@@ -0,0 +1,59 @@
+# *-* coding: utf-8 *-*
+import sys
+
+import pytest
+
+from wdb.sizes import DeepSize, deep_size
+
+
+class Slotted(object):
+    __slots__ = ('value',)
+
+
+class Holder(object):
+    def __init__(self, value):
+        self.value = value
+
+
+def test_deep_size():
+    data = [str(i) * 1000 for i in range(10)]
+    size = DeepSize(data).measure()
+    assert size.complete
+    assert size.objects == 11
+    assert size.size == sys.getsizeof(data) + sum(map(sys.getsizeof, data))
+
+
+def test_shared_counted_once():
+    value = 'x' * 1000
+    shared = DeepSize([value] * 10).measure()
+    assert shared.objects == 2
+
+    holder = Holder({'a': value, 'b': value})
+    assert DeepSize(holder).measure().size > 1000
+    assert DeepSize(holder).measure().size < 2000
+
+
+def test_slots_and_buffers():
+    slotted = Slotted()
+    slotted.value = 'x' * 1000
+    assert DeepSize(slotted).measure().size > 1000
+
+    view = memoryview(b'x' * 10000)
+    assert DeepSize(view).measure().size > 10000
+
+
+def test_budget():
+    size = DeepSize(list(range(1000)), nodes=10).measure()
+    assert not size.complete
+    assert str(size).startswith('≥ ')
+    assert deep_size(None) == '%d B' % sys.getsizeof(None)
+
+
+def test_numpy():
+    numpy = pytest.importorskip('numpy')
+    array = numpy.zeros(10**6)
+    assert DeepSize(array).measure().size >= array.nbytes
+    # Views count the data of their base once
+    size = DeepSize([array, array[::2], array[1:]]).measure()
+    assert array.nbytes <= size.size < 2 * array.nbytes
+    assert size.objects < 10
@@ -0,0 +1,49 @@
+# *-* coding: utf-8 *-*
+import linecache
+import traceback
+
+from wdb import sources
+from wdb.sources import CompileCache
+
+
+def test_compile_cache():
+    cache = CompileCache()
+    code = cache.compile('a = 1\nb = a + 1')
+    other = cache.compile('a = 1\nb = a + 1')
+    assert code.co_filename != other.co_filename
+    assert cache.get(code) == 'a = 1\nb = a + 1'
+    assert linecache.getline(code.co_filename, 2) == 'b = a + 1\n'
+    linecache.checkcache()
+    assert linecache.getline(code.co_filename, 1) == 'a = 1\n'
+
+
+def test_compile_cache_traceback():
+    cache = CompileCache()
+    code = cache.compile('def f():\n    1 / 0\nf()', '<wdb>')
+    try:
+        exec(code, {})
+    except ZeroDivisionError:
+        formatted = traceback.format_exc()
+    assert '<wdb-' in formatted
+    assert '1 / 0' in formatted
+
+
+def test_compile_cache_eviction(monkeypatch):
+    monkeypatch.setattr(sources, 'COMPILE_CACHE_SIZE', 2)
+    cache = CompileCache()
+    codes = [cache.compile('%d' % i, mode='eval') for i in range(3)]
+    assert len(cache) == 2
+    assert cache.get(codes[0]) is None
+    assert codes[0].co_filename not in linecache.cache
+    assert cache.get(codes[2]) == '2'
+
+
+def test_compile_cache_trace():
+    from wdb import Wdb
+
+    code = sources.compile_cache.compile('import sys\nf = sys._getframe()')
+    scope = {}
+    exec(code, scope)
+    _, frames, _ = Wdb.get_trace(Wdb.__new__(Wdb), scope['f'], None)
+    assert frames[-1]['file'] == code.co_filename
+    assert frames[-1]['code'] == 'f = sys._getframe()'
@@ -0,0 +1,59 @@
+# *-* coding: utf-8 *-*
+import pytest
+
+from wdb import summaries
+from wdb.summaries import get_renderer, summarize, summary
+
+
+class Tensor(object):
+    def __repr__(self):
+        raise AssertionError('repr called')
+
+
+class SubTensor(Tensor):
+    pass
+
+
+class EntryPoint(object):
+    name = '%s.Tensor' % __name__
+
+    def load(self):
+        return lambda obj, budget: 'Tensor summary'
+
+
+def test_summaries(monkeypatch):
+    monkeypatch.setattr(summaries, 'summaries', {})
+    monkeypatch.setattr(summaries, '_entry_points', {})
+    assert summarize(Tensor()) is None
+
+    summary('%s.Tensor' % __name__)(lambda obj, budget: 'x' * 5000)
+    assert summarize(SubTensor()) == 'x' * summaries.SUMMARY_SIZE + '…'
+    summary('%s.SubTensor' % __name__)(lambda obj, budget: 1 / 0)
+    # Failing renderers fall back to repr
+    assert summarize(SubTensor()) is None
+    assert get_renderer(int) is None
+
+
+def test_summaries_entry_point(monkeypatch):
+    monkeypatch.setattr(summaries, 'summaries', {})
+    monkeypatch.setattr(
+        summaries, '_entry_points', {EntryPoint.name: EntryPoint()}
+    )
+    summaries._renderers.clear()
+    assert summarize(SubTensor()) == 'Tensor summary'
+
+
+def test_summaries_numpy():
+    numpy = pytest.importorskip('numpy')
+    assert summarize(numpy.arange(10).reshape(2, 5)) == (
+        'ndarray(shape=(2, 5), dtype=int64, min=0, max=9, mean=4.5)'
+    )
+    assert 'sampled' in summarize(numpy.zeros(summaries.SUMMARY_ITEMS + 1))
+
+
+def test_summaries_pandas():
+    pandas = pytest.importorskip('pandas')
+    frame = pandas.DataFrame({'a': range(100), 'b': ['x'] * 100})
+    text = summarize(frame)
+    assert text.startswith('DataFrame 100 rows × 2 columns\na: int64')
+    assert '99' in text and '50' not in text
@@ -0,0 +1,130 @@
+# *-* coding: utf-8 *-*
+import json
+import os
+import sys
+import time
+
+from wdb import symbols
+from wdb.symbols import BUILTINS, ImportIndex
+
+
+class FakeSymbolIndex(object):
+    indexed = []
+
+    def __init__(self, modules=None):
+        self.modules = modules or []
+
+    def build_index(self, paths):
+        FakeSymbolIndex.indexed.append(BUILTINS)
+        self.modules.append('sys')
+
+    def index_path(self, path):
+        FakeSymbolIndex.indexed.append(os.path.dirname(path))
+        self.modules.append(os.path.basename(path))
+
+    def serialize(self, fd):
+        json.dump(self.modules, fd)
+
+    @classmethod
+    def deserialize(cls, file):
+        return cls(json.load(file))
+
+    def symbol_scores(self, name):
+        return [(1.0, module, None) for module in self.modules] + [
+            (0.5, module, name) for module in self.modules
+        ]
+
+
+class FakeImportmagic(object):
+    SymbolIndex = FakeSymbolIndex
+
+
+def wait_index(index):
+    for i in range(100):
+        if index.complete:
+            return
+        time.sleep(0.01)
+
+
+def wait_loaded(index):
+    for i in range(100):
+        if index.index is not None:
+            return
+        time.sleep(0.01)
+
+
+def fake_env(monkeypatch, tmpdir):
+    monkeypatch.setattr(symbols, 'importmagic', FakeImportmagic)
+    monkeypatch.setattr(symbols, 'SYMBOLS_CACHE', str(tmpdir.join('cache')))
+    paths = []
+    for name in ('lib', 'site'):
+        path = tmpdir.mkdir(name)
+        path.join('%s_module.py' % name).write('')
+        paths.append(str(path))
+    monkeypatch.setattr(sys, 'path', paths)
+    FakeSymbolIndex.indexed = []
+    return paths
+
+
+def test_import_index(monkeypatch, tmpdir):
+    fake_env(monkeypatch, tmpdir)
+    index = ImportIndex()
+    assert index.suggest('path') is None
+    wait_index(index)
+    assert index.suggest('path') == [
+        'import sys',
+        'import lib_module.py',
+        'import site_module.py',
+        'from sys import path',
+        'from lib_module.py import path',
+        'from site_module.py import path',
+    ]
+
+
+def test_import_index_cache(monkeypatch, tmpdir):
+    lib, site = fake_env(monkeypatch, tmpdir)
+    index = ImportIndex()
+    index.get()
+    wait_index(index)
+    assert sorted(FakeSymbolIndex.indexed) == sorted([BUILTINS, lib, site])
+
+    FakeSymbolIndex.indexed = []
+    index = ImportIndex()
+    index.preload()
+    wait_loaded(index)
+    assert FakeSymbolIndex.indexed == []
+    assert len(index.index.indexes) == 3
+
+    os.utime(site, (0, 0))
+    index = ImportIndex()
+    # Only the saved indexes are loaded before the first get
+    index.preload()
+    wait_loaded(index)
+    time.sleep(0.05)
+    assert FakeSymbolIndex.indexed == []
+    assert len(index.index.indexes) == 2
+    assert not index.complete
+    index.get()
+    wait_index(index)
+    assert FakeSymbolIndex.indexed == [site]
+    assert len(index.index.indexes) == 3
+
+
+def test_import_index_after_fork(monkeypatch, tmpdir):
+    fake_env(monkeypatch, tmpdir)
+    index = ImportIndex()
+    # Fork during the build
+    index.builder = -1
+    index.after_fork()
+    assert index.builder is None
+    index.get()
+    wait_index(index)
+    built = index.index
+    assert built is not None
+    index.after_fork()
+    assert index.index is built
+
+
+def test_import_index_without_importmagic(monkeypatch):
+    monkeypatch.setattr(symbols, 'importmagic', None)
+    assert ImportIndex().suggest('path') is None
@@ -0,0 +1,96 @@
+# *-* coding: utf-8 *-*
+import threading
+import time
+
+import pytest
+
+from wdb.timebox import EvaluationTimeout, set_async_exc, time_box
+
+pytestmark = pytest.mark.skipif(
+    set_async_exc is None, reason='Needs PyThreadState_SetAsyncExc'
+)
+
+
+def spin(seconds):
+    end = time.time() + seconds
+    while time.time() < end:
+        pass
+
+
+def test_time_box():
+    start = time.time()
+    with pytest.raises(EvaluationTimeout):
+        with time_box(0.1):
+            spin(5)
+    assert time.time() - start < 1
+
+    with time_box(0.1):
+        spin(0.01)
+    # Nothing raised after the block
+    spin(0.2)
+
+
+def test_time_box_nested():
+    with pytest.raises(EvaluationTimeout):
+        with time_box(0.1) as outer:
+            with time_box(5) as inner:
+                spin(5)
+    assert outer.expired
+    assert not inner.expired
+
+    with time_box(5) as outer:
+        with pytest.raises(EvaluationTimeout):
+            with time_box(0.1) as inner:
+                spin(5)
+        spin(0.01)
+    assert inner.expired
+    assert not outer.expired
+
+
+def test_time_box_nested_caught():
+    with pytest.raises(EvaluationTimeout):
+        with time_box(0.1) as outer:
+            with time_box(5) as inner:
+                try:
+                    spin(5)
+                except EvaluationTimeout:
+                    pass
+            spin(5)
+    assert outer.expired
+    assert not inner.expired
+
+    with time_box(5):
+        with time_box(0.1) as inner:
+            try:
+                spin(5)
+            except EvaluationTimeout:
+                pass
+        start = time.time()
+        with time_box(5):
+            spin(0.01)
+        # The next box doesn't wait for the caught timeout
+        assert time.time() - start < 0.05
+    assert inner.expired
+
+
+def test_time_box_threads():
+    results = {}
+
+    def evaluate(name, seconds):
+        try:
+            with time_box(0.2):
+                spin(seconds)
+        except EvaluationTimeout:
+            results[name] = 'timeout'
+        else:
+            results[name] = 'done'
+
+    threads = [
+        threading.Thread(target=evaluate, args=('slow', 5)),
+        threading.Thread(target=evaluate, args=('fast', 0.05)),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == {'slow': 'timeout', 'fast': 'done'}
@@ -1,4 +1,13 @@
 # *-* coding: utf-8 *-*
+import json
+import sys
+import weakref
+from threading import Event, Thread
+
+from wdb import Wdb
+from wdb.breakpoint import LineBreakpoint
+from wdb.state import Running
+
 from .conftest import use
 
 
@@ -292,3 +301,113 @@ def test_with_error_in_trace_below_under(socket):
     socket.send('Continue')
 
     socket.join()
+
+
+def test_untraced_frames_are_not_kept():
+    wdb = object.__new__(Wdb)
+    Wdb.__init__(wdb)
+    locals_ = []
+
+    class Local(object):
+        pass
+
+    def leaf():
+        local = Local()
+        locals_.append(weakref.ref(local))
+        assert wdb.trace_dispatch(sys._getframe(), 'call', None) is None
+
+    def app():
+        frame = sys._getframe()
+        assert wdb.trace_dispatch(frame, 'call', None)
+        for i in range(20):
+            leaf()
+        assert list(wdb.frame_depths) == [frame]
+
+    wdb.under = app
+    wdb.under_code = app.__code__
+    app()
+    assert all(ref() is None for ref in locals_)
+
+
+class Multiplexer(object):
+    synced = True
+
+
+def test_pushed_breaks_enable_running_frames_lines(monkeypatch):
+    # Line events are per frame with the settrace backend
+    monkeypatch.setattr('wdb.WDB_MONITORING', False)
+    started, stop = Event(), Event()
+    frames = []
+
+    def run():
+        wdb = Wdb.get()
+        wdb.monitor = None
+        wdb.state = Running(None)
+        frame = sys._getframe()
+        frame.f_trace = wdb.trace_dispatch
+        wdb.update_trace_lines(frame)
+        frames.append((wdb, frame))
+        started.set()
+        stop.wait(10)
+
+    thread = Thread(target=run)
+    thread.start()
+    started.wait(10)
+    wdb, frame = frames[0]
+    breakpoint = LineBreakpoint(__file__, 1)
+    try:
+        assert frame.f_trace_lines is False
+        Wdb.on_push(
+            Multiplexer(),
+            'BreaksDelta|%s'
+            % json.dumps({'version': 1, 'add': breakpoint.to_dict()}),
+        )
+        assert frame.f_trace_lines is True
+    finally:
+        Wdb.breakpoints.discard(breakpoint)
+        stop.set()
+        thread.join()
+        Wdb._instances.pop((wdb.pid, wdb.thread))
+
+
+def test_monitored_frames_are_not_traced():
+    wdb = object.__new__(Wdb)
+    Wdb.__init__(wdb)
+    updates = []
+
+    class Monitor(object):
+        def update(self):
+            updates.append(True)
+
+    wdb.monitor = Monitor()
+
+    def callee():
+        frame = sys._getframe()
+        wdb.state = Running(frame)
+        wdb.trace_dispatch(frame, 'return', None)
+
+    def caller():
+        callee()
+        return sys._getframe().f_trace
+
+    assert caller() is None
+    assert updates == [True]
+
+
+def test_set_break_enables_running_frame_lines():
+    wdb = object.__new__(Wdb)
+    Wdb.__init__(wdb)
+    wdb.monitor = None
+    wdb.state = Running(None)
+    frame = sys._getframe()
+    frame.f_trace = wdb.trace_dispatch
+    try:
+        wdb.update_trace_lines(frame)
+        assert frame.f_trace_lines is False
+        line = frame.f_lineno + 1
+        wdb.set_break(__file__, line)
+        assert frame.f_trace_lines is True
+        wdb.clear_break(__file__, line)
+        assert frame.f_trace_lines is False
+    finally:
+        del frame.f_trace
@@ -244,3 +244,118 @@ def test_complicated():
     m(1, 2, 3, 4, 5, h=10, i=11, j=12)
 '''
     )
+
+
+def test_peek_attribute():
+    from wdb.utils import LAZY, peek_attribute
+
+    class Model(object):
+        column = 1
+
+        def method(self):
+            pass
+
+        @property
+        def query(self):
+            raise AssertionError('Property evaluated')
+
+        def __getattr__(self, key):
+            if key == 'dynamic':
+                raise AssertionError('Dynamic attribute evaluated')
+            raise AttributeError(key)
+
+    model = Model()
+    model.field = 'value'
+    assert peek_attribute(model, 'field') == ('str', 'value')
+    assert peek_attribute(model, 'column') == ('int', 1)
+    assert peek_attribute(model, 'method')[0] == 'method'
+    assert peek_attribute(model, 'query') == ('property', LAZY)
+    assert peek_attribute(model, 'dynamic') == ('?', LAZY)
+
+
+def test_memoized_source():
+    from wdb import utils
+
+    calls = []
+
+    @utils.memoized
+    def source(obj):
+        calls.append(obj)
+        return utils.get_source(obj)
+
+    def function():
+        return 42
+
+    assert 'return 42' in source(function)
+    assert 'return 42' in source(function.__code__)
+    assert source(utils) == source(utils)
+    assert calls == [function, function.__code__, utils]
+
+
+def test_memoized_wrapped():
+    from functools import wraps
+
+    from wdb.utils import get_doc, get_source
+
+    def decorator(fun):
+        @wraps(fun)
+        def wrapper(*args):
+            return fun(*args)
+
+        return wrapper
+
+    @decorator
+    def alpha():
+        """Alpha doc"""
+
+    @decorator
+    def beta():
+        """Beta doc"""
+
+    assert alpha.__code__ is beta.__code__
+    assert get_doc(alpha) == 'Alpha doc'
+    assert get_doc(beta) == 'Beta doc'
+    assert 'def alpha' in get_source(alpha)
+    assert 'def beta' in get_source(beta)
+
+
+def test_memoized_modified(tmpdir, monkeypatch):
+    import importlib
+
+    from wdb.utils import get_source
+
+    module = tmpdir.join('memoized_module.py')
+    module.write('def function():\n    """Old"""\n    return 1\n')
+    monkeypatch.syspath_prepend(str(tmpdir))
+    memoized_module = importlib.import_module('memoized_module')
+    function = memoized_module.function
+    assert 'return 1' in get_source(function)
+
+    module.write('def function():\n    """New"""\n    return 2\n')
+    module.setmtime(module.mtime() + 10)
+    assert 'return 2' in get_source(function)
+    assert 'return 2' in get_source(memoized_module)
+
+
+def test_type_name():
+    from wdb.utils import type_name
+
+    class Local(object):
+        pass
+
+    assert type_name(dict) == 'dict'
+    assert type_name(Local) == '%s.test_type_name.<locals>.Local' % __name__
+
+
+def test_human_size():
+    from wdb.utils import human_size
+
+    assert human_size(12) == '12 B'
+    assert human_size(3 * 1024 * 1024) == '3.0 MB'
+
+
+def test_get_referents():
+    from wdb.utils import get_referents
+
+    assert get_referents(sys) == [sys.__dict__]
+    assert get_referents([sys]) == [sys]